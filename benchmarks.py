@@ -0,0 +1,449 @@
+"""
+Benchmarks Module.
+This module times the pipeline. It holds three benchmarks:
+- The vectorized extraction steps against the row-by-row implementations they replaced, on frames
+      built by resampling the scraped descriptions in `freelance_accounts.csv`.
+- A suite that runs every `RawDataProcessor` stage, every `DataCleanerAndTransformer` step and the
+      `imputation_methods` functions on synthetic CSVs of 100k, 1M and 10M rows (see `synthetic_data`),
+      records time, throughput and peak memory, and compares them to a stored baseline.
+- A comparison of the imputation strategies that scores how well each reconstructs hidden known
+      values against its time and peak memory.
+
+Functions:
+- legacy_get_orders_done: The original `iterrows` implementation of `RawDataProcessor.get_orders_done`.
+- benchmark_orders_done: Times the legacy loop against `extract_orders_done` and checks both agree.
+- benchmark_pipeline: Measures every pipeline stage and imputation function on one synthetic CSV.
+- compare_to_baseline: Lists the measurements that regressed against a stored baseline.
+- run_benchmark_suite: Runs `benchmark_pipeline` at several sizes and checks or updates the baseline.
+- compare_imputation_strategies: Hides known values of a cleaned frame, runs every imputation function
+      in a process pool and ranks them by reconstruction error, time and peak memory per column.
+- choose_imputation_strategy: Picks the fastest strategy under an error ceiling for a column.
+
+Usage:
+      python benchmarks.py --rows 1000000
+      python benchmarks.py --suite --sizes 100000 1000000 10000000 [--update-baseline]
+      python benchmarks.py --imputation --rows 1000000 [--missing-fraction 0.1] [--workers 4]
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import imputation_methods
+from data_cleaning_and_transformation import DataCleanerAndTransformer
+from data_ingestion import load_csv_file
+from parameter_dictionary import ConfigParameters
+from pipeline_profiling import PipelineProfiler
+from synthetic_data import write_synthetic_csv
+from vectorized_extractors import extract_orders_done
+
+logger = logging.getLogger('benchmarks')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s : %(name)s - %(levelname)s - %(message)s')
+
+SUITE_SIZES = (100_000, 1_000_000, 10_000_000)
+IMPUTED_COLUMNS = ['orders_done', 'rating', 'price']
+# Imputation functions benchmarked on the cleaned frame with values masked in every column of
+# IMPUTED_COLUMNS: name -> (function, keyword arguments, row cap). Row caps keep the quadratic k-NN
+# search and MICE tractable; they run on the first rows of the frame.
+IMPUTATION_CASES = {
+      'drop_missing_values': (imputation_methods.drop_missing_values, {}, None),
+      'impute_mean': (imputation_methods.impute_mean, {'cols': IMPUTED_COLUMNS}, None),
+      'impute_median': (imputation_methods.impute_median, {'cols': IMPUTED_COLUMNS}, None),
+      'impute_mode': (imputation_methods.impute_mode, {'cols': IMPUTED_COLUMNS}, None),
+      'impute_knn': (imputation_methods.impute_knn, {'cols': IMPUTED_COLUMNS, 'engine': 'blocked'}, 20_000),
+      'impute_with_regression': (imputation_methods.impute_with_regression,
+                                 {'target_col': IMPUTED_COLUMNS, 'feature_cols': IMPUTED_COLUMNS, 'cache': False}, None),
+      'impute_mice': (imputation_methods.impute_mice, {'cols': IMPUTED_COLUMNS}, 1_000_000),
+      'impute_interpolation': (imputation_methods.impute_interpolation, {'cols': IMPUTED_COLUMNS}, None),
+      'impute_backward_fill': (imputation_methods.impute_backward_fill, {'cols': IMPUTED_COLUMNS}, None),
+      'impute_forward_fill': (imputation_methods.impute_forward_fill, {'cols': IMPUTED_COLUMNS}, None),
+}
+
+
+def sample_descriptions(parameter_dict, n_rows, seed=0):
+      """
+      Build a description column of `n_rows` rows by resampling the scraped data.
+
+      Args:
+            parameter_dict (ConfigParameters): Supplies 'CSV_URL' and 'columns_to_rename'.
+            n_rows (int): Number of rows to generate.
+            seed (int): Seed for the random resampling.
+
+      Returns:
+            pd.DataFrame: A frame with a single 'description' column.
+      """
+      df = load_csv_file(parameter_dict['CSV_URL']).rename(columns=parameter_dict['columns_to_rename']).dropna()
+      rng = np.random.default_rng(seed)
+      picks = rng.integers(0, len(df), size=n_rows)
+      return pd.DataFrame({'description': df['description'].to_numpy()[picks]})
+
+
+def legacy_get_orders_done(df, order_patterns):
+      """
+      The original row-by-row order extraction, kept as the reference for the benchmark.
+
+      Args:
+            df (pd.DataFrame): Frame with a 'description' column. Modified in place.
+            order_patterns (dict): Mapping of key -> (pattern, flags).
+
+      Returns:
+            pd.DataFrame: The frame with a float 'orders_done' column.
+      """
+      df['orders_done'] = np.nan
+      for idx, row in df.iterrows():
+            cell = row['description']
+            for key, (pattern, flags) in order_patterns.items():
+                  match = re.search(pattern, cell, flags=flags)
+                  if match:
+                        if key == 'zero_orders':
+                              df.at[idx, 'orders_done'] = 0
+                        else:
+                              value = match.group(1).replace('k', '00').replace('K', '00').replace('+', '')
+                              try:
+                                    df.at[idx, 'orders_done'] = int(value)
+                              except ValueError:
+                                    df.at[idx, 'orders_done'] = np.nan
+                        break
+      return df
+
+
+def benchmark_orders_done(n_rows=1_000_000, parameter_dict=None):
+      """
+      Time the legacy loop against `extract_orders_done` and check that both give the same counts.
+
+      Args:
+            n_rows (int): Number of rows to benchmark on (default is 1,000,000).
+            parameter_dict (ConfigParameters, optional): Configuration; a fresh `ConfigParameters` by default.
+
+      Returns:
+            dict: Row count, the two timings in seconds and the speed-up.
+
+      Raises:
+            AssertionError: If the two implementations disagree.
+      """
+      parameter_dict = parameter_dict or ConfigParameters()
+      order_patterns = parameter_dict['order_patterns']
+      df = sample_descriptions(parameter_dict, n_rows)
+
+      start = time.perf_counter()
+      vectorized = extract_orders_done(df['description'], order_patterns)
+      vectorized_seconds = time.perf_counter() - start
+
+      start = time.perf_counter()
+      legacy = legacy_get_orders_done(df.copy(), order_patterns)['orders_done']
+      legacy_seconds = time.perf_counter() - start
+
+      pd.testing.assert_series_equal(vectorized.astype('float64'), legacy, check_names=False)
+      result = {
+            'rows': n_rows,
+            'legacy_seconds': legacy_seconds,
+            'vectorized_seconds': vectorized_seconds,
+            'speedup': legacy_seconds / vectorized_seconds,
+      }
+      logger.info(f"orders_done on {n_rows:,} rows: legacy {legacy_seconds:.2f}s, "
+                  f"vectorized {vectorized_seconds:.2f}s ({result['speedup']:.1f}x)")
+      return result
+
+
+def _masked_inputs(cleaned, missing_fraction, seed):
+      """
+      Build the imputation input from a cleaned frame by hiding a fraction of its values.
+
+      Only values that are known are hidden; cells that were already missing stay missing.
+
+      Returns:
+            tuple: (pd.DataFrame, pd.DataFrame) the known values and the masked copy, both with float
+                  columns IMPUTED_COLUMNS and a fresh RangeIndex.
+      """
+      rng = np.random.default_rng(seed)
+      known = cleaned[IMPUTED_COLUMNS].astype('float64').reset_index(drop=True)
+      return known, known.mask(rng.random(known.shape) < missing_fraction)
+
+
+def benchmark_pipeline(csv_path, fused=False, missing_fraction=0.1, trace_memory=True, seed=0):
+      """
+      Measure every pipeline stage and every imputation function on one CSV.
+
+      The raw processing stages and the cleaning steps are measured by the pipeline's own
+      `PipelineProfiler`; the imputation functions are measured the same way on copies of the cleaned
+      frame in which `missing_fraction` of the values are hidden.
+
+      Args:
+            csv_path (str): CSV in the layout of `freelance_accounts.csv`.
+            fused (bool): Use the fused extraction stage (default is False).
+            missing_fraction (float): Fraction of values hidden for the imputation functions (default is 0.1).
+            trace_memory (bool): Record peak memory (default is True). Tracing slows Python-heavy
+                  stages, so switch it off for pure timing runs; baselines compare like with like.
+            seed (int): Seed for the hidden values (default is 0).
+
+      Returns:
+            list: One dictionary per stage with 'stage', 'seconds', 'rows', 'rows_per_second' and
+                  'peak_memory_bytes'.
+      """
+      cleaner = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False, profile=True, fused=fused)
+      cleaner.profiler.trace_memory = trace_memory
+      cleaner.rd_processor.csv_path = csv_path
+      cleaner.df = cleaner.rd_processor.process()
+      cleaner.clean_and_transform()
+      stages = cleaner.profiling_report().stages
+
+      _, masked = _masked_inputs(cleaner.df, missing_fraction, seed)
+      profiler = PipelineProfiler(trace_memory=trace_memory)
+      for name, (func, kwargs, row_cap) in IMPUTATION_CASES.items():
+            holder = SimpleNamespace(df=masked.iloc[:row_cap].copy())
+            with profiler.stage(f'imputation_methods.{name}', holder):
+                  holder.df = func(holder.df, **kwargs)
+      stages = stages + profiler.records
+
+      results = []
+      for stage in stages:
+            rows = stage['rows_in'] if stage['rows_in'] is not None else stage['rows_out']
+            results.append({
+                  'stage': stage['stage'],
+                  'seconds': stage['wall_seconds'],
+                  'rows': rows,
+                  'rows_per_second': rows / stage['wall_seconds'] if stage['wall_seconds'] > 0 else None,
+                  'peak_memory_bytes': stage['peak_memory_delta_bytes'],
+            })
+      return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, min_seconds=0.05, min_bytes=1 << 20):
+      """
+      List the measurements that are slower or use more memory than the baseline.
+
+      A measurement regresses when it exceeds the baseline by more than `tolerance` (relative) and by
+      more than `min_seconds` or `min_bytes` (absolute), so that timer noise on fast stages is not
+      reported.
+
+      Args:
+            results (dict): Measurements by size, as returned by `run_benchmark_suite`.
+            baseline (dict): Stored measurements in the same layout.
+            tolerance (float): Allowed relative increase (default is 0.25).
+            min_seconds (float): Smallest time increase reported (default is 0.05).
+            min_bytes (int): Smallest memory increase reported (default is 1 MiB).
+
+      Returns:
+            list: One dictionary per regression with 'size', 'stage', 'metric', 'baseline' and 'current'.
+      """
+      regressions = []
+      for size, stages in results.items():
+            stored = {stage['stage']: stage for stage in baseline.get(size, [])}
+            for stage in stages:
+                  reference = stored.get(stage['stage'])
+                  if reference is None:
+                        continue
+                  for metric, floor in (('seconds', min_seconds), ('peak_memory_bytes', min_bytes)):
+                        current, previous = stage[metric], reference.get(metric)
+                        if current is None or previous is None:
+                              continue
+                        if current > previous * (1 + tolerance) and current - previous > floor:
+                              regressions.append({'size': size, 'stage': stage['stage'], 'metric': metric,
+                                                  'baseline': previous, 'current': current})
+      return regressions
+
+
+def run_benchmark_suite(sizes=SUITE_SIZES, workdir='benchmark_data', baseline_path='benchmark_baseline.json',
+                        update_baseline=False, tolerance=0.25, fused=False, trace_memory=True, **generator_kwargs):
+      """
+      Benchmark the pipeline on synthetic CSVs of each size and compare against the stored baseline.
+
+      The synthetic CSVs are generated once into `workdir` and reused by later runs. When no baseline
+      exists yet, or `update_baseline` is set, the results become the new baseline.
+
+      Args:
+            sizes (tuple): Row counts to benchmark (default is 100k, 1M and 10M).
+            workdir (str): Directory for the synthetic CSVs (default is 'benchmark_data').
+            baseline_path (str): JSON file holding the baseline (default is 'benchmark_baseline.json').
+            update_baseline (bool): Overwrite the baseline with these results (default is False).
+            tolerance (float): Allowed relative increase before a regression is reported (default is 0.25).
+            fused (bool): Use the fused extraction stage (default is False).
+            trace_memory (bool): Record peak memory (default is True).
+            **generator_kwargs: Passed to `generate_accounts` (duplicate_ratio, noise, missing, seed).
+
+      Returns:
+            tuple: (dict, list) the results keyed by size (as a string, as stored in JSON) and the regressions.
+      """
+      os.makedirs(workdir, exist_ok=True)
+      suffix = '-'.join(f'{key}{value}' for key, value in sorted(generator_kwargs.items()))
+      results = {}
+      for size in sizes:
+            csv_path = os.path.join(workdir, f'synthetic_{size}{"-" + suffix if suffix else ""}.csv')
+            if not os.path.exists(csv_path):
+                  write_synthetic_csv(csv_path, size, **generator_kwargs)
+            results[str(size)] = benchmark_pipeline(csv_path, fused=fused, trace_memory=trace_memory)
+            for stage in results[str(size)]:
+                  peak = stage['peak_memory_bytes']
+                  logger.info(f"{size:>11,} rows  {stage['stage']:<50} {stage['seconds']:9.3f}s "
+                              f"{(stage['rows_per_second'] or 0):>13,.0f} rows/s "
+                              f"{'' if peak is None else f'{peak / 2**20:9.1f} MiB peak'}")
+
+      regressions = []
+      if os.path.exists(baseline_path) and not update_baseline:
+            with open(baseline_path) as f:
+                  regressions = compare_to_baseline(results, json.load(f), tolerance)
+            for regression in regressions:
+                  logger.warning(f"Regression at {regression['size']} rows in {regression['stage']}: "
+                                 f"{regression['metric']} {regression['baseline']:.4g} -> {regression['current']:.4g}")
+            logger.info(f'{len(regressions)} Regressions Against {baseline_path}')
+      else:
+            baseline = {}
+            if os.path.exists(baseline_path):
+                  with open(baseline_path) as f:
+                        baseline = json.load(f)
+            baseline.update(results)
+            with open(baseline_path, 'w') as f:
+                  json.dump(baseline, f, indent=2)
+            logger.info(f'Stored Baseline in {baseline_path}')
+      return results, regressions
+
+
+def _evaluate_imputation(task):
+      """
+      Run one imputation strategy on a masked frame and score it against the hidden values.
+
+      Runs in a worker process of `compare_imputation_strategies`.
+
+      Args:
+            task (tuple): (name, known, masked, trace_memory) the `IMPUTATION_CASES` key, the known
+                  values, the masked copy and whether to record peak memory.
+
+      Returns:
+            list: One dictionary per column of IMPUTED_COLUMNS (see `compare_imputation_strategies`).
+      """
+      name, known, masked, trace_memory = task
+      func, kwargs, _ = IMPUTATION_CASES[name]
+      profiler = PipelineProfiler(trace_memory=trace_memory)
+      holder = SimpleNamespace(df=masked.copy())
+      with profiler.stage(name, holder):
+            holder.df = func(holder.df, **kwargs)
+      record = profiler.records[0]
+      # Rows a strategy dropped count as not filled.
+      imputed = holder.df.reindex(masked.index)
+      rows = []
+      for column in IMPUTED_COLUMNS:
+            hidden = (masked[column].isna() & known[column].notna()).to_numpy()
+            filled = hidden & imputed[column].notna().to_numpy()
+            errors = (imputed[column].to_numpy(dtype=float) - known[column].to_numpy())[filled]
+            rmse = float(np.sqrt(np.mean(errors ** 2))) if errors.size else np.nan
+            spread = known[column].std()
+            rows.append({
+                  'strategy': name,
+                  'column': column,
+                  'rows': len(masked),
+                  'hidden': int(hidden.sum()),
+                  'coverage': filled.sum() / hidden.sum() if hidden.any() else np.nan,
+                  'mae': float(np.mean(np.abs(errors))) if errors.size else np.nan,
+                  'rmse': rmse,
+                  'normalized_rmse': rmse / spread if spread > 0 else np.nan,
+                  'seconds': record['wall_seconds'],
+                  'peak_memory_bytes': record['peak_memory_delta_bytes'],
+            })
+      return rows
+
+
+def compare_imputation_strategies(cleaned, missing_fraction=0.1, strategies=None, workers=None, trace_memory=True, seed=0):
+      """
+      Rank the imputation strategies by how well they reconstruct known values, and at what cost.
+
+      A fraction of the known values of IMPUTED_COLUMNS in a cleaned frame is hidden, every strategy
+      imputes its own copy in a pool of worker processes, and the imputed values are compared with
+      the hidden ones. Strategies with a row cap in `IMPUTATION_CASES` run on the first rows only.
+
+      Strategies run concurrently and share the CPUs, so their wall times include contention; use
+      `workers=1` for timings comparable with `benchmark_pipeline`. Peak memory is traced per process
+      and is not affected.
+
+      Args:
+            cleaned (pd.DataFrame): Cleaned frame holding IMPUTED_COLUMNS.
+            missing_fraction (float): Fraction of the known values hidden (default is 0.1).
+            strategies (list, optional): `IMPUTATION_CASES` keys to run; all of them by default.
+            workers (int, optional): Worker processes (default is None, one per CPU).
+            trace_memory (bool): Record peak memory (default is True).
+            seed (int): Seed for the hidden values (default is 0).
+
+      Returns:
+            pd.DataFrame: One row per strategy and column with 'rows', the number of 'hidden' values,
+                  'coverage' (the fraction of them that was filled; dropped rows and values a strategy
+                  could not fill count as unfilled), 'mae', 'rmse' and 'normalized_rmse' (RMSE over the
+                  filled values, the last divided by the column's standard deviation), 'seconds',
+                  'peak_memory_bytes' and 'rank'. Within each column, strategies are ranked by
+                  normalized RMSE, then by time; strategies that filled nothing come last.
+
+      Raises:
+            KeyError: If a strategy is not in `IMPUTATION_CASES`.
+      """
+      strategies = list(IMPUTATION_CASES) if strategies is None else list(strategies)
+      unknown = [name for name in strategies if name not in IMPUTATION_CASES]
+      if unknown:
+            raise KeyError(f"Unknown imputation strategies: {unknown}")
+      known, masked = _masked_inputs(cleaned, missing_fraction, seed)
+      tasks = [(name, known.iloc[:IMPUTATION_CASES[name][2]], masked.iloc[:IMPUTATION_CASES[name][2]], trace_memory)
+               for name in strategies]
+      with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [row for rows in pool.map(_evaluate_imputation, tasks) for row in rows]
+      table = pd.DataFrame(results).sort_values(['column', 'normalized_rmse', 'seconds'], na_position='last')
+      table['rank'] = table.groupby('column').cumcount() + 1
+      return table.reset_index(drop=True)
+
+
+def choose_imputation_strategy(table, column, max_normalized_rmse, min_coverage=1.0):
+      """
+      Pick the fastest strategy that is accurate enough for a column.
+
+      Args:
+            table (pd.DataFrame): As returned by `compare_imputation_strategies`.
+            column (str): The column to impute.
+            max_normalized_rmse (float): Largest acceptable normalized RMSE.
+            min_coverage (float): Smallest acceptable fraction of filled values (default is 1.0).
+
+      Returns:
+            str: The strategy name, or None if no strategy qualifies.
+      """
+      rows = table[(table['column'] == column) & (table['normalized_rmse'] <= max_normalized_rmse)
+                   & (table['coverage'] >= min_coverage)]
+      return None if rows.empty else rows.sort_values('seconds')['strategy'].iloc[0]
+
+
+if __name__ == '__main__':
+      parser = argparse.ArgumentParser(description='Benchmark the pipeline.')
+      parser.add_argument('--rows', type=int, default=1_000_000, help='Number of rows for the orders_done benchmark.')
+      parser.add_argument('--suite', action='store_true', help='Run the synthetic-data benchmark suite instead.')
+      parser.add_argument('--sizes', type=int, nargs='+', default=list(SUITE_SIZES), help='Row counts for the suite.')
+      parser.add_argument('--workdir', default='benchmark_data', help='Directory for the synthetic CSVs.')
+      parser.add_argument('--baseline', default='benchmark_baseline.json', help='Baseline JSON file.')
+      parser.add_argument('--update-baseline', action='store_true', help='Store these results as the baseline.')
+      parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown.')
+      parser.add_argument('--fused', action='store_true', help='Use the fused extraction stage.')
+      parser.add_argument('--no-memory', action='store_true', help='Skip peak-memory tracing for exact timings.')
+      parser.add_argument('--duplicate-ratio', type=float, default=0.5, help='Fraction of repeated rows.')
+      parser.add_argument('--noise', type=float, default=0.05, help='Fraction of perturbed text cells.')
+      parser.add_argument('--imputation', action='store_true', help='Rank the imputation strategies on --rows synthetic rows.')
+      parser.add_argument('--missing-fraction', type=float, default=0.1, help='Fraction of known values hidden.')
+      parser.add_argument('--workers', type=int, default=None, help='Worker processes for the imputation comparison.')
+      args = parser.parse_args()
+      if args.imputation:
+            os.makedirs(args.workdir, exist_ok=True)
+            csv_path = os.path.join(args.workdir, f'synthetic_{args.rows}.csv')
+            if not os.path.exists(csv_path):
+                  write_synthetic_csv(csv_path, args.rows, duplicate_ratio=args.duplicate_ratio, noise=args.noise)
+            cleaner = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False, fused=args.fused)
+            cleaner.rd_processor.csv_path = csv_path
+            cleaner.df = cleaner.rd_processor.process()
+            cleaner.clean_and_transform()
+            table = compare_imputation_strategies(cleaner.df, args.missing_fraction, workers=args.workers,
+                                                  trace_memory=not args.no_memory)
+            logger.info(f"Imputation Strategies Ranked per Column:\n{table.to_string(index=False)}")
+            sys.exit(0)
+      if args.suite:
+            _, found = run_benchmark_suite(args.sizes, args.workdir, args.baseline, args.update_baseline,
+                                           args.tolerance, args.fused, not args.no_memory,
+                                           duplicate_ratio=args.duplicate_ratio, noise=args.noise)
+            sys.exit(1 if found else 0)
+      benchmark_orders_done(args.rows)
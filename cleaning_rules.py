@@ -0,0 +1,200 @@
+"""
+Cleaning Rules Module.
+This module expresses conditional overwrites of a column ("set the rating to 5.0 where the account
+is new") as declarative rules that are applied as vectorized masked assignments, instead of
+per-row Python functions.
+
+Classes:
+- ConditionalRule: A target column, a predicate over the frame and a replacement value.
+
+Functions:
+- column_equals: Predicate that a column equals a value (missing values never match).
+- column_at_most: Predicate that a column is at most a threshold (missing values never match).
+- any_of: Predicate that any of several predicates holds.
+- median_of: Replacement value computed as the median of a column, optionally excluding a value.
+- group_median_of: Replacement values computed as per-group medians, with the overall median for
+      small groups.
+- apply_rules: Applies a sequence of rules to a frame in order.
+
+Notes:
+- Predicates take the frame and return a boolean Series aligned to it. Replacement values are
+      either scalars or callables taking the frame and returning a scalar or an aligned Series;
+      they are evaluated on the frame as it is before the rule is applied.
+- Rules are applied in order, so a rule sees the result of the rules before it.
+- Rules can be limited to a boolean `rows` mask, for example the rows that survive a later filter.
+      Only those rows are overwritten and counted, and the statistics of `median_of` and
+      `group_median_of` are computed over them alone, so the frame does not have to be filtered
+      first. Value callables then receive the mask as a second argument.
+"""
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('cleaning_rules')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s : %(name)s - %(levelname)s - %(message)s')
+
+
+def column_equals(column, value):
+      """
+      Args:
+            column (str): Column to compare.
+            value: Value to compare it with.
+
+      Returns:
+            callable: Predicate true where `column` equals `value`, false where it is missing.
+      """
+      return lambda df: (df[column] == value).fillna(False).astype(bool)
+
+
+def column_at_most(column, threshold):
+      """
+      Args:
+            column (str): Numeric column to compare.
+            threshold (float): Largest value matched.
+
+      Returns:
+            callable: Predicate true where `column` is at most `threshold`, false where it is missing.
+      """
+      return lambda df: (df[column] <= threshold).fillna(False).astype(bool)
+
+
+def any_of(*predicates):
+      """
+      Args:
+            *predicates (callable): Predicates over the same frame.
+
+      Returns:
+            callable: Predicate true where any of `predicates` is true.
+      """
+      def predicate(df):
+            mask = pd.Series(False, index=df.index)
+            for other in predicates:
+                  mask |= other(df)
+            return mask
+      return predicate
+
+
+def median_of(column, exclude=None):
+      """
+      Args:
+            column (str): Column whose median is used.
+            exclude (optional): Value left out of the median (default is None, nothing excluded).
+
+      Returns:
+            callable: Replacement value computing the median of `column` on the frame.
+      """
+      def value(df, rows=None):
+            values = df[column] if rows is None else df[column][rows]
+            if exclude is not None:
+                  values = values[values != exclude]
+            return values.median()
+      return value
+
+
+def group_median_of(column, by, exclude=None, min_group_size=5, valid=None):
+      """
+      Args:
+            column (str): Column whose medians are used.
+            by (list): Columns defining the groups.
+            exclude (optional): Value left out of the medians (default is None, nothing excluded).
+            min_group_size (int): Fewest counted values a group needs for its own median (default is 5);
+                  smaller groups, and rows with a missing group key, use the median of the counted
+                  values over all rows.
+            valid (callable, optional): Predicate over the column's values selecting those that count
+                  towards the medians and group sizes, for example `lambda prices: prices > 500` to
+                  leave out the placeholders a rule replaces (default is None, every value counts).
+
+      Returns:
+            callable: Replacement value computing, for every row, the median of `column` in its group.
+                  The medians and group sizes come from one hash-based groupby pass over the rows, so the
+                  cost grows with the number of rows, not groups x rows.
+      """
+      def value(df, rows=None):
+            values = df[column]
+            if rows is not None:
+                  values = values.where(rows)
+            if exclude is not None:
+                  values = values.where(values != exclude)
+            if valid is not None:
+                  values = values.where(valid(values))
+            grouped = values.groupby([df[key] for key in by], observed=True, dropna=True, sort=False)
+            stats = grouped.agg(['median', 'count'])
+            # Group number of every row, in the order of `stats`; NaN for rows with a missing key.
+            codes = grouped.ngroup().to_numpy()
+            has_group = ~np.isnan(codes)
+            positions = np.where(has_group, codes, 0).astype(np.intp)
+            large = stats['count'].to_numpy()[positions] >= min_group_size
+            medians = np.where(has_group & large, stats['median'].to_numpy()[positions], values.median())
+            return pd.Series(medians, index=df.index)
+      return value
+
+
+class ConditionalRule:
+      """
+      Overwrite a column with a replacement value where a predicate holds.
+
+      Attributes:
+            column (str): The column overwritten.
+            when (callable): Predicate over the frame.
+            value: Scalar, or callable over the frame returning a scalar or an aligned Series.
+            description (str): Human-readable summary used in log messages.
+      """
+
+      def __init__(self, column, when, value, description=None):
+            self.column = column
+            self.when = when
+            self.value = value
+            self.description = description or f'{column} rule'
+
+      def apply(self, df, rows=None):
+            """
+            Apply the rule to a frame.
+
+            Args:
+                  df (pd.DataFrame): The frame. Its `column` is replaced, not modified in place.
+                  rows (pd.Series, optional): Boolean mask of the rows the rule applies to and computes
+                        its value over (default is None, every row).
+
+            Returns:
+                  int: Number of rows the rule matched.
+
+            Raises:
+                  KeyError: If a column used by the rule is missing.
+            """
+            mask = self.when(df)
+            if rows is None:
+                  value = self.value(df) if callable(self.value) else self.value
+            else:
+                  mask = mask & rows
+                  value = self.value(df, rows) if callable(self.value) else self.value
+            df[self.column] = df[self.column].mask(mask, value)
+            return int(mask.sum())
+
+      def __repr__(self):
+            return f'ConditionalRule({self.description!r})'
+
+
+def apply_rules(df, rules, rows=None):
+      """
+      Apply rules to a frame in order.
+
+      Args:
+            df (pd.DataFrame): The frame, updated column by column.
+            rules (list): `ConditionalRule` objects.
+            rows (pd.Series, optional): Boolean mask limiting the rules to some rows (default is None,
+                  every row).
+
+      Returns:
+            dict: Number of rows each rule matched, by rule description.
+
+      Raises:
+            Exception: Logs an error and raises the exception if a rule fails.
+      """
+      matched = {}
+      for rule in rules:
+            try:
+                  matched[rule.description] = rule.apply(df, rows)
+            except Exception as e:
+                  logger.error(f"Error applying {rule!r}: {e}")
+                  raise e
+      return matched
@@ -1,6 +1,8 @@
 from parameter_dictionary import ConfigParameters
 import logging
 from raw_data_processor import RawDataProcessor
+from memory_layout import compact_frame
+from cleaning_rules import ConditionalRule, apply_rules, any_of, column_equals, column_at_most, median_of, group_median_of
 import pandas as pd
 
 class DataCleanerAndTransformer(RawDataProcessor):
@@ -20,7 +22,13 @@ class DataCleanerAndTransformer(RawDataProcessor):
       - initialize_logging: Sets up a logger for tracking operations.
       - transform_columns: Applies transformations like column dropping, retaining, and renaming.
       - drop_duplicates: Removes duplicate rows and resets the DataFrame index.
+      - mark_duplicates: Marks the first occurrence of every row, so `drop_incomplete_rows` removes the
+            duplicates together with the incomplete rows (the step `clean_and_transform` runs).
+      - drop_incomplete_rows: Removes duplicate and incomplete rows in one filtering step.
+      - clean_name_col: Removes rows missing a 'name' (kept for callers; `drop_incomplete_rows` covers it).
+      - _dropna_: Removes rows missing any value (kept for callers; `drop_incomplete_rows` covers it).
       - update_rating_col: Updates the 'rating' column based on conditions in other columns.
+      - compact_columns: Converts the cleaned frame to categoricals and narrow numerics (when `compact`).
       - clean_and_transform: Executes all cleaning and transformation steps sequentially.
 
       Dependencies:
@@ -48,20 +56,84 @@ class DataCleanerAndTransformer(RawDataProcessor):
             such as 'columns_to_drop', 'columns_to_swap', 'columns_to_rename_2', and 'CSV_URL'.
       - The `RawDataProcessor` class must provide a `process` method that initializes the DataFrame.
       """
-
-      
-      def __init__(self, parameter_dict, logging_level = 'INFO'):
+      # The cleaning steps, in the order `clean_and_transform` runs them.
+      CLEANING_STEPS = (
+            'transform_columns',
+            'mark_duplicates',
+            'update_rating_col',
+            'impute_price',
+            'drop_incomplete_rows',
+      )
+
+      def __init__(self, parameter_dict, logging_level = 'INFO', workers = 1, cache_dir = None, process_on_init = True, fused = False, profile = False, compact = False,
+                   price_imputation = 'global', min_group_size = 5):
+            """
+            Args:
+                  parameter_dict : dict
+                        Dictionary containing configuration parameters.
+                  logging_level : str, optional
+                        Level of logging, either "DEBUG" or "INFO" (default is "INFO").
+                  workers : int, optional
+                        Number of processes used to process the raw data (default is 1).
+                  cache_dir : str, optional
+                        Directory of the on-disk cache of processed raw data (default is None).
+                  process_on_init : bool, optional
+                        Process the raw CSV into `self.df` straight away (default is True). When False,
+                        `self.df` is left as None for the caller to fill, e.g. with newly appended rows.
+                  fused : bool, optional
+                        Extract the text-derived columns of the raw data in a single pass (default is False).
+                  profile : bool, optional
+                        Measure every raw processing stage and cleaning step (default is False). Both share
+                        one profiler, so `profiling_report` covers the whole pipeline.
+                  compact : bool, optional
+                        Finish `clean_and_transform` with `compact_columns`, storing strings as categoricals
+                        and numerics in the narrowest dtypes (default is False). The memory saved is kept in
+                        `self.memory_report`.
+                  price_imputation : str, optional
+                        How `impute_price` replaces placeholder prices: 'global' uses the median of all
+                        non-zero prices (default); 'group' uses the median of the real prices (above 500)
+                        of the account's ('name', 'condition') group.
+                  min_group_size : int, optional
+                        Fewest real prices a group needs for its own median in 'group' mode (default is 5).
+                        Smaller groups use the median of all real prices.
+            """
             parameter_dict = ConfigParameters()
             
-            super().__init__(parameter_dict)
+            super().__init__(parameter_dict, workers=workers, cache_dir=cache_dir, fused=fused, profile=profile)
             self.columns_to_drop = parameter_dict['columns_to_drop']
             self.columns_to_swap = parameter_dict['columns_to_swap']
             self.columns_to_rename_2 = parameter_dict['columns_to_rename_2']
             self.csv_file_path = parameter_dict['CSV_URL']
+            self.steps = self.CLEANING_STEPS + (('compact_columns',) if compact else ())
+            self.memory_report = None
+            # First occurrence of every row, set by `mark_duplicates` and consumed by `drop_incomplete_rows`.
+            self.unique_rows = None
+            # Conditional overwrites applied by `update_rating_col` and `impute_price`, in order. Further
+            # business rules are added by appending `ConditionalRule`s to these lists.
+            self.rating_rules = [
+                  ConditionalRule('rating', any_of(column_equals('orders_done', 0), column_equals('condition', 'new')), 5.0,
+                                  "rating = 5.0 where orders_done == 0 or condition == 'new'"),
+            ]
+            if price_imputation == 'global':
+                  price_median = median_of('price', exclude=0)
+                  description = 'price = median of non-zero prices where price <= 500'
+            elif price_imputation == 'group':
+                  # Only real prices count, so a group of placeholders never supplies a placeholder.
+                  price_median = group_median_of('price', ['name', 'condition'], min_group_size=min_group_size,
+                                                 valid=lambda prices: prices > 500)
+                  description = "price = ('name', 'condition') group median of prices above 500 where price <= 500"
+            else:
+                  raise ValueError(f"price_imputation must be 'global' or 'group', got {price_imputation!r}.")
+            self.price_rules = [
+                  ConditionalRule('price', column_at_most('price', 500), price_median, description),
+            ]
+            self.rule_report = {}
 
             self.initialize_logging(logging_level)
-            self.rd_processor = RawDataProcessor(parameter_dict=parameter_dict)
-            self.df = self.rd_processor.process()
+            self.rd_processor = RawDataProcessor(parameter_dict=parameter_dict, workers=workers, cache_dir=cache_dir, fused=fused)
+            self.rd_processor.profiler = self.profiler
+            self.dedup_report = self.rd_processor.dedup_report
+            self.df = self.rd_processor.process() if process_on_init else None
       def initialize_logging(self, logging_level):
             """
             Sets up logging for the class instance.
@@ -91,6 +163,9 @@ class DataCleanerAndTransformer(RawDataProcessor):
             - Drops specified columns.
             - Retains only specified columns.
             - Renames specified columns.
+
+            The three are planned as one projection to the final column set, which copies no data when
+            copy-on-write is enabled (as it is in `clean_and_transform`).
             Args: 
                   None
             Returns:
@@ -101,9 +176,12 @@ class DataCleanerAndTransformer(RawDataProcessor):
                   KeyError: If there are issues with column renaming.
             """
             try:
-                  self.df = self.df.drop(columns = self.columns_to_drop)
-                  self.df = self.df[self.columns_to_swap]
-                  self.df = self.df.rename(columns = self.columns_to_rename_2)
+                  # Selecting `columns_to_swap` already leaves out `columns_to_drop`; they are only checked,
+                  # so the projection is a single step (and, under copy-on-write, a view).
+                  missing = [column for column in self.columns_to_drop if column not in self.df.columns]
+                  if missing:
+                        raise KeyError(f"{missing} not found in axis")
+                  self.df = self.df[self.columns_to_swap].rename(columns = self.columns_to_rename_2)
                   self.logger.info('Successfully Transformed Columns')
                   return self.df
             except KeyError as e:
@@ -140,6 +218,29 @@ class DataCleanerAndTransformer(RawDataProcessor):
                   self.logger.error(f"An unexpected error occurred while removing duplicates: {e}")
                   raise e
 
+      def mark_duplicates(self):
+            """
+            Mark the first occurrence of every row in `self.unique_rows`, without removing any row.
+
+            The marked rows are the ones `drop_duplicates` keeps. The rules of `update_rating_col` and
+            `impute_price` are limited to them, so they match the same rows and compute the same medians
+            as on the deduplicated frame, and `drop_incomplete_rows` removes the duplicates in the same
+            filter as the incomplete rows, giving the index `drop_duplicates` would have given.
+
+            Returns:
+                  pd.DataFrame: The unchanged DataFrame.
+
+            Raises:
+                  Exception: For any unexpected errors during the operation.
+            """
+            try:
+                  self.unique_rows = ~self.df.duplicated(keep='first')
+                  self.logger.info(f"Successfully Marked {int((~self.unique_rows).sum())} Duplicate Rows")
+                  return self.df
+            except Exception as e:
+                  self.logger.error(f"An unexpected error occurred while marking duplicates: {e}")
+                  raise e
+
       def update_rating_col(self):
             """
             Updates the 'rating' column in the DataFrame based on specified conditions.
@@ -147,6 +248,9 @@ class DataCleanerAndTransformer(RawDataProcessor):
             - Sets the 'rating' to 5.0 if the 'orders_done' column equals 0 or the 'condition' column is 'new'.
             - Otherwise, retains the original 'rating' value.
 
+            The conditions are the `ConditionalRule`s in `self.rating_rules`, applied as masked assignments
+            over whole columns. The number of rows each rule matched is recorded in `self.rule_report`.
+
             Returns:
                   pd.DataFrame: The DataFrame with the updated 'rating' column.
 
@@ -159,10 +263,7 @@ class DataCleanerAndTransformer(RawDataProcessor):
                         self.logger.error("The input DataFrame is None or empty.")
                         raise ValueError("The input DataFrame is None or empty.")
 
-                  self.df['rating'] = self.df.apply(
-                        lambda row: 5.0 if (row['orders_done'] == 0 or row['condition'] == 'new') else row['rating'], 
-                        axis=1
-                  )
+                  self.rule_report.update(apply_rules(self.df, self.rating_rules, self.unique_rows))
                   self.logger.info("Successfully updated the 'rating' column based on specified conditions.")
                   return self.df
             except KeyError as e:
@@ -175,6 +276,12 @@ class DataCleanerAndTransformer(RawDataProcessor):
             """
             Replace zeros in the specified column with the column's median value.
 
+            Prices of 500 or less are placeholders and are replaced by the median of the non-zero prices
+            of all rows, or with `price_imputation='group'` by the median of the real prices (above 500)
+            of the row's ('name', 'condition') group,
+            as set out by the `ConditionalRule`s in `self.price_rules`. The number of rows each rule matched
+            is recorded in `self.rule_report`.
+
             Parameters:
                   df (pd.DataFrame): The input DataFrame.
                   col (str): The name of the column to process.
@@ -186,25 +293,68 @@ class DataCleanerAndTransformer(RawDataProcessor):
                   self.col = 'price'
                   if self.col not in self.df.columns:
                         raise ValueError(f"Column '{self.col}' does not exist in the DataFrame.")
-                  
-                  # Calculate the median of the column (excluding zeros)
-                  median_value = self.df.loc[self.df[self.col] != 0, self.col].median()
-                  
-                  # Replace zeros with the median value
-                  self.df[self.col] = self.df[self.col].apply(lambda x: median_value if x <= 500 else x)
-                  
+
+                  self.rule_report.update(apply_rules(self.df, self.price_rules, self.unique_rows))
+
                   self.logger.info(f"Successfully replaced zeros in column '{self.col}' with the median.")
                   return self.df
             except Exception as e:
                   self.logger.error(f"Error in impute_zero_with_median: {e}")
                   raise e
+      def drop_incomplete_rows(self):
+            """
+            Drop rows with a missing value, and the duplicates marked by `mark_duplicates`, with one mask.
+
+            The frame is filtered once, into a copy that shares no memory with the processor's frame.
+            This replaces the former `clean_name_col` and `_dropna_` steps: rows missing a 'name' are a
+            subset of the rows missing any value.
+
+            Returns:
+                  pd.DataFrame: The DataFrame without duplicate rows or rows that have missing values.
+
+            Raises:
+                  ValueError: If the 'name' column does not exist in the DataFrame.
+                  Exception: If any other error occurs during the operation.
+            """
+            self.col_name = 'name'
+            try:
+                  if self.col_name not in self.df.columns:
+                        raise ValueError(f"Column '{self.col_name}' does not exist in the DataFrame.")
+                  self._keep_rows(self.df.notna().all(axis=1))
+                  self.logger.info('Successfully Dropped Rows with Missing Values')
+                  return self.df
+            except Exception as e:
+                  self.logger.error(f"Error in drop_incomplete_rows: {e}")
+                  raise e
+
+      def _keep_rows(self, keep):
+            """
+            Filter the DataFrame to the rows of a boolean mask, with the duplicates marked by `mark_duplicates`.
+
+            When duplicates were marked, the kept rows are labelled by their position among the unique
+            rows, the index `drop_duplicates` gives them, and the marks are cleared.
+
+            Args:
+                  keep (pd.Series): Boolean mask aligned with `self.df`.
+
+            Returns:
+                  pd.DataFrame: The filtered DataFrame.
+            """
+            if self.unique_rows is not None:
+                  labels = self.unique_rows.cumsum() - 1
+                  keep = keep & self.unique_rows
+                  self.df = self.df[keep].set_axis(labels[keep].to_numpy())
+                  self.unique_rows = None
+            else:
+                  self.df = self.df[keep]
+            return self.df
+
       def clean_name_col(self):
             """
             Clean the 'name' column by removing rows with missing values.
 
-            This method checks if the column specified in `self.col_name` exists in the DataFrame (`self.df`).
-            If the column does not exist, it raises a `ValueError`. Otherwise, it drops rows where the 'name'
-            column has missing (NaN) values and logs the operation.
+            `clean_and_transform` no longer runs this step: `drop_incomplete_rows` drops these rows in
+            the same filter as the rest. It is kept for callers that run the steps themselves.
 
             Returns:
                   pd.DataFrame: The updated DataFrame with rows containing missing values in the 'name' column removed.
@@ -212,32 +362,60 @@ class DataCleanerAndTransformer(RawDataProcessor):
             Raises:
                   ValueError: If the specified column does not exist in the DataFrame.
                   Exception: If any other error occurs during the operation.
-
             """
             self.col_name = 'name'
             try:
                   if self.col_name not in self.df.columns:
                         raise ValueError(f"Column '{self.col_name}' does not exist in the DataFrame.")
-                  # Drop rows where the specified column has NaN values
-                  self.df = self.df.dropna(subset=[self.col_name])
-
+                  self._keep_rows(self.df[self.col_name].notna())
                   self.logger.info(f"Successfully dropped rows with missing values in '{self.col_name}' column.")
                   return self.df
-            
             except Exception as e:
                   self.logger.error(f"Error in drop_rows_with_missing_in_column: {e}")
                   raise e
+
       def _dropna_(self):
-            self.df = self.df.dropna(axis=0)
-            return self.df
+            """Drop rows missing any value; `drop_incomplete_rows` does this together with the 'name' check."""
+            return self._keep_rows(self.df.notna().all(axis=1))
+
+      def compact_columns(self):
+            """
+            Convert the cleaned DataFrame to its compact memory layout with `compact_frame`.
+
+            'name', 'condition' and 'bid/take' become categoricals, 'orders_done' the narrowest nullable
+            integer, 'rating' and 'price' float32, and the index the narrowest integer index. The
+            footprint before and after is stored in `self.memory_report`.
+
+            Returns:
+                  pd.DataFrame: The compact DataFrame.
+
+            Raises:
+                  Exception: If any error occurs during the conversion.
+            """
+            try:
+                  self.df, self.memory_report = compact_frame(self.df)
+                  self.logger.info(f"Successfully Compacted the Cleaned Data, Saving {self.memory_report['saved_bytes']:,} Bytes")
+                  return self.df
+            except Exception as e:
+                  self.logger.error(f"Error in compact_columns: {e}")
+                  raise e
 
       def clean_and_transform(self):
             """
             Executes a series of data cleaning and transformation steps on the DataFrame.
 
             - Applies column transformations, including dropping, retaining, and renaming specified columns.
-            - Removes duplicate rows and resets the index.
+            - Marks duplicate rows.
             - Updates the 'rating' column based on specified conditions.
+            - Imputes low prices, then drops the duplicates and the rows missing a name or any other value.
+
+            The steps run with pandas copy-on-write enabled: the column projection shares memory with
+            its input and a column is only copied when a rule overwrites it. Duplicates and incomplete
+            rows are removed by one combined row mask, so the final filter is the only full copy, and
+            the result shares no buffers with `self.rd_processor.df`.
+
+            With `compact=True`, the result is then converted to its compact layout by `compact_columns`.
+            Each step is measured when the cleaner was built with `profile=True`.
 
             Returns:
                   pd.DataFrame: The cleaned and transformed DataFrame.
@@ -245,11 +423,8 @@ class DataCleanerAndTransformer(RawDataProcessor):
             Raises:
                   Exception: Any errors encountered during the cleaning and transformation steps are propagated.
             """
-      
-            self.transform_columns()
-            self.drop_duplicates()
-            self.update_rating_col()
-            self.impute_price()
-            self.clean_name_col()
-            self. _dropna_()
+
+            with pd.option_context('mode.copy_on_write', True):
+                  for step in self.steps:
+                        self._run_stage(step)
             return self.df
\ No newline at end of file
@@ -94,6 +94,32 @@ def load_csv_file(URL):
       except Exception as e:
             logger.error('CSV Data Not Read. Confirm the Provided Parameters')
             raise e
+def load_csv_chunks(URL, chunksize, dtype=None):
+      """
+      Reads a CSV file in fixed-size chunks so that only one chunk is held in memory at a time.
+      Args:
+            URL (str): The path or web URL to the CSV file.
+            chunksize (int): Number of rows per chunk.
+            dtype (optional): Passed to `pd.read_csv` (default is None, inferred per chunk). Inference
+                  sees one chunk at a time, so a chunk of empty cells reads as float64; pass `object`
+                  to keep text columns text in every chunk.
+      Yields:
+            DataFrame: Consecutive chunks of the CSV data. The index continues across chunks.
+      Raises:
+            pd.errors.EmptyDataError: If the CSV at the URL is empty or invalid.
+            Exception: For other errors encountered while reading the CSV.
+      """
+      try:
+            with pd.read_csv(URL, chunksize=chunksize, dtype=dtype) as reader:
+                  for chunk in reader:
+                        yield chunk
+            logger.info('CSV File Streamed Successfully')
+      except pd.errors.EmptyDataError as e:
+            logger.error('The URL Provided Points to Invalid Data')
+            raise e
+      except Exception as e:
+            logger.error('CSV Data Not Read. Confirm the Provided Parameters')
+            raise e
       
 
 
@@ -1,15 +1,28 @@
+import hashlib
 import logging
+import os
+import time
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+from sklearn.base import clone
 from sklearn.impute import KNNImputer
-from sklearn.linear_model import LinearRegression
+from sklearn.metrics.pairwise import nan_euclidean_distances
+from sklearn.linear_model import BayesianRidge, LinearRegression
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401, required to import IterativeImputer
 from sklearn.impute import IterativeImputer
+from sklearn.exceptions import NotFittedError
+from missingness import MissingnessProfile
+from streaming_statistics import RunningMoments, QuantileSketch, HeavyHitters
 
 # Set up logging
 logger = logging.getLogger('imputation')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s : %(name)s - %(levelname)s - %(message)s')
 
 
-def drop_missing_values(df, axis=0, threshold=0.05):
+def drop_missing_values(df, axis=0, threshold=0.05, profile=None):
       """
       Drop rows or columns based on a missing value threshold.
 
@@ -17,6 +30,9 @@ def drop_missing_values(df, axis=0, threshold=0.05):
             df (pd.DataFrame): The input DataFrame.
             axis (int): Axis to drop along, 0 for rows, 1 for columns.
             threshold (float): The maximum percentage of missing values allowed.
+            profile (MissingnessProfile, optional): A profile covering every column of `df`. The rows
+                  or columns are then selected from its stored null masks and counts, without scanning
+                  the frame; the result is the same as without it.
 
       Returns:
             pd.DataFrame: The modified DataFrame with rows or columns dropped.
@@ -27,6 +43,21 @@ def drop_missing_values(df, axis=0, threshold=0.05):
             if axis not in (0, 1):
                   raise ValueError("Axis must be 0 (rows) or 1 (columns).")
 
+            if profile is not None:
+                  profile.check(df)
+                  if axis == 0:  # Keep rows with enough values
+                        logger.info(f"Dropping rows with more than {threshold * 100}% missing values.")
+                        # The stored row counts cover every profiled column; count only df's own otherwise.
+                        if list(df.columns) == profile.columns:
+                              row_null_counts = profile.row_null_counts
+                        else:
+                              row_null_counts = profile.mask(list(df.columns)).sum(axis=1)
+                        return df[row_null_counts <= df.shape[1] - int((1 - threshold) * df.shape[1])]
+                  else:  # Keep columns with enough values
+                        logger.info(f"Dropping columns with more than {threshold * 100}% missing values.")
+                        counts = profile.column_null_counts[df.columns].to_numpy()
+                        return df.loc[:, counts <= df.shape[0] - int((1 - threshold) * df.shape[0])]
+
             if axis == 0:  # Drop rows
                   logger.info(f"Dropping rows with more than {threshold * 100}% missing values.")
                   return df.dropna(axis=0, thresh=int((1 - threshold) * df.shape[1]))
@@ -39,86 +70,452 @@ def drop_missing_values(df, axis=0, threshold=0.05):
             raise e
 
 
-def impute_mean(df, cols):
+def _python_scalar(value):
+      """Convert a NumPy scalar to the equivalent Python value, so fitted statistics pickle portably."""
+      return value.item() if hasattr(value, 'item') else value
+
+
+def _needs_float(series, value):
+      """True if `series` is a nullable integer column that cannot hold the non-integral fill `value`."""
+      return (pd.api.types.is_extension_array_dtype(series.dtype) and pd.api.types.is_integer_dtype(series.dtype)
+              and isinstance(value, float) and not pd.isna(value) and not value.is_integer())
+
+
+class StatisticImputer:
+      """
+      Impute missing values with a per-column statistic learned once and reused.
+
+      `fit` computes the statistic of every column in one call over the whole column block, and
+      `transform` fills all columns with one `fillna`. Nullable integer columns whose statistic is
+      not a whole number (e.g. the mean of an 'Int64' column) are cast to float64 before they are
+      filled, as their NumPy integer counterparts would be. The fitted statistics are plain Python
+      values, so a fitted imputer can be pickled and applied to new batches without the training
+      data.
+
+      Attributes:
+            strategy (str): 'mean', 'median' or 'mode'.
+            cols (list): The columns imputed.
+            statistics_ (dict): Fill value per column, set by `fit`.
+      """
+
+      STRATEGIES = ('mean', 'median', 'mode')
+
+      def __init__(self, strategy, cols):
+            """
+            Parameters:
+                  strategy (str): 'mean', 'median' or 'mode'.
+                  cols (list or str): The column(s) to impute.
+
+            Raises:
+                  ValueError: If the strategy is unknown.
+            """
+            if strategy not in self.STRATEGIES:
+                  raise ValueError(f"Strategy must be one of {self.STRATEGIES}, got {strategy!r}.")
+            self.strategy = strategy
+            self.cols = [cols] if isinstance(cols, str) else list(cols)
+            self.statistics_ = None
+
+      def fit(self, df):
+            """
+            Compute the fill value of every column.
+
+            Parameters:
+                  df (pd.DataFrame): Training data.
+
+            Returns:
+                  StatisticImputer: The fitted imputer.
+            """
+            try:
+                  block = df[self.cols]
+                  if self.strategy == 'mean':
+                        statistics = block.mean()
+                  elif self.strategy == 'median':
+                        statistics = block.median()
+                  else:
+                        statistics = block.mode().iloc[0]
+                  self.statistics_ = {col: _python_scalar(value) for col, value in statistics.items()}
+                  logger.info(f"Fitted {self.strategy} imputer on columns {self.cols}.")
+                  return self
+            except Exception as e:
+                  logger.error(f"Error in StatisticImputer.fit: {e}")
+                  raise e
+
+      def transform(self, df, profile=None):
+            """
+            Fill missing values with the fitted statistics.
+
+            Parameters:
+                  df (pd.DataFrame): The data to impute. Modified in place.
+                  profile (MissingnessProfile, optional): A profile of `df` covering the imputed
+                        columns. Columns without missing values are then skipped, the others are
+                        filled from their stored masks, and the profile is updated.
+
+            Returns:
+                  pd.DataFrame: The DataFrame with missing values imputed.
+
+            Raises:
+                  NotFittedError: If `fit` has not been called.
+            """
+            if self.statistics_ is None:
+                  raise NotFittedError("This StatisticImputer is not fitted yet; call 'fit' first.")
+            try:
+                  if profile is None:
+                        widened = [col for col in self.cols if _needs_float(df[col], self.statistics_[col])]
+                        if widened:
+                              df[widened] = df[widened].astype('float64')
+                        df[self.cols] = df[self.cols].fillna(self.statistics_)
+                  else:
+                        profile.check(df, self.cols)
+                        for col in self.cols:
+                              value = self.statistics_[col]
+                              if profile.column_null_counts[col] and not pd.isna(value):
+                                    if _needs_float(df[col], value):
+                                          df[col] = df[col].astype('float64')
+                                    df[col] = df[col].mask(profile.column_mask(col), value)
+                                    profile.mark_filled(col)
+                  logger.info(f"Successfully imputed missing values with {self.strategy}.")
+                  return df
+            except Exception as e:
+                  logger.error(f"Error in StatisticImputer.transform: {e}")
+                  raise e
+
+      def fit_transform(self, df, profile=None):
+            """
+            Fit on `df` and impute it.
+
+            Parameters:
+                  df (pd.DataFrame): The data to fit on and impute. Modified in place.
+                  profile (MissingnessProfile, optional): A profile of `df`, see `transform`.
+
+            Returns:
+                  pd.DataFrame: The DataFrame with missing values imputed.
+            """
+            return self.fit(df).transform(df, profile)
+
+
+class StreamingImputer(StatisticImputer):
+      """
+      A `StatisticImputer` fitted on a stream of chunks, for data larger than memory.
+
+      Each column's statistic is accumulated in bounded memory with one vectorized update per chunk:
+      the mean exactly with `RunningMoments` (which also gives the variance), the median with a
+      `QuantileSketch` and the mode with a `HeavyHitters` summary; see `streaming_statistics` for
+      their error bounds. After `fit`, `transform` fills chunks like a `StatisticImputer`.
+
+      `fit` and `fit_transform` take either one DataFrame, as a `StatisticImputer` does, or an
+      iterable of DataFrame chunks.
+
+      Attributes:
+            accumulators_ (dict): The accumulator per column, kept after fitting for inspection
+                  (e.g. `accumulators_[col].variance` or `accumulators_[col].quantile(0.9)`).
+      """
+
+      def __init__(self, strategy, cols, sketch_size=4096, heavy_hitters=10_000):
+            """
+            Parameters:
+                  strategy (str): 'mean', 'median' or 'mode'.
+                  cols (list or str): The column(s) to impute.
+                  sketch_size (int): Values per level of the median sketch (default is 4096).
+                  heavy_hitters (int): Values tracked by the mode summary (default is 10,000).
+            """
+            super().__init__(strategy, cols)
+            self.sketch_size = sketch_size
+            self.heavy_hitters = heavy_hitters
+            self.accumulators_ = None
+
+      def _new_accumulator(self):
+            if self.strategy == 'mean':
+                  return RunningMoments()
+            if self.strategy == 'median':
+                  return QuantileSketch(self.sketch_size)
+            return HeavyHitters(self.heavy_hitters)
+
+      def partial_fit(self, chunk):
+            """
+            Add one chunk to the statistics.
+
+            Parameters:
+                  chunk (pd.DataFrame): A chunk containing the imputed columns.
+
+            Returns:
+                  StreamingImputer: The imputer, with `statistics_` reflecting every chunk seen so far.
+            """
+            try:
+                  if self.accumulators_ is None:
+                        self.accumulators_ = {col: self._new_accumulator() for col in self.cols}
+                  for col in self.cols:
+                        self.accumulators_[col].update(chunk[col])
+                  self.statistics_ = {col: _python_scalar(accumulator.result()) for col, accumulator in self.accumulators_.items()}
+                  return self
+            except Exception as e:
+                  logger.error(f"Error in StreamingImputer.partial_fit: {e}")
+                  raise e
+
+      def fit(self, chunks):
+            """
+            Compute the statistics over a DataFrame or a stream of chunks.
+
+            Parameters:
+                  chunks (pd.DataFrame or iterable): A DataFrame, or DataFrame chunks read once.
+
+            Returns:
+                  StreamingImputer: The fitted imputer.
+
+            Raises:
+                  ValueError: If there are no chunks.
+            """
+            if isinstance(chunks, pd.DataFrame):
+                  chunks = (chunks,)
+            self.accumulators_ = None
+            rows = 0
+            for chunk in chunks:
+                  self.partial_fit(chunk)
+                  rows += len(chunk)
+            if self.accumulators_ is None:
+                  raise ValueError("No chunks to fit on.")
+            logger.info(f"Fitted streaming {self.strategy} imputer on columns {self.cols} over {rows} rows.")
+            return self
+
+      def fit_transform(self, chunks, profile=None):
+            """
+            Fit on a DataFrame or on chunks and impute them.
+
+            Parameters:
+                  chunks (pd.DataFrame or iterable): A DataFrame, or a collection of DataFrame chunks that
+                        can be iterated twice (e.g. a list). Modified in place.
+                  profile (MissingnessProfile, optional): A profile of the DataFrame, see `transform`;
+                        only used when a single DataFrame is passed.
+
+            Returns:
+                  pd.DataFrame or list: The imputed DataFrame, or the list of imputed chunks.
+
+            Raises:
+                  TypeError: If `chunks` is a one-shot iterator, which cannot be read a second time to
+                        fill it; use `impute_streaming` with a chunk source instead.
+            """
+            if isinstance(chunks, pd.DataFrame):
+                  return self.fit(chunks).transform(chunks, profile)
+            if iter(chunks) is chunks:
+                  raise TypeError("A stream can only be read once; use impute_streaming to fit and fill in two passes.")
+            self.fit(chunks)
+            return [self.transform(chunk) for chunk in chunks]
+
+
+def impute_streaming(chunk_source, cols, strategy='mean', **kwargs):
+      """
+      Impute missing values in data larger than memory in two passes over its chunks.
+
+      The first pass fits a `StreamingImputer` on every chunk; the second fills each chunk with the
+      statistics of the whole data and yields it.
+
+      Parameters:
+            chunk_source (callable): Returns a fresh iterator of DataFrame chunks each time it is called,
+                  e.g. `lambda: load_csv_chunks(path, 1_000_000)`.
+            cols (list or str): The column(s) to impute.
+            strategy (str): 'mean', 'median' or 'mode' (default is 'mean').
+            **kwargs: Passed to `StreamingImputer` (sketch_size, heavy_hitters).
+
+      Yields:
+            pd.DataFrame: The imputed chunks, in order.
+      """
+      try:
+            imputer = StreamingImputer(strategy, cols, **kwargs).fit(chunk_source())
+            for chunk in chunk_source():
+                  yield imputer.transform(chunk)
+      except Exception as e:
+            logger.error(f"Error in impute_streaming: {e}")
+            raise e
+
+
+def _columns_to_fill(df, cols, profile):
+      """
+      The columns that have missing values, according to a profile of `df`.
+
+      Parameters:
+            df (pd.DataFrame): The frame.
+            cols (list): The columns to impute.
+            profile (MissingnessProfile): A profile of `df` covering `cols`, or None.
+
+      Returns:
+            list: The columns of `cols` with a missing value; all of `cols` without a profile.
+      """
+      if profile is None:
+            return cols
+      profile.check(df, cols)
+      return [col for col in cols if profile.column_null_counts[col]]
+
+
+def impute_mean(df, cols, profile=None):
       """
       Impute missing values in specified columns with the mean.
 
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            profile (MissingnessProfile, optional): A profile of `df`, see `StatisticImputer.transform`.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
       """
       try:
-            if isinstance(cols, str):
-                  cols = [cols]
-
-            for col in cols:
-                  logger.info(f"Imputing missing values in column '{col}' with mean.")
-                  df[col] = df[col].fillna(df[col].mean())
-
-            logger.info("Successfully imputed missing values with mean.")
-            return df
+            return StatisticImputer('mean', cols).fit_transform(df, profile)
       except Exception as e:
             logger.error(f"Error in impute_mean: {e}")
             raise e
 
 
-def impute_median(df, cols):
+def impute_median(df, cols, profile=None):
       """
       Impute missing values in specified columns with the median.
 
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            profile (MissingnessProfile, optional): A profile of `df`, see `StatisticImputer.transform`.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
       """
       try:
-            if isinstance(cols, str):
-                  cols = [cols]
-
-            for col in cols:
-                  logger.info(f"Imputing missing values in column '{col}' with median.")
-                  df[col] = df[col].fillna(df[col].median())
-
-            logger.info("Successfully imputed missing values with median.")
-            return df
+            return StatisticImputer('median', cols).fit_transform(df, profile)
       except Exception as e:
             logger.error(f"Error in impute_median: {e}")
             raise e
 
 
-def impute_mode(df, cols):
+def impute_mode(df, cols, profile=None):
       """
       Impute missing values in specified columns with the mode.
 
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            profile (MissingnessProfile, optional): A profile of `df`, see `StatisticImputer.transform`.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
       """
       try:
-            if isinstance(cols, str):
-                  cols = [cols]
-
-            for col in cols:
-                  mode_value = df[col].mode()[0]
-                  logger.info(f"Imputing missing values in column '{col}' with mode: {mode_value}")
-                  df[col] = df[col].fillna(mode_value)
-
-            logger.info("Successfully imputed missing values with mode.")
-            return df
+            return StatisticImputer('mode', cols).fit_transform(df, profile)
       except Exception as e:
             logger.error(f"Error in impute_mode: {e}")
             raise e
 
 
-def impute_knn(df, cols, n_neighbors=5):
+# Peak memory of `_knn_impute_block`, measured with tracemalloc and rounded up. Per (block row x
+# row of X): the float64 distance block, the temporaries of `nan_euclidean_distances` and one
+# column's donor subset, about 2.1 x 8 bytes. Independent of the block size: the masked and
+# squared copies of X that `nan_euclidean_distances` makes, about 3.3 copies of X plus 5 float
+# columns.
+_KNN_BYTES_PER_CELL = 3 * 8
+_KNN_BLOCK_X_COPIES = 4
+_KNN_BLOCK_COLUMNS = 8
+
+
+def _knn_impute_block(X, mask, receivers, n_neighbors, donors_by_col, col_means):
+      """
+      Compute the k-NN imputations for one block of rows with missing values.
+
+      Follows `KNNImputer`: NaN-Euclidean distances to every row; for each column, the donors are
+      the rows where it is observed, the `n_neighbors` nearest are averaged (neighbours at an
+      undefined distance get zero weight), and rows with no defined distance to any donor get the
+      column mean.
+
+      Parameters:
+            X (np.ndarray): All rows, read only.
+            mask (np.ndarray): Missing-value mask of `X`.
+            receivers (np.ndarray): Indices of the block's rows.
+            n_neighbors (int): Number of neighbours averaged.
+            donors_by_col (list): Indices of the rows observed in each column.
+            col_means (np.ndarray): Mean of the observed values of each column.
+
+      Returns:
+            list: (row indices, column, values) for every column the block imputes.
+      """
+      distances = nan_euclidean_distances(X[receivers], X)
+      imputed = []
+      for col, donors in enumerate(donors_by_col):
+            rows = np.flatnonzero(mask[receivers, col])
+            if rows.size == 0 or donors.size == 0:
+                  continue
+            dist = distances[np.ix_(rows, donors)]
+            undefined = np.isnan(dist).all(axis=1)
+            values = np.full(rows.size, col_means[col])
+            if not undefined.all():
+                  if undefined.any():
+                        dist = dist[~undefined]
+                  k = min(n_neighbors, donors.size)
+                  nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                  weights = (~np.isnan(np.take_along_axis(dist, nearest, axis=1))).astype(float)
+                  donor_values = X[donors, col][nearest]
+                  values[~undefined] = (donor_values * weights).sum(axis=1) / weights.sum(axis=1)
+            imputed.append((receivers[rows], col, values))
+      return imputed
+
+
+def impute_knn_blocked(X, n_neighbors=5, max_memory_mb=256, n_jobs=None, mask=None):
+      """
+      k-NN imputation of a float array in blocks of bounded memory, run in parallel.
+
+      Only rows with a missing value are searched for neighbours. They are split into blocks small
+      enough that the result, the shared inputs and every concurrent block's distance matrices
+      (block rows x all rows, with their temporaries) stay within `max_memory_mb`, and the blocks run
+      on a thread pool (the distance products and partial sorts run in NumPy without holding the
+      GIL). When even one-row blocks exceed the ceiling, a warning is logged and they are used
+      anyway. The results equal `KNNImputer(n_neighbors).fit_transform(X)` for the default uniform
+      weights, except that all-missing columns are kept (and left missing) instead of being dropped.
+
+      Parameters:
+            X (np.ndarray): 2-D float array with NaN for missing values.
+            n_neighbors (int): Number of neighbours averaged (default is 5).
+            max_memory_mb (float): Memory ceiling of the imputation, in MiB (default is 256).
+            n_jobs (int): Number of threads (default is None, one per CPU).
+            mask (np.ndarray, optional): Boolean array, True where `X` is missing, if already known
+                  (default is None, computed from `X`).
+
+      Returns:
+            np.ndarray: A copy of `X` with the missing values imputed.
+      """
+      X = np.asarray(X, dtype=float)
+      if mask is None:
+            mask = np.isnan(X)
+      result = X.copy()
+      receivers = np.flatnonzero(mask.any(axis=1))
+      if receivers.size == 0:
+            return result
+      n_jobs = n_jobs or os.cpu_count() or 1
+      donors_by_col = [np.flatnonzero(~mask[:, col]) for col in range(X.shape[1])]
+      # All-missing columns have no mean; nanmean warns about the empty slice and returns NaN.
+      with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            col_means = np.nanmean(np.where(mask, np.nan, X), axis=0) if (~mask).any() else np.full(X.shape[1], np.nan)
+      # The inputs shared by all blocks, and the result, are allocated once; the rest of the ceiling is
+      # split between the concurrent blocks.
+      shared_bytes = result.nbytes + mask.nbytes + sum(donors.nbytes for donors in donors_by_col)
+      block_overhead = (_KNN_BLOCK_X_COPIES * X.shape[1] + _KNN_BLOCK_COLUMNS) * X.shape[0] * 8
+      block_budget = (max_memory_mb * 2**20 - shared_bytes) / n_jobs - block_overhead
+      block_rows = int(max(1, block_budget // (_KNN_BYTES_PER_CELL * X.shape[0])))
+      if block_budget < _KNN_BYTES_PER_CELL * X.shape[0]:
+            logger.warning(f"k-NN imputation of {X.shape[0]} rows needs more than {max_memory_mb} MiB; "
+                           f"using blocks of one row.")
+      # Blocks are submitted as earlier ones finish, so at most `n_jobs` are in flight at once.
+      def store(future):
+            for rows, col, values in future.result():
+                  result[rows, col] = values
+
+      pending = deque()
+      with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            for start in range(0, receivers.size, block_rows):
+                  if len(pending) == n_jobs:
+                        store(pending.popleft())
+                  block = receivers[start:start + block_rows]
+                  pending.append(pool.submit(_knn_impute_block, X, mask, block, n_neighbors, donors_by_col, col_means))
+            while pending:
+                  store(pending.popleft())
+      return result
+
+
+def impute_knn(df, cols, n_neighbors=5, engine='sklearn', max_memory_mb=256, n_jobs=None, profile=None):
       """
       Impute missing values using k-NN.
 
@@ -126,6 +523,14 @@ def impute_knn(df, cols, n_neighbors=5):
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
             n_neighbors (int): Number of neighbors to use for k-NN.
+            engine (str): 'sklearn' (default) uses `KNNImputer` directly; 'blocked' searches neighbours
+                  only for rows with missing values, in parallel blocks within `max_memory_mb` (see
+                  `impute_knn_blocked`), with the same results and bounded memory.
+            max_memory_mb (float): Memory ceiling of the blocked engine, in MiB (default is 256).
+            n_jobs (int): Threads used by the blocked engine (default is None, one per CPU).
+            profile (MissingnessProfile, optional): A profile of `df` covering `cols`. The blocked
+                  engine then takes its missing mask from it, and the imputed columns are rescanned
+                  into it afterwards.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
@@ -135,8 +540,18 @@ def impute_knn(df, cols, n_neighbors=5):
                   cols = [cols]
 
             logger.info(f"Imputing missing values using k-NN with {n_neighbors} neighbors.")
-            imputer = KNNImputer(n_neighbors=n_neighbors)
-            df[cols] = imputer.fit_transform(df[cols])
+            if profile is not None:
+                  profile.check(df, cols)
+            if engine == 'blocked':
+                  mask = None if profile is None else profile.mask(cols)
+                  df[cols] = impute_knn_blocked(df[cols].to_numpy(dtype=float, na_value=np.nan), n_neighbors, max_memory_mb, n_jobs, mask)
+            elif engine == 'sklearn':
+                  imputer = KNNImputer(n_neighbors=n_neighbors)
+                  df[cols] = imputer.fit_transform(df[cols])
+            else:
+                  raise ValueError("k-NN engine must be 'blocked' or 'sklearn'")
+            if profile is not None:
+                  profile.refresh(df, cols)
 
             logger.info("Successfully imputed missing values with k-NN.")
             return df
@@ -145,63 +560,315 @@ def impute_knn(df, cols, n_neighbors=5):
             raise e
 
 
-def impute_with_regression(df, target_col, feature_cols):
+# Fitted regression models by (target, features, fingerprint of the training data), least recently used first.
+_regression_models = OrderedDict()
+REGRESSION_CACHE_SIZE = 64
+
+
+def _fit_regression(target_col, feature_cols, X, y, cache):
       """
-      Impute missing values in a column using regression.
+      Fit a LinearRegression, or reuse the one fitted on identical training data.
+
+      Parameters:
+            target_col (str): The target column, part of the cache key.
+            feature_cols (list): The feature columns, part of the cache key.
+            X (np.ndarray): Training features, one row per training row.
+            y (np.ndarray): Training targets.
+            cache (bool): Look the model up in, and store it into, the module's model cache.
+
+      Returns:
+            LinearRegression: The fitted model.
+      """
+      if not cache:
+            return LinearRegression().fit(X, y)
+      digest = hashlib.blake2b(digest_size=16)
+      for array in (X, y):
+            digest.update(str(array.shape).encode('utf-8'))
+            digest.update(np.ascontiguousarray(array).tobytes())
+      key = (target_col, tuple(feature_cols), digest.hexdigest())
+      model = _regression_models.get(key)
+      if model is None:
+            model = LinearRegression().fit(X, y)
+            _regression_models[key] = model
+            if len(_regression_models) > REGRESSION_CACHE_SIZE:
+                  _regression_models.popitem(last=False)
+      else:
+            _regression_models.move_to_end(key)
+            logger.info(f"Reusing the cached regression model for '{target_col}'.")
+      return model
+
+
+def impute_with_regression(df, target_col, feature_cols, cache=True, profile=None):
+      """
+      Impute missing values in one or more columns using regression.
+
+      Each target gets its own LinearRegression, trained on the rows where the target and every
+      feature are present, and fills only the rows where the target is missing and every feature is
+      present; rows with a missing feature stay missing. Features and targets are read once into a
+      single NumPy array, and every target is predicted from the original feature values, so the
+      result does not depend on the order of the targets.
 
       Parameters:
             df (pd.DataFrame): The input DataFrame.
-            target_col (str): The column with missing values to impute.
-            feature_cols (list or str): The columns to use as predictors.
+            target_col (list or str): The column(s) with missing values to impute.
+            feature_cols (list or str): The columns to use as predictors; a target listed here is not
+                  used to predict itself.
+            cache (bool): Reuse models fitted on identical training data in earlier calls (default is
+                  True). Models are keyed by target, features and a hash of the training rows, and the
+                  REGRESSION_CACHE_SIZE most recently used are kept.
+            profile (MissingnessProfile, optional): A profile of `df` covering the targets and
+                  features. The missing masks are then taken from it, and it is updated for the
+                  filled values.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
       """
       try:
+            if isinstance(target_col, str):
+                  target_col = [target_col]
             if isinstance(feature_cols, str):
                   feature_cols = [feature_cols]
 
-            # Drop rows where the target column is missing
-            non_null_df = df.dropna(subset=[target_col])
-
-            # Drop rows where the target column is missing and any of the feature columns are null
-            null_df = df[df[target_col].isnull() & df[feature_cols].notnull().all(axis=1)]
-
-            if not non_null_df.empty and not null_df.empty:
-                  # Train the regression model
-                  model = LinearRegression()
-                  model.fit(non_null_df[feature_cols], non_null_df[target_col])
-
-                  # Predict the missing target column values
-                  predicted_values = model.predict(null_df[feature_cols])
-
-                  # Replace the missing values with predicted values
-                  df.loc[df[target_col].isnull(), target_col] = predicted_values
-
-            logger.info(f"Successfully imputed missing values in '{target_col}' using regression.")
+            cols = list(dict.fromkeys(feature_cols + target_col))
+            position = {col: i for i, col in enumerate(cols)}
+            values = df[cols].to_numpy(dtype=float, na_value=np.nan)
+            if profile is None:
+                  missing = np.isnan(values)
+            else:
+                  profile.check(df, cols)
+                  missing = profile.mask(cols)
+
+            for target in target_col:
+                  features = [position[col] for col in feature_cols if col != target]
+                  if not features:
+                        raise ValueError(f"No feature columns left to predict '{target}'.")
+                  complete = ~missing[:, features].any(axis=1)
+                  target_missing = missing[:, position[target]]
+                  train_rows = np.flatnonzero(complete & ~target_missing)
+                  predict_rows = np.flatnonzero(complete & target_missing)
+
+                  if train_rows.size and predict_rows.size:
+                        # Train the regression model
+                        X = values[np.ix_(train_rows, features)]
+                        model = _fit_regression(target, [cols[i] for i in features], X,
+                                                values[train_rows, position[target]], cache)
+
+                        # Replace only the missing values that were predicted
+                        imputed = df[target].to_numpy(dtype=float, na_value=np.nan)
+                        imputed[predict_rows] = model.predict(values[np.ix_(predict_rows, features)])
+                        df[target] = imputed
+                        if profile is not None:
+                              profile.mark_filled(target, predict_rows)
+
+                  logger.info(f"Successfully imputed {predict_rows.size} missing values in '{target}' using regression.")
             return df
       except Exception as e:
             logger.error(f"Error in impute_with_regression: {e}")
             raise e
 
-def impute_mice(df, cols):
+class MICEImputer:
+      """
+      Chained-equations imputation with parallel rounds, early stopping and warm starts.
+
+      Missing values start at the column means. Every round then fits one regressor per column on
+      the rows where it is observed, using all other columns, and predicts the missing entries.
+      The regressors of a round are all fitted on the previous round's matrix, so they are fitted in
+      parallel on a thread pool; `IterativeImputer` refits after every column instead. The
+      predictions are still applied one column after another, each using the columns already
+      updated in the round: predicting every column from the previous matrix at once oscillates and
+      diverges when columns are strongly correlated. Rounds stop once the change between two rounds,
+      measured as in `IterativeImputer` by the largest sum over a row of the absolute changes, is
+      below `tol` times the largest observed magnitude, or after `max_iter` rounds.
+
+      A fitted imputer keeps its column means and last regressors. Calling `fit_transform` again on a
+      new batch warm-starts from them: the column-mean fill of the batch is first replaced by at most
+      `warm_rounds` prediction-only rounds with the saved regressors, which fit nothing, before the
+      refitting rounds. Both kinds of round count towards the same `max_iter` budget, so a warm start
+      never runs more rounds than a cold one may. `transform` runs prediction-only rounds alone, also at most `max_iter`.
+      The object pickles with its regressors.
+
+      Attributes:
+            estimators_ (list): The last fitted regressor per column (None for columns never fitted).
+            means_ (np.ndarray): Column means used for the initial fill.
+            history_ (list): Metrics of every round of the last `fit_transform` or `transform`:
+                  'iteration', 'refit' (False for prediction-only rounds), 'seconds', 'change',
+                  'tolerance' and 'converged'.
+            n_iter_ (int): Number of rounds of the last call.
+      """
+
+      def __init__(self, max_iter=10, tol=1e-3, estimator=None, n_jobs=None, warm_rounds=2):
+            """
+            Parameters:
+                  max_iter (int): Largest number of rounds of one `fit_transform` or `transform` call,
+                        prediction-only and refitting rounds together (default is 10).
+                  tol (float): Relative tolerance for early stopping (default is 1e-3).
+                  estimator: Regressor cloned for every column (default is `BayesianRidge()`, as in `IterativeImputer`).
+                  n_jobs (int): Threads fitting columns in parallel (default is None, one per CPU).
+                  warm_rounds (int): Largest number of prediction-only rounds before refitting on a warm
+                        start (default is 2). At least one round is always left for refitting.
+            """
+            self.max_iter = max_iter
+            self.tol = tol
+            self.warm_rounds = warm_rounds
+            self.estimator = estimator if estimator is not None else BayesianRidge()
+            self.n_jobs = n_jobs
+            self.estimators_ = None
+            self.means_ = None
+            self.history_ = []
+            self.n_iter_ = 0
+
+      def _round(self, Xt, mask, fit):
+            """
+            Run one round over the current matrix.
+
+            Returns:
+                  np.ndarray: The matrix with the missing entries re-predicted.
+            """
+            n_features = Xt.shape[1]
+            if fit:
+                  def fit_column(col):
+                        observed = ~mask[:, col]
+                        if not observed.any():
+                              return None
+                        others = np.arange(n_features) != col
+                        return clone(self.estimator).fit(Xt[observed][:, others], Xt[observed, col])
+
+                  with ThreadPoolExecutor(max_workers=self.n_jobs or os.cpu_count() or 1) as pool:
+                        self.estimators_ = list(pool.map(fit_column, range(n_features)))
+            new = Xt.copy()
+            for col, estimator in enumerate(self.estimators_):
+                  missing = mask[:, col]
+                  if estimator is not None and missing.any():
+                        new[missing, col] = estimator.predict(new[missing][:, np.arange(n_features) != col])
+            return new
+
+      def _iterate(self, X, fit):
+            X = np.asarray(X, dtype=float)
+            mask = np.isnan(X)
+            warm = self.estimators_ is not None
+            if self.means_ is None:
+                  with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', RuntimeWarning)
+                        self.means_ = np.nanmean(X, axis=0) if (~mask).any() else np.full(X.shape[1], np.nan)
+            elif len(self.means_) != X.shape[1]:
+                  raise ValueError(f"The imputer was fitted on {len(self.means_)} columns, got {X.shape[1]}.")
+            Xt = np.where(mask, self.means_, X)
+            self.history_, self.n_iter_ = [], 0
+            if X.shape[1] < 2 or not mask.any():
+                  return Xt
+            observed = np.abs(X[~mask])
+            tolerance = self.tol * (observed.max() if observed.size else 0.0)
+            # A warm start first fills the batch with the saved regressors, which only costs predictions.
+            # All rounds share `max_iter`.
+            if fit:
+                  warm_rounds = min(self.warm_rounds, self.max_iter - 1) if warm else 0
+                  phases = [(False, warm_rounds), (True, self.max_iter - warm_rounds)]
+            else:
+                  phases = [(False, self.max_iter)]
+            for refit, rounds in phases:
+                  for _ in range(rounds):
+                        start = time.perf_counter()
+                        new = self._round(Xt, mask, fit=refit)
+                        # The infinity norm of the change, IterativeImputer's stopping criterion.
+                        change = float(np.abs(new - Xt).sum(axis=1).max())
+                        Xt = new
+                        self.n_iter_ += 1
+                        converged = change < tolerance
+                        self.history_.append({'iteration': self.n_iter_, 'refit': refit, 'seconds': time.perf_counter() - start,
+                                              'change': change, 'tolerance': tolerance, 'converged': converged})
+                        if converged:
+                              break
+            logger.info(f"MICE ran {self.n_iter_} rounds; last change {self.history_[-1]['change']:.4g} "
+                        f"(tolerance {tolerance:.4g}).")
+            return Xt
+
+      def fit_transform(self, X):
+            """
+            Fit the regressors on `X` (warm-starting from earlier fits) and impute it.
+
+            Parameters:
+                  X (array-like): 2-D numeric data with NaN for missing values.
+
+            Returns:
+                  np.ndarray: The imputed data.
+            """
+            try:
+                  return self._iterate(X, fit=True)
+            except Exception as e:
+                  logger.error(f"Error in MICEImputer.fit_transform: {e}")
+                  raise e
+
+      def transform(self, X):
+            """
+            Impute `X` with the saved regressors, repeating rounds until the imputations settle.
+
+            Parameters:
+                  X (array-like): 2-D numeric data with the columns the imputer was fitted on.
+
+            Returns:
+                  np.ndarray: The imputed data.
+
+            Raises:
+                  NotFittedError: If the imputer has not been fitted.
+            """
+            if self.estimators_ is None:
+                  raise NotFittedError("This MICEImputer is not fitted yet; call 'fit_transform' first.")
+            try:
+                  return self._iterate(X, fit=False)
+            except Exception as e:
+                  logger.error(f"Error in MICEImputer.transform: {e}")
+                  raise e
+
+
+def impute_mice(df, cols, engine='sklearn', imputer=None, max_iter=None, tol=None, n_jobs=None, profile=None):
       """
       Impute missing values using the MICE (Multiple Imputation by Chained Equations) method.
 
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            engine (str): 'sklearn' (default) runs `IterativeImputer(max_iter=10)`; 'parallel' runs a
+                  `MICEImputer`, which fits the columns of each round in parallel and stops early.
+            imputer (MICEImputer, optional): A previously fitted imputer to warm-start from ('parallel' only).
+                  Its round metrics are in `imputer.history_` after the call.
+            max_iter (int): Largest number of rounds of a new 'parallel' imputer (default is 10; 'parallel' only).
+            tol (float): Early-stopping tolerance of a new 'parallel' imputer (default is 1e-3; 'parallel' only).
+            n_jobs (int): Threads of a new 'parallel' imputer (default is None, one per CPU; 'parallel' only).
+            profile (MissingnessProfile, optional): A profile of `df` covering `cols`. Nothing is fitted
+                  when it records no missing value in `cols`; otherwise the imputed columns are rescanned
+                  into it afterwards.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
+
+      Raises:
+            ValueError: If the engine is unknown, or a 'parallel' option is passed with the 'sklearn' engine.
       """
       try:
             if isinstance(cols, str):
                   cols = [cols]
 
             logger.info(f"Imputing missing values in columns {cols} using MICE.")
-            imputer = IterativeImputer(max_iter=10, random_state=0)
-            df[cols] = imputer.fit_transform(df[cols])
+            # Every column is a predictor of the others, so all of them are imputed together.
+            filled = _columns_to_fill(df, cols, profile)
+            if not filled:
+                  logger.info("No missing values to impute.")
+                  return df
+            if engine == 'sklearn':
+                  options = {'imputer': imputer, 'max_iter': max_iter, 'tol': tol, 'n_jobs': n_jobs}
+                  passed = [name for name, value in options.items() if value is not None]
+                  if passed:
+                        raise ValueError(f"{passed} only apply to the 'parallel' MICE engine.")
+                  imputer = IterativeImputer(max_iter=10, random_state=0)
+                  df[cols] = imputer.fit_transform(df[cols])
+            elif engine == 'parallel':
+                  if imputer is None:
+                        imputer = MICEImputer(10 if max_iter is None else max_iter, 1e-3 if tol is None else tol, n_jobs=n_jobs)
+                  df[cols] = imputer.fit_transform(df[cols].to_numpy(dtype=float, na_value=np.nan))
+            else:
+                  raise ValueError("MICE engine must be 'sklearn' or 'parallel'")
+            if profile is not None:
+                  profile.refresh(df, filled)
 
             logger.info("Successfully imputed missing values using MICE.")
             return df
@@ -210,15 +877,111 @@ def impute_mice(df, cols):
             raise e
 
 
-def impute_interpolation(df, cols, method='linear', order=2):
+def _ordered_groups(df, cols, group_col, order_col):
+      """
+      Lay out the columns to fill in fill order, with the group keys aligned to them.
+
+      Parameters:
+            df (pd.DataFrame): The input DataFrame.
+            cols (list): The columns to fill.
+            group_col (list or str): The column(s) defining the groups, or None.
+            order_col (list or str): The column(s) giving the fill order, or None for the frame order.
+
+      Returns:
+            tuple: (pd.DataFrame, list) the columns indexed by row position and sorted by `order_col`
+                  (stably, so ties keep the frame order), and the group keys as Series aligned to them
+                  (empty without `group_col`).
+      """
+      if isinstance(group_col, str):
+            group_col = [group_col]
+      if isinstance(order_col, str):
+            order_col = [order_col]
+      values = df[cols].set_axis(pd.RangeIndex(len(df)))
+      if order_col:
+            positions = df[order_col].set_axis(values.index).sort_values(order_col, kind='stable').index
+            values = values.loc[positions]
+      keys = [df[col].set_axis(pd.RangeIndex(len(df))).loc[values.index] for col in group_col or []]
+      return values, keys
+
+
+def _write_back(df, cols, filled):
+      """Assign values laid out by `_ordered_groups` back to the DataFrame, in its original row order."""
+      df[cols] = filled.sort_index().set_axis(df.index)
+      return df
+
+
+def _grouped_fill(df, cols, direction, group_col, order_col):
+      """
+      Forward or backward fill the columns within each group in one groupby pass.
+
+      Rows with a missing group key belong to no group and are left as they are.
+      """
+      values, keys = _ordered_groups(df, cols, group_col, order_col)
+      if keys:
+            grouped = values.groupby(keys, sort=False, observed=True, dropna=True)
+            filled = values.fillna(grouped.ffill() if direction == 'ffill' else grouped.bfill())
+      else:
+            filled = values.ffill() if direction == 'ffill' else values.bfill()
+      return _write_back(df, cols, filled)
+
+
+def _grouped_linear_interpolation(values, keys):
+      """
+      Linear interpolation within groups, treating consecutive rows as equally spaced.
+
+      Matches `Series.interpolate(method='linear')` applied to every group separately: gaps between
+      two values are interpolated, trailing gaps repeat the last value and leading gaps stay missing.
+      The previous and next known values and their positions within the group come from one forward
+      and one backward fill over all columns at once.
+
+      Parameters:
+            values (pd.DataFrame): Numeric columns, indexed by row position, in fill order.
+            keys (list): Group keys aligned to `values`.
+
+      Returns:
+            pd.DataFrame: The interpolated columns.
+      """
+      data = values.to_numpy(dtype=float, na_value=np.nan)
+      known = ~np.isnan(data)
+      # Factorize the keys once; rows with a missing key get no group number.
+      groups = values.groupby(keys, sort=False, observed=True, dropna=True).ngroup()
+      step = groups.groupby(groups).cumcount().to_numpy(dtype=float)[:, None]
+      width = data.shape[1]
+      combined = pd.DataFrame(np.hstack([data, np.where(known, step, np.nan)]), index=values.index)
+      grouped = combined.groupby(groups, sort=False)
+      before, after = grouped.ffill().to_numpy(), grouped.bfill().to_numpy()
+      previous, previous_step = before[:, :width], before[:, width:]
+      following, following_step = after[:, :width], after[:, width:]
+      with np.errstate(invalid='ignore', divide='ignore'):
+            between = previous + (following - previous) * (step - previous_step) / (following_step - previous_step)
+      interpolated = np.where(known, data, np.where(np.isnan(following), previous, between))
+      return pd.DataFrame(interpolated, index=values.index, columns=values.columns)
+
+
+def impute_interpolation(df, cols, method='linear', order=2, group_col=None, order_col=None, profile=None):
       """
       Impute missing values in specified columns using interpolation.
 
+      All columns are interpolated in one call. With `group_col`, every group (for example every
+      account name) is interpolated on its own, so values never leak between groups. Both methods
+      then treat consecutive rows of a group as equally spaced: a row's position is its rank within
+      its group, in `order_col` order. Linear interpolation runs as one vectorized groupby pass.
+      Polynomial interpolation fits every group separately in a Python loop, so its cost grows with
+      the number of groups; a group column with `order` or fewer known values cannot fit the
+      polynomial and is interpolated linearly.
+
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
             method (str): Interpolation method ('linear' or 'polynomial').
             order (int): The order of the polynomial for 'polynomial' interpolation.
+            group_col (list or str, optional): The column(s) defining the groups; rows with a missing
+                  key are left as they are. By default the whole frame is one group.
+            order_col (list or str, optional): The column(s) giving the interpolation order (ties keep
+                  the frame order). By default the frame order.
+            profile (MissingnessProfile, optional): A profile of `df` covering `cols`. Only the columns
+                  it records missing values in are interpolated, and they are rescanned into it
+                  afterwards (leading gaps stay missing).
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
@@ -226,18 +989,51 @@ def impute_interpolation(df, cols, method='linear', order=2):
       try:
             if isinstance(cols, str):
                   cols = [cols]
-                  
-
-            for col in cols:
-                  if method == 'linear':
-                        logger.info(f"Imputing missing values in column '{col}' using linear interpolation.")
-                        df[col] = df[col].interpolate(method='linear')
-                  elif method == 'polynomial':
-                        logger.info(f"Imputing missing values in column '{col}' using polynomial interpolation of order {order}.")
-                        df[col] = df[col].interpolate(method='polynomial', order=order)
+            if method not in ('linear', 'polynomial'):
+                  raise ValueError("Interpolation method must be 'linear' or 'polynomial'")
+            cols = _columns_to_fill(df, cols, profile)
+            if not cols:
+                  logger.info("No missing values to interpolate.")
+                  return df
+
+            if group_col is None and order_col is None:
+                  logger.info(f"Imputing missing values in columns {cols} using {method} interpolation.")
+                  kwargs = {'order': order} if method == 'polynomial' else {}
+                  df[cols] = df[cols].interpolate(method=method, **kwargs)
+                  if profile is not None:
+                        profile.refresh(df, cols)
+                  logger.info("Successfully imputed missing values using interpolation.")
+                  return df
+
+            logger.info(f"Imputing missing values in columns {cols} using {method} interpolation "
+                        f"within groups of {group_col} ordered by {order_col}.")
+            values, keys = _ordered_groups(df, cols, group_col, order_col)
+            if not keys:
+                  # One ordered group: interpolate by position, not by the original index labels.
+                  keys = [pd.Series(0, index=values.index)]
+            if method == 'linear':
+                  filled = _grouped_linear_interpolation(values, keys)
+            else:
+                  # A polynomial of this order needs more than `order` known points; columns of smaller
+                  # groups, common when grouping by account, are interpolated linearly instead. Each group
+                  # is fitted against its own row ranks, the positions linear interpolation uses.
+                  def interpolate_column(column):
+                        if column.count() > order:
+                              return column.interpolate(method='polynomial', order=order)
+                        return column.interpolate(method='linear')
+
+                  positional = values.reset_index(drop=True)
+                  grouped = positional.groupby([key.reset_index(drop=True) for key in keys], sort=False, observed=True, dropna=True)
+                  parts = [group.reset_index(drop=True).apply(interpolate_column).set_axis(group.index)
+                           for _, group in grouped]
+                  if parts:
+                        filled = values.fillna(pd.concat(parts).reindex(positional.index).set_axis(values.index))
                   else:
-                        raise ValueError("Interpolation method must be 'linear' or 'polynomial'")
-            
+                        filled = values
+            _write_back(df, cols, filled)
+            if profile is not None:
+                  profile.refresh(df, cols)
+
             logger.info("Successfully imputed missing values using interpolation.")
             return df
       except Exception as e:
@@ -245,13 +1041,22 @@ def impute_interpolation(df, cols, method='linear', order=2):
             raise e
 
 
-def impute_backward_fill(df, cols):
+def impute_backward_fill(df, cols, group_col=None, order_col=None, profile=None):
       """
       Impute missing values in specified columns using backward fill.
 
+      All columns are filled in one call; with `group_col`, in one groupby pass that only fills from
+      rows of the same group.
+
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            group_col (list or str, optional): The column(s) defining the groups; rows with a missing
+                  key are left as they are. By default the whole frame is one group.
+            order_col (list or str, optional): The column(s) giving the fill order (ties keep the frame
+                  order). By default the frame order.
+            profile (MissingnessProfile, optional): A profile of `df` covering `cols`. Only the columns
+                  it records missing values in are filled, and they are rescanned into it afterwards.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
@@ -260,9 +1065,15 @@ def impute_backward_fill(df, cols):
             if isinstance(cols, str):
                   cols = [cols]
 
-            for col in cols:
-                  logger.info(f"Imputing missing values in column '{col}' using backward fill.")
-                  df[col] = df[col].fillna(method='bfill')
+            cols = _columns_to_fill(df, cols, profile)
+            if not cols:
+                  logger.info("No missing values to fill.")
+                  return df
+
+            logger.info(f"Imputing missing values in columns {cols} using backward fill.")
+            _grouped_fill(df, cols, 'bfill', group_col, order_col)
+            if profile is not None:
+                  profile.refresh(df, cols)
 
             logger.info("Successfully imputed missing values using backward fill.")
             return df
@@ -271,13 +1082,22 @@ def impute_backward_fill(df, cols):
             raise e
 
 
-def impute_forward_fill(df, cols):
+def impute_forward_fill(df, cols, group_col=None, order_col=None, profile=None):
       """
       Impute missing values in specified columns using forward fill.
 
+      All columns are filled in one call; with `group_col`, in one groupby pass that only fills from
+      rows of the same group.
+
       Parameters:
             df (pd.DataFrame): The input DataFrame.
             cols (list or str): The column(s) to impute.
+            group_col (list or str, optional): The column(s) defining the groups; rows with a missing
+                  key are left as they are. By default the whole frame is one group.
+            order_col (list or str, optional): The column(s) giving the fill order (ties keep the frame
+                  order). By default the frame order.
+            profile (MissingnessProfile, optional): A profile of `df` covering `cols`. Only the columns
+                  it records missing values in are filled, and they are rescanned into it afterwards.
 
       Returns:
             pd.DataFrame: The DataFrame with missing values imputed.
@@ -286,13 +1106,18 @@ def impute_forward_fill(df, cols):
             if isinstance(cols, str):
                   cols = [cols]
 
-            for col in cols:
-                  logger.info(f"Imputing missing values in column '{col}' using forward fill.")
-                  df[col] = df[col].fillna(method='ffill')
+            cols = _columns_to_fill(df, cols, profile)
+            if not cols:
+                  logger.info("No missing values to fill.")
+                  return df
+
+            logger.info(f"Imputing missing values in columns {cols} using forward fill.")
+            _grouped_fill(df, cols, 'ffill', group_col, order_col)
+            if profile is not None:
+                  profile.refresh(df, cols)
 
             logger.info("Successfully imputed missing values using forward fill.")
             return df
       except Exception as e:
             logger.error(f"Error in impute_forward_fill: {e}")
             raise e
-
@@ -0,0 +1,270 @@
+"""
+Incremental Processing Module.
+This module keeps a cleaned copy of an append-only CSV up to date by processing only the rows
+appended since the previous run, instead of rerunning `RawDataProcessor` and
+`DataCleanerAndTransformer` over the whole file.
+
+Classes:
+- IncrementalProcessor: Remembers how far into the CSV it has processed and merges newly appended
+      rows into the stored result.
+
+Notes:
+- The raw processing stages and the column transformation, rating update and row filters only
+      look at the row they process, so they run on the new rows alone.
+- `drop_duplicates` is kept exact by storing a hash of every row it has kept so far: new rows that
+      repeat an earlier row, or each other, are dropped, and the kept rows are numbered on from the
+      rows already stored, just as `reset_index` would number them in a full run.
+- `impute_price` needs the median over every row, so the stored rows are kept as they were before
+      imputation and the imputation and the filters after it are rerun over all of them. These are
+      whole-column array operations and cost a small fraction of the text processing.
+- Checking that the processed prefix is unchanged means hashing all of it, so every update reads
+      the whole file once (hashing runs at disk speed, far faster than the text processing).
+"""
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from data_cleaning_and_transformation import DataCleanerAndTransformer
+from processed_cache import hash_parameters
+
+# Largest number of bytes read at once while hashing the processed prefix.
+_HASH_BLOCK_BYTES = 1 << 22
+
+
+class IncrementalProcessor:
+      """
+      Incrementally maintained cleaned frame for an append-only CSV.
+
+      State is kept in a version directory inside `state_dir`, named by the `CURRENT` file:
+      - state.pkl: byte offset of the end of the last processed row, number of raw rows read, a
+            hash of every byte before the offset, the parameter hash, the deduplicated rows after
+            `update_rating_col` (before `impute_price`) and the hashes of the rows `drop_duplicates`
+            has kept.
+      - cleaned.pkl: the cleaned result of the last update (see `load_cleaned`).
+      Each update writes a new version directory and then renames a new `CURRENT` over the old one,
+      so the state and the cleaned rows are replaced together in one step and always match.
+
+      If the file no longer starts with the bytes that were processed (any of them was rewritten, or
+      the file was truncated) or the parameters changed, the state is discarded and the file is
+      processed from the start.
+
+      Attributes:
+            cleaner (DataCleanerAndTransformer): Supplies the processing and cleaning steps.
+            csv_path (str): The CSV being followed.
+            state_dir (str): Directory holding the stored state.
+      """
+
+      def __init__(self, parameter_dict, state_dir, csv_path=None, logging_level='INFO'):
+            """
+            Args:
+                  parameter_dict (ConfigParameters): Configuration parameters.
+                  state_dir (str): Directory for the stored state; created if missing.
+                  csv_path (str, optional): The CSV to follow (default is the configured 'CSV_URL').
+                  logging_level (str): Either "DEBUG" or "INFO" (default is "INFO").
+            """
+            self.cleaner = DataCleanerAndTransformer(parameter_dict, logging_level, process_on_init=False)
+            self.csv_path = csv_path or self.cleaner.csv_path
+            self.cleaner.csv_path = self.csv_path
+            self.parameter_hash = hash_parameters(self.cleaner.parameter_dict)
+            self.state_dir = state_dir
+            os.makedirs(state_dir, exist_ok=True)
+            self.initialize_logging(logging_level)
+
+      def initialize_logging(self, logging_level):
+            """
+            Sets up logging for the class instance.
+            Inputs: None
+            Args:
+                  logging_level : str
+                  The logging level for the logger ("DEBUG" or "INFO").
+            """
+            logger_name = __name__ + ".IncrementalProcessor"
+            self.logger = logging.getLogger(logger_name)
+            self.logger.propagate = False
+
+            levels = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO}
+            log_level = levels.get(logging_level.upper(), logging.INFO)
+            self.logger.setLevel(log_level)
+
+            if not self.logger.handlers:
+                  console_handler = logging.StreamHandler()
+                  formatter = logging.Formatter('%(asctime)s : %(name)s - %(levelname)s - %(message)s')
+                  console_handler.setFormatter(formatter)
+                  self.logger.addHandler(console_handler)
+
+      def _path(self, name):
+            return os.path.join(self.state_dir, name)
+
+      def _hash_range(self, f, digest, start, end):
+            """Add the bytes of `f` between two offsets to a running hash."""
+            f.seek(start)
+            while start < end:
+                  block = f.read(min(_HASH_BLOCK_BYTES, end - start))
+                  if not block:
+                        break
+                  digest.update(block)
+                  start += len(block)
+
+      def _current_version(self):
+            """Return the directory of the stored state, or None if nothing has been stored."""
+            try:
+                  with open(self._path('CURRENT'), encoding='utf-8') as f:
+                        return self._path(f.read().strip())
+            except FileNotFoundError:
+                  return None
+
+      def _load_state(self, f):
+            """
+            Load the stored state if the current file still starts with every byte it describes.
+
+            Returns:
+                  tuple or None: (state, digest) the state and the running hash of the bytes before its
+                        offset, or None if processing must start from the beginning.
+            """
+            version = self._current_version()
+            if version is None:
+                  return None
+            try:
+                  state = pd.read_pickle(os.path.join(version, 'state.pkl'))
+            except (OSError, ValueError, EOFError):
+                  return None
+            size = os.fstat(f.fileno()).st_size
+            if (state.get('csv_path') != os.path.abspath(self.csv_path)
+                        or state.get('parameter_hash') != self.parameter_hash
+                        or state['offset'] > size):
+                  self.logger.info('Stored State No Longer Matches the CSV or Parameters; Reprocessing From the Start')
+                  return None
+            digest = hashlib.blake2b(digest_size=16)
+            self._hash_range(f, digest, 0, state['offset'])
+            if digest.hexdigest() != state['fingerprint']:
+                  self.logger.info('The Processed Part of the CSV Was Rewritten; Reprocessing From the Start')
+                  return None
+            return state, digest
+
+      def _save(self, state, cleaned):
+            """Store the state and the cleaned rows in a new version directory and make it current."""
+            version = tempfile.mkdtemp(prefix='version-', dir=self.state_dir)
+            pd.to_pickle(state, os.path.join(version, 'state.pkl'))
+            pd.to_pickle(cleaned, os.path.join(version, 'cleaned.pkl'))
+            with open(self._path('CURRENT.tmp'), 'w', encoding='utf-8') as f:
+                  f.write(os.path.basename(version))
+            os.replace(self._path('CURRENT.tmp'), self._path('CURRENT'))
+            # Earlier versions, including any left by an interrupted update.
+            for name in os.listdir(self.state_dir):
+                  if name.startswith('version-') and name != os.path.basename(version):
+                        shutil.rmtree(self._path(name), ignore_errors=True)
+
+      def load_cleaned(self):
+            """
+            Return the cleaned frame stored by the last update.
+
+            Returns:
+                  pd.DataFrame or None: The cleaned frame, or None if no update has been stored.
+            """
+            version = self._current_version()
+            return None if version is None else pd.read_pickle(os.path.join(version, 'cleaned.pkl'))
+
+      def _last_row_end(self, f, offset, block_size=1 << 22):
+            """
+            Find the end of the last complete row at or after `offset`.
+
+            A line break only ends a row when it is outside a quoted field. The quote parity is tracked
+            with array operations over blocks of at most `block_size` bytes, starting from `offset`,
+            which is always a row boundary.
+
+            Returns:
+                  int: The offset just past the last complete row, or `offset` if no row has been completed since.
+            """
+            f.seek(offset)
+            position, last_end, parity = offset, offset, 0
+            for block in iter(lambda: f.read(block_size), b''):
+                  data = np.frombuffer(block, dtype=np.uint8)
+                  # uint8 cumulative sums wrap at 256, which keeps their parity.
+                  quoted = (np.cumsum(data == ord('"'), dtype=np.uint8) + parity) % 2
+                  row_ends = np.flatnonzero((data == ord('\n')) & (quoted == 0))
+                  if len(row_ends):
+                        last_end = position + int(row_ends[-1]) + 1
+                  parity = int(quoted[-1])
+                  position += len(block)
+            return last_end
+
+      def _clean_new_rows(self, processed, known_hashes, first_label):
+            """
+            Run the row-local cleaning steps on newly processed rows and drop repeats of earlier rows.
+
+            Returns:
+                  tuple: (pd.DataFrame, np.ndarray) the new pre-impute rows, indexed from `first_label`,
+                        and their row hashes.
+            """
+            self.cleaner.df = processed
+            transformed = self.cleaner.transform_columns()
+            hashes = pd.util.hash_pandas_object(transformed, index=False).to_numpy()
+            keep = ~(np.isin(hashes, known_hashes) | pd.Series(hashes).duplicated().to_numpy())
+            new_rows = transformed[keep].copy()
+            new_rows.index = pd.RangeIndex(first_label, first_label + len(new_rows))
+            if not new_rows.empty:
+                  self.cleaner.df = new_rows
+                  new_rows = self.cleaner.update_rating_col()
+            return new_rows, hashes[keep]
+
+      def update(self):
+            """
+            Process the rows appended since the last update and return the merged cleaned frame.
+
+            Only whole rows (ending in a line break) are processed; a partly written last row is picked
+            up by the next update.
+
+            Returns:
+                  pd.DataFrame: The cleaned frame for the whole CSV, equal to
+                        `DataCleanerAndTransformer.clean_and_transform` run on the full file.
+
+            Raises:
+                  Exception: Propagates any exceptions raised while reading, processing or saving.
+            """
+            try:
+                  with open(self.csv_path, 'rb') as f:
+                        header = f.readline()
+                        header_end = f.tell()
+                        columns = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+                        loaded = self._load_state(f)
+                        if loaded is None:
+                              state = {'offset': header_end, 'raw_rows': 0,
+                                       'pre_impute': None, 'row_hashes': np.empty(0, dtype=np.uint64)}
+                              digest = hashlib.blake2b(digest_size=16)
+                              self._hash_range(f, digest, 0, header_end)
+                        else:
+                              state, digest = loaded
+                        end = self._last_row_end(f, state['offset'])
+                        pre_impute, row_hashes = state['pre_impute'], state['row_hashes']
+                        raw_rows = state['raw_rows']
+                        if end > state['offset']:
+                              processed, n_raw = self.cleaner.process_byte_range(state['offset'], end, columns)
+                              processed.index = processed.index + raw_rows
+                              raw_rows += n_raw
+                              first_label = 0 if pre_impute is None else len(pre_impute)
+                              new_rows, new_hashes = self._clean_new_rows(processed, row_hashes, first_label)
+                              pre_impute = new_rows if pre_impute is None else pd.concat([pre_impute, new_rows])
+                              row_hashes = np.concatenate([row_hashes, new_hashes])
+                              self.logger.info(f'Processed {n_raw} Appended Rows; {len(new_rows)} New Unique Rows')
+                        else:
+                              self.logger.info('No Appended Rows to Process')
+                        self._hash_range(f, digest, state['offset'], end)
+                        fingerprint = digest.hexdigest()
+
+                  if pre_impute is None:
+                        raise ValueError('The CSV contains no data rows.')
+                  self.cleaner.df = pre_impute.copy()
+                  self.cleaner.impute_price()
+                  cleaned = self.cleaner.drop_incomplete_rows()
+                  self._save({'csv_path': os.path.abspath(self.csv_path), 'offset': end, 'raw_rows': raw_rows,
+                              'fingerprint': fingerprint, 'parameter_hash': self.parameter_hash,
+                              'pre_impute': pre_impute, 'row_hashes': row_hashes},
+                             cleaned)
+                  return cleaned
+            except Exception as e:
+                  self.logger.error(f'Incremental Update Failed. Error {e}')
+                  raise e
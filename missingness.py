@@ -0,0 +1,143 @@
+"""
+Missingness Module.
+This module records where a frame's values are missing in one scan, so that row and column
+selection and the imputers can work from stored masks and counts instead of rescanning for nulls.
+
+Classes:
+- MissingnessProfile: Packed null bitmask per column plus per-row and per-column null counts.
+
+Notes:
+- Each column's null mask is stored with `np.packbits`, one bit per row: one eighth of a boolean
+      mask and one sixty-fourth of the float column it describes.
+- Masks of several columns are combined on the packed bytes (a bitwise OR for "any missing"), and
+      only the result is unpacked.
+- The profile describes the frame as it was scanned. Imputers that receive a profile update it for
+      the values they fill (`mark_filled`), or rescan only the columns they changed (`refresh`).
+"""
+import numpy as np
+import pandas as pd
+
+
+class MissingnessProfile:
+      """
+      Null bitmasks and null counts of a frame, computed in one scan.
+
+      Attributes:
+            columns (list): The columns profiled.
+            index (pd.Index): The index of the frame scanned; rows are addressed by position.
+            n_rows (int): Number of rows.
+            bitmasks (np.ndarray): uint8 array of shape (len(columns), ceil(n_rows / 8)); row i of
+                  a column is missing when bit i of its row of bytes is set.
+            row_null_counts (np.ndarray): Number of missing profiled values in every row.
+            column_null_counts (pd.Series): Number of missing values in every column.
+      """
+
+      def __init__(self, df, cols=None):
+            """
+            Parameters:
+                  df (pd.DataFrame): The frame to scan.
+                  cols (list or str, optional): The columns to profile (default is every column).
+            """
+            if isinstance(cols, str):
+                  cols = [cols]
+            self.columns = list(df.columns) if cols is None else list(cols)
+            self.index = df.index
+            self.n_rows = len(df)
+            mask = df[self.columns].isna().to_numpy(dtype=bool)
+            self.bitmasks = np.packbits(mask.T, axis=1)
+            self.row_null_counts = mask.sum(axis=1)
+            self.column_null_counts = pd.Series(mask.sum(axis=0), index=self.columns)
+            self._positions = {col: i for i, col in enumerate(self.columns)}
+
+      def _rows(self, col):
+            return self.bitmasks[self._positions[col]]
+
+      def check(self, df, cols=None):
+            """
+            Check that the profile describes a frame.
+
+            Parameters:
+                  df (pd.DataFrame): The frame.
+                  cols (list, optional): The columns that must be profiled (default is every column of `df`).
+
+            Raises:
+                  ValueError: If the frame has different rows or a column is not profiled.
+            """
+            if len(df) != self.n_rows or not (df.index is self.index or df.index.equals(self.index)):
+                  raise ValueError("The missingness profile was computed on a frame with different rows.")
+            missing = [col for col in (df.columns if cols is None else cols) if col not in self._positions]
+            if missing:
+                  raise ValueError(f"Columns {missing} are not in the missingness profile.")
+
+      def column_mask(self, col):
+            """
+            Parameters:
+                  col (str): A profiled column.
+
+            Returns:
+                  np.ndarray: Boolean mask, True where the column is missing.
+            """
+            return np.unpackbits(self._rows(col), count=self.n_rows).astype(bool)
+
+      def mask(self, cols=None):
+            """
+            Parameters:
+                  cols (list, optional): Profiled columns (default is every column).
+
+            Returns:
+                  np.ndarray: Boolean array of shape (n_rows, len(cols)), True where a value is missing.
+            """
+            cols = self.columns if cols is None else cols
+            rows = self.bitmasks[[self._positions[col] for col in cols]]
+            return np.unpackbits(rows, axis=1, count=self.n_rows).astype(bool).T
+
+      def any_missing(self, cols=None):
+            """
+            Parameters:
+                  cols (list, optional): Profiled columns (default is every column).
+
+            Returns:
+                  np.ndarray: Boolean mask, True for rows missing a value in any of `cols`.
+            """
+            cols = self.columns if cols is None else cols
+            if not cols:
+                  return np.zeros(self.n_rows, dtype=bool)
+            packed = np.bitwise_or.reduce(self.bitmasks[[self._positions[col] for col in cols]], axis=0)
+            return np.unpackbits(packed, count=self.n_rows).astype(bool)
+
+      def mark_filled(self, col, rows=None):
+            """
+            Record that missing values of a column were filled.
+
+            Parameters:
+                  col (str): A profiled column.
+                  rows (np.ndarray, optional): Positions of the filled rows (default is every row).
+            """
+            filled = self.column_mask(col)
+            if rows is not None:
+                  keep = np.zeros(self.n_rows, dtype=bool)
+                  keep[rows] = True
+                  filled &= keep
+            self.row_null_counts -= filled
+            self.column_null_counts[col] -= int(filled.sum())
+            self.bitmasks[self._positions[col]] = np.packbits(self.column_mask(col) & ~filled)
+
+      def refresh(self, df, cols):
+            """
+            Rescan some columns of the frame after they changed.
+
+            Parameters:
+                  df (pd.DataFrame): The frame the profile describes.
+                  cols (list or str): Profiled columns to rescan.
+            """
+            if isinstance(cols, str):
+                  cols = [cols]
+            for col in cols:
+                  old, new = self.column_mask(col), df[col].isna().to_numpy(dtype=bool)
+                  self.row_null_counts += new.astype(np.intp) - old
+                  self.column_null_counts[col] = int(new.sum())
+                  self.bitmasks[self._positions[col]] = np.packbits(new)
+
+      def __repr__(self):
+            return (f'MissingnessProfile({self.n_rows} rows, {len(self.columns)} columns, '
+                    f'{int(self.column_null_counts.sum())} missing)')
@@ -89,6 +89,12 @@ class ConfigParameters:
                 'zero_orders': (r'\b(?:new|brand|mpya|newly|custom.)\b', re.IGNORECASE)
             },
             'condition_pattern': (r'\bnew\b', re.I), 
+            'price_pattern': (r'^\s*(?P<currency>[a-z]{2,4}|[$€£])?\.?\s*(?P<amount>\d[\d,]*(?:\.\d+)?)', re.I),
+            'base_currency': 'KES',
+            # Units of `base_currency` per unit of each currency; prices in currencies not listed here become NaN.
+            'currency_rates': {
+                'KES': 1.0
+            },
             'rating_patterns': {
                 'new_unranked': (r'\b(new|unranked|not|yet)\b', re.I),
                 'percentage': (r'(\d+(\.\d+)?)%', re.I),
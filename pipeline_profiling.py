@@ -0,0 +1,149 @@
+"""
+Pipeline Profiling Module.
+This module records per-stage measurements for `RawDataProcessor` and `DataCleanerAndTransformer`
+so that the stages dominating runtime or memory can be identified.
+
+Classes:
+- PipelineProfiler: Wraps each pipeline stage and records its wall time, CPU time, rows in and
+      out, peak memory increase and the memory footprint of the resulting frame.
+- ProfilingReport: The structured result, convertible to a DataFrame, a dictionary or JSON.
+
+Notes:
+- Profiling is opt-in (`profile=True` on the processors). When it is off, each stage costs one
+      extra `is None` check.
+- Peak memory is measured with `tracemalloc`, which NumPy and pandas report their buffers to. It
+      only runs while a stage is being profiled.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+import pandas as pd
+
+
+class ProfilingReport:
+      """
+      Per-stage measurements of one or more pipeline runs.
+
+      Attributes:
+            stages (list): One dictionary per stage run, in execution order, with the keys 'stage',
+                  'wall_seconds', 'cpu_seconds', 'rows_in', 'rows_out', 'peak_memory_delta_bytes' and
+                  'frame_memory_bytes'.
+            dedup (dict): Distinct-value counts recorded by `RawDataProcessor`, per raw text column.
+      """
+
+      def __init__(self, stages, dedup=None):
+            self.stages = stages
+            self.dedup = dedup or {}
+
+      def to_frame(self):
+            """
+            Returns:
+                  pd.DataFrame: One row per stage run.
+            """
+            return pd.DataFrame(self.stages)
+
+      def to_dict(self):
+            """
+            Returns:
+                  dict: The stages, the dedup statistics and the totals.
+            """
+            return {
+                  'stages': self.stages,
+                  'dedup': self.dedup,
+                  'total_wall_seconds': sum(stage['wall_seconds'] for stage in self.stages),
+                  'total_cpu_seconds': sum(stage['cpu_seconds'] for stage in self.stages),
+            }
+
+      def to_json(self, path=None, indent=2):
+            """
+            Serialize the report as JSON, optionally writing it to a file.
+
+            Args:
+                  path (str, optional): File to write the JSON to.
+                  indent (int): JSON indentation (default is 2).
+
+            Returns:
+                  str: The JSON document.
+            """
+            document = json.dumps(self.to_dict(), indent=indent)
+            if path is not None:
+                  with open(path, 'w') as f:
+                        f.write(document)
+            return document
+
+      def __repr__(self):
+            return f'ProfilingReport({len(self.stages)} stages)\n{self.to_frame().to_string(index=False)}'
+
+
+class PipelineProfiler:
+      """
+      Records measurements for every stage run through `stage`.
+
+      Attributes:
+            records (list): The measurements collected so far, one dictionary per stage run.
+            trace_memory (bool): Whether peak memory is traced with `tracemalloc`.
+      """
+
+      def __init__(self, trace_memory=True):
+            """
+            Args:
+                  trace_memory (bool): Trace peak memory per stage (default is True). Tracing slows
+                        allocation-heavy stages down, so it can be switched off for timing-only runs.
+            """
+            self.records = []
+            self.trace_memory = trace_memory
+
+      @staticmethod
+      def _rows(df):
+            return len(df) if isinstance(df, pd.DataFrame) else None
+
+      @contextmanager
+      def stage(self, name, owner):
+            """
+            Measure one stage.
+
+            Args:
+                  name (str): Name under which the stage is recorded.
+                  owner: Object whose `df` attribute holds the frame the stage reads and writes.
+
+            Yields:
+                  None
+            """
+            rows_in = self._rows(owner.df)
+            started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+            if started_tracing:
+                  tracemalloc.start()
+            if self.trace_memory:
+                  tracemalloc.reset_peak()
+                  memory_before = tracemalloc.get_traced_memory()[0]
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                  yield
+            finally:
+                  wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+                  peak_delta = None
+                  if self.trace_memory:
+                        peak_delta = tracemalloc.get_traced_memory()[1] - memory_before
+                        if started_tracing:
+                              tracemalloc.stop()
+                  df = owner.df
+                  self.records.append({
+                        'stage': name,
+                        'wall_seconds': wall,
+                        'cpu_seconds': cpu,
+                        'rows_in': rows_in,
+                        'rows_out': self._rows(df),
+                        'peak_memory_delta_bytes': peak_delta,
+                        'frame_memory_bytes': int(df.memory_usage(deep=True).sum()) if isinstance(df, pd.DataFrame) else None,
+                  })
+
+      def report(self, dedup=None):
+            """
+            Args:
+                  dedup (dict, optional): Distinct-value statistics to include.
+
+            Returns:
+                  ProfilingReport: The measurements collected so far.
+            """
+            return ProfilingReport(list(self.records), dedup)
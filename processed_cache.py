@@ -0,0 +1,238 @@
+"""
+Processed Data Cache Module.
+This module provides a persistent, content-addressed cache for the output of
+`RawDataProcessor.process`, so that repeated runs on an unchanged CSV and unchanged
+configuration skip the processing entirely.
+
+Classes:
+- ProcessedDataCache: Stores processed frames on disk keyed by the hash of the input bytes,
+      a stable hash of the parameter dictionary and a hash of the processing code.
+
+Notes:
+- Frames are stored as uncompressed Feather (Arrow IPC) files when `pyarrow` is installed, and
+      pickle files otherwise. Feather files are opened memory-mapped, so no intermediate Arrow copy of
+      the file is allocated, but the conversion to pandas copies every column: a loaded frame takes
+      as much memory as a freshly processed one, with the same dtypes.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import pandas as pd
+
+try:
+      import pyarrow.feather as feather
+except ImportError:
+      feather = None
+
+# Modules whose source takes part in the key, so editing the loading or processing code invalidates
+# old entries.
+_PROCESSING_MODULES = ('data_ingestion.py', 'raw_data_processor.py', 'vectorized_extractors.py')
+_INDEX_COLUMN = '__row__'
+
+
+def _canonical(obj):
+      """
+      Convert a parameter value into a JSON-serializable form that is stable across runs.
+
+      Dictionaries keep their order, since pattern dictionaries are matched first-match-wins.
+
+      Args:
+            obj: A value from the parameter dictionary.
+
+      Returns:
+            A structure of lists, strings and numbers.
+      """
+      if isinstance(obj, dict):
+            return [['dict']] + [[_canonical(key), _canonical(value)] for key, value in obj.items()]
+      if isinstance(obj, (list, tuple)):
+            return [_canonical(value) for value in obj]
+      if isinstance(obj, re.RegexFlag):
+            return int(obj)
+      if obj is None or isinstance(obj, (str, int, float, bool)):
+            return obj
+      return repr(obj)
+
+
+def hash_parameters(parameters):
+      """
+      Compute a stable hash of a parameter dictionary (patterns, mappings, column lists).
+
+      Args:
+            parameters (dict or ConfigParameters): The configuration.
+
+      Returns:
+            str: Hex digest of the canonical JSON form of the parameters.
+      """
+      parameters = getattr(parameters, 'parameters', parameters)
+      payload = json.dumps(_canonical(parameters), separators=(',', ':'))
+      return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def hash_file(path, block_size=1 << 20):
+      """
+      Hash the bytes of a file without loading it into memory.
+
+      Args:
+            path (str): Path to the file.
+            block_size (int): Number of bytes read at a time.
+
+      Returns:
+            str: Hex digest of the file contents.
+      """
+      digest = hashlib.blake2b(digest_size=16)
+      with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                  digest.update(block)
+      return digest.hexdigest()
+
+
+class ProcessedDataCache:
+      """
+      A directory of processed DataFrames addressed by the content they were computed from.
+
+      Every entry is a data file plus a small JSON sidecar recording the source path it was built
+      from. When a new entry is stored, older entries for the same source are stale (the file or the
+      configuration changed) and are evicted, and the least recently used entries beyond
+      `max_entries` are removed.
+
+      Attributes:
+            cache_dir (str): Directory holding the cache entries.
+            max_entries (int): Largest number of entries kept.
+      """
+
+      def __init__(self, cache_dir, max_entries=8, logging_level='INFO'):
+            """
+            Args:
+                  cache_dir (str): Directory holding the cache entries; created if missing.
+                  max_entries (int): Largest number of entries kept (default is 8).
+                  logging_level (str): Either "DEBUG" or "INFO" (default is "INFO").
+            """
+            self.cache_dir = cache_dir
+            self.max_entries = max_entries
+            self.extension = '.feather' if feather is not None else '.pkl'
+            os.makedirs(cache_dir, exist_ok=True)
+            self.initialize_logging(logging_level)
+
+      def initialize_logging(self, logging_level):
+            """
+            Sets up logging for the class instance.
+            Inputs: None
+            Args:
+                  logging_level : str
+                  The logging level for the logger ("DEBUG" or "INFO").
+            """
+            logger_name = __name__ + ".ProcessedDataCache"
+            self.logger = logging.getLogger(logger_name)
+            self.logger.propagate = False
+
+            levels = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO}
+            log_level = levels.get(logging_level.upper(), logging.INFO)
+            self.logger.setLevel(log_level)
+
+            if not self.logger.handlers:
+                  console_handler = logging.StreamHandler()
+                  formatter = logging.Formatter('%(asctime)s : %(name)s - %(levelname)s - %(message)s')
+                  console_handler.setFormatter(formatter)
+                  self.logger.addHandler(console_handler)
+
+      def key(self, source_path, parameters):
+            """
+            Build the cache key for a source file processed with the given parameters.
+
+            Args:
+                  source_path (str): Path to the input CSV.
+                  parameters (dict or ConfigParameters): The configuration used to process it.
+
+            Returns:
+                  str: Key combining the input, configuration and processing-code hashes.
+            """
+            code = hashlib.blake2b(digest_size=8)
+            here = os.path.dirname(os.path.abspath(__file__))
+            for module in _PROCESSING_MODULES:
+                  with open(os.path.join(here, module), 'rb') as f:
+                        code.update(f.read())
+            return f'{hash_file(source_path)}-{hash_parameters(parameters)}-{code.hexdigest()}'
+
+      def _paths(self, key):
+            base = os.path.join(self.cache_dir, key)
+            return base + self.extension, base + '.json'
+
+      def load(self, key):
+            """
+            Load a cached frame.
+
+            Args:
+                  key (str): Key returned by `key`.
+
+            Returns:
+                  pd.DataFrame or None: The cached frame, or None on a cache miss.
+            """
+            data_path, meta_path = self._paths(key)
+            if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+                  return None
+            try:
+                  if feather is not None:
+                        # The mapped table is zero-copy; `to_pandas` materialises the frame in memory.
+                        df = feather.read_table(data_path, memory_map=True).to_pandas()
+                  else:
+                        df = pd.read_pickle(data_path)
+            except Exception as e:
+                  self.logger.error(f"Unreadable Cache Entry {key}, Discarding It. Error {e}")
+                  self._evict(key)
+                  return None
+            os.utime(meta_path)
+            self.logger.info(f'Loaded Processed Data from Cache Entry {key}')
+            return df.set_index(_INDEX_COLUMN).rename_axis(None)
+
+      def store(self, key, df, source_path):
+            """
+            Store a processed frame and evict stale and least recently used entries.
+
+            Args:
+                  key (str): Key returned by `key`.
+                  df (pd.DataFrame): The processed frame.
+                  source_path (str): Path of the input CSV, used to find stale entries.
+
+            Returns:
+                  None
+            """
+            data_path, meta_path = self._paths(key)
+            source = os.path.abspath(source_path)
+            for other_key, meta in self._entries():
+                  if other_key != key and meta.get('source') == source:
+                        self.logger.info(f'Evicting Stale Cache Entry {other_key}')
+                        self._evict(other_key)
+            framed = df.reset_index(names=_INDEX_COLUMN)
+            tmp_path = data_path + '.tmp'
+            if feather is not None:
+                  feather.write_feather(framed, tmp_path, compression='uncompressed')
+            else:
+                  framed.to_pickle(tmp_path)
+            os.replace(tmp_path, data_path)
+            with open(meta_path, 'w') as f:
+                  json.dump({'source': source, 'created': time.time(), 'rows': len(df)}, f)
+            entries = sorted(self._entries(), key=lambda entry: os.path.getmtime(self._paths(entry[0])[1]))
+            for old_key, _ in entries[:max(len(entries) - self.max_entries, 0)]:
+                  self.logger.info(f'Evicting Least Recently Used Cache Entry {old_key}')
+                  self._evict(old_key)
+            self.logger.info(f'Stored Processed Data in Cache Entry {key}')
+
+      def _entries(self):
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                  if name.endswith('.json'):
+                        try:
+                              with open(os.path.join(self.cache_dir, name)) as f:
+                                    entries.append((name[:-len('.json')], json.load(f)))
+                        except (OSError, ValueError):
+                              continue
+            return entries
+
+      def _evict(self, key):
+            base = os.path.join(self.cache_dir, key)
+            for extension in ('.feather', '.pkl', '.json'):
+                  if os.path.exists(base + extension):
+                        os.remove(base + extension)
@@ -1,9 +1,15 @@
 import pandas as pd
-import re
+import io
+import os
+import mmap
 import logging
-from data_ingestion import load_csv_file
+from concurrent.futures import ProcessPoolExecutor
+from data_ingestion import load_csv_file, load_csv_chunks
 import numpy as np
 from parameter_dictionary import ConfigParameters
+from processed_cache import ProcessedDataCache
+from pipeline_profiling import PipelineProfiler
+from vectorized_extractors import PatternMatcher, FusedRowExtractor, map_unique, extract_orders_done, extract_ratings, rescale_ratings, parse_prices, currency_dtype, categorize_currencies
 
 
 class RawDataProcessor:
@@ -25,13 +31,45 @@ class RawDataProcessor:
       - get_orders_done: Extracts completed order counts from descriptions.
       - create_col_account_condition: Creates a column indicating whether accounts are 'new' or 'used'.
       - create_col_account_rating: Computes account ratings from raw text and converts them to a uniform scale.
+      - classify_accounts: Maps account names to 'bid', 'take' or 'both'.
+      - transform_price_col: Splits prices into a currency code and a converted amount.
+      - process: Loads the CSV and runs every processing stage on the whole frame.
+      - process_frame: Runs every processing stage on an already loaded frame.
+      - iter_processed_chunks: Streams the CSV in fixed-size chunks and yields processed chunks.
+      - process_to_sink: Streams processed chunks to a CSV file or a callable.
+      - process_parallel: Runs the processing stages on row-aligned byte-range shards in a process pool.
+      - process_byte_range: Runs the processing stages on the rows between two byte offsets of the CSV.
+      - extract_text_columns: Derives every text-based column in one pass (the stage used when `fused`).
+      - profiling_report: Returns the per-stage measurements recorded when `profile` is enabled.
 
       Attributes:
       - parameter_dict: Configuration dictionary with details such as CSV paths, column mappings, and regex patterns.
       - logging_level: Logging verbosity level (default: "INFO").
+      - workers: Number of processes `process` uses (default: 1, a single process).
+      - cache_dir: Directory of the on-disk cache of processed output (default: None, no cache).
+      - fused: Whether `FUSED_STAGES` replace `PROCESSING_STAGES` (default: False).
+      - profiler: `PipelineProfiler` recording every stage, or None when profiling is off (default).
       """
 
-      def __init__(self, parameter_dict, logging_level = 'INFO'):
+      # The per-row processing stages, in the order `process` runs them after loading the data.
+      PROCESSING_STAGES = (
+            'rename_columns',
+            'drop_null_cols',
+            'get_account_names',
+            'create_col_account_condition',
+            'get_orders_done',
+            'create_col_account_rating',
+            'classify_accounts',
+            'transform_price_col',
+      )
+      # The same processing with every text-derived column extracted in one traversal of the rows.
+      FUSED_STAGES = (
+            'rename_columns',
+            'drop_null_cols',
+            'extract_text_columns',
+      )
+
+      def __init__(self, parameter_dict, logging_level = 'INFO', workers = 1, cache_dir = None, fused = False, profile = False):
             """
             Args:
                   parameter dictionary : dict
@@ -39,8 +77,19 @@ class RawDataProcessor:
                         columns to rename.
             logging_level : str, optional
                 Level of logging, either "DEBUG" or "INFO" (default is "INFO").
+            workers : int, optional
+                Number of processes `process` splits the CSV across (default is 1). Use None for one per CPU.
+            cache_dir : str, optional
+                Directory for a `ProcessedDataCache` that `process` reads from and writes to (default is None).
+            fused : bool, optional
+                Extract all text-derived columns in a single pass over the rows (default is False).
+                The result is identical to the stage-by-stage run.
+            profile : bool, optional
+                Record wall time, CPU time, rows in and out and memory for every stage (default is False).
+                The measurements are returned by `profiling_report`.
             """
             parameter_dict = ConfigParameters()
+            self.parameter_dict = parameter_dict
             self.csv_path = parameter_dict['CSV_URL']
             self.columns_to_rename = parameter_dict['columns_to_rename']
             self.account_name_patterns = parameter_dict['account_name_patterns']
@@ -48,6 +97,32 @@ class RawDataProcessor:
             self.condition_pattern = parameter_dict['condition_pattern']
             self. rating_patterns = parameter_dict['rating_patterns']
             self.bid_take_group = parameter_dict['bid_take_group']
+            self.price_pattern = parameter_dict['price_pattern']
+            self.currency_rates = parameter_dict['currency_rates']
+            self.base_currency = parameter_dict['base_currency']
+            self.account_name_matcher = PatternMatcher(self.account_name_patterns)
+            self.rating_matcher = PatternMatcher(self.rating_patterns)
+            self.account_name_dtype = pd.CategoricalDtype(self.account_name_matcher.labels)
+            self.take_or_bid_dtype = pd.CategoricalDtype(sorted(set(self.bid_take_group.values())))
+            # Fixed here rather than inferred from the data, so chunks and shards share one dtype.
+            self.price_currency_dtype = currency_dtype(self.currency_rates, self.base_currency)
+            # take_or_bid code for every account_name code; -1 for names missing from `bid_take_group`.
+            self.take_or_bid_codes = np.array(
+                  [self.take_or_bid_dtype.categories.get_loc(self.bid_take_group[name]) if name in self.bid_take_group else -1
+                   for name in self.account_name_dtype.categories],
+                  dtype=np.int8)
+            self.logging_level = logging_level
+            self.workers = workers if workers is not None else os.cpu_count()
+            self.dedup_report = {}
+            # Factorizations of the raw text columns shared by the stages of one `process_frame` run.
+            self._factorized = None
+            self.cache_dir = cache_dir
+            self.fused = fused
+            self.stages = self.FUSED_STAGES if fused else self.PROCESSING_STAGES
+            self.profiler = PipelineProfiler() if profile else None
+            self.fused_extractor = FusedRowExtractor(
+                  self.account_name_matcher, self.order_patterns, self.condition_pattern,
+                  self.rating_matcher, self.price_pattern, self.base_currency)
             self.initialize_logging(logging_level)
             self.df = None
             
@@ -146,36 +221,80 @@ class RawDataProcessor:
                   raise e
 
 
+      def _map_unique(self, column, func):
+            """
+            Run a column-level extractor once per distinct value of `column` and broadcast the result back.
+
+            The number of rows and distinct values is recorded in `self.dedup_report` under the column name
+            and the deduplication ratio is logged.
+
+            Args:
+                  column (str): Name of the raw text column in `self.df`.
+                  func (callable): Extractor taking a Series of distinct values (see `map_unique`).
+
+            Returns:
+                  The broadcast result of `func`, aligned to `self.df.index`.
+            """
+            result, n_unique = map_unique(self.df[column], func, self._factorize(column))
+            rows = len(self.df)
+            self.dedup_report[column] = {'rows': rows, 'unique': n_unique, 'ratio': rows / max(n_unique, 1)}
+            self.logger.info(f"Processed {n_unique} Unique '{column}' Values for {rows} Rows ({self.dedup_report[column]['ratio']:.1f}x Dedup)")
+            return result
+
+      def _factorize(self, column):
+            """
+            Factorize a raw text column, reusing the factorization of an earlier stage of the same
+            `process_frame` run.
+
+            Stages only drop rows, so an earlier factorization is narrowed to the remaining rows and
+            to the distinct values they still use, instead of hashing the strings again. Outside
+            `process_frame` the column is always factorized afresh.
+
+            Args:
+                  column (str): Name of the raw text column in `self.df`.
+
+            Returns:
+                  tuple: (codes, uniques) as returned by `pd.factorize`, aligned to `self.df`.
+            """
+            if self._factorized is None:
+                  return pd.factorize(self.df[column])
+            cached = self._factorized.get(column)
+            if cached is not None and cached[0] is not self.df.index:
+                  index, codes, uniques = cached
+                  positions = index.get_indexer(self.df.index)
+                  if (positions >= 0).all():
+                        codes = codes[positions]
+                        used = np.zeros(len(uniques), dtype=bool)
+                        used[codes[codes >= 0]] = True
+                        codes = np.where(codes >= 0, np.cumsum(used)[codes] - 1, -1)
+                        cached = (self.df.index, codes, uniques[used])
+                  else:
+                        cached = None
+            if cached is None:
+                  cached = (self.df.index, *pd.factorize(self.df[column]))
+            self._factorized[column] = cached
+            return cached[1], cached[2]
+
       def get_account_names(self):
             """ Extract account names from the 'description' column based on predefined patterns.
-            This method iterates over each row in `self.df`, searching for matching account name patterns
-            within the 'description' column. If a match is found, the corresponding account name is assigned
-            to the 'account_name' column. If no match is found, 'None' is assigned. A log message is recorded
-            upon successful extraction.
+            This method labels each distinct value of the 'description' column with `self.account_name_matcher`,
+            a `PatternMatcher` compiled once from `account_name_patterns`, and broadcasts the labels back to the rows. The first pattern (in dictionary
+            order) found in a description gives the value of the 'account_name' column, which is stored as a
+            Categorical whose categories are the `account_name_patterns` keys. Rows where no pattern matches
+            are removed. A log message is recorded upon successful extraction.
 
             Args:
                   None
 
             Returns:
-                  pd.DataFrame: The DataFrame with an additional 'account_name' column containing extracted names.
+                  pd.DataFrame: The DataFrame with an additional categorical 'account_name' column containing extracted names.
 
             Raises:
                   Exception: Logs an error and raises the exception if an error occurs during the extraction process.
             """
-            self.df['account_name'] = None
             try:
-                  for idx, row in self.df.iterrows():
-                        cell = row['description']
-                        matched = False
-                        for key, (pattern, flags) in self.account_name_patterns.items():
-                              match = re.search(pattern, cell, flags=flags)
-                              if match:
-                                    self.df.at[idx, 'account_name'] = key
-                                    matched = True
-                                    break
-                  if not matched:
-                        self.df.at[idx, 'account_name'] = 'None'
-                  self.df = self.df[self.df['account_name'] != 'None']
+                  self.df['account_name'] = self._map_unique('description', self.account_name_matcher.categorize)
+                  self.df = self.df[self.df['account_name'].notna()]
                   self.logger.info("Successfully Extracted and created 'account_name' column")
                   return self.df
             except Exception as e:
@@ -210,8 +329,9 @@ class RawDataProcessor:
             """
             Create a new column 'account_condition' in the DataFrame based on the 'condition' column.
 
-            This function iterates through each row in `df` and checks if the 'condition' column contains
-            the word 'new'. If found, 'account_condition' is set to 'new'; otherwise, it is set to 'used'.
+            Each distinct value of the 'condition' column is searched once for `condition_pattern` (the
+            word 'new') and the result is broadcast back to the rows. Where it is found,
+            'account_condition' is set to 'new'; otherwise, it is set to 'used'.
 
             Args:
                   df (pd.DataFrame): The input DataFrame with a 'condition' column.
@@ -220,15 +340,9 @@ class RawDataProcessor:
                   pd.DataFrame: The DataFrame with an added 'account_condition' column.
             """
             try:
-                  self.df['account_condition'] = None
-                  for idx, row in self.df.iterrows():
-                        self.cell = row['condition']
-                        match = re.search(self.condition_pattern[0], self.cell, flags=self.condition_pattern[1])  # Using both regex and flags correctly
-                        if match:
-                              self.df.at[idx, 'account_condition'] = 'new'
-                        else:
-                              self.df.at[idx, 'account_condition'] = 'used'
-                  self.df['account_condition'] = self.df['account_condition'].astype(str)
+                  pattern, flags = self.condition_pattern
+                  self.df['account_condition'] = self._map_unique('condition', lambda conditions: np.where(
+                        conditions.str.contains(pattern, flags=flags, regex=True), 'new', 'used').astype(object))
                   self.df = self.df.drop(columns= 'condition', axis=1)
                   self.logger.info(" Successfully Created Column 'account_condition'")
                   return self.df
@@ -242,45 +356,25 @@ class RawDataProcessor:
             """
             Extract and populate the 'orders_done' column based on patterns in the 'description' column.
 
-            This method iterates through the 'description' column in `self.df`, searching for matching patterns
-            that indicate completed orders. If a pattern matching 'zero_orders' is found, the 'orders_done' column
+            This method parses each distinct value of the 'description' column once with `extract_orders_done`,
+            trying the `order_patterns` in order, and broadcasts the counts back to the rows. If a pattern matching 'zero_orders' is found, the 'orders_done' column
             is set to 0. For other patterns, a numeric order count is extracted and populated in the 'orders_done' column.
-            Any unmatched rows are set to NaN. After processing, missing values in 'orders_done' are filled with the
-            column's median. Logs messages for successful completion and any errors encountered.
+            Any unmatched rows are set to <NA>, except for accounts whose 'account_condition' is 'new', which are
+            set to 0. Logs messages for successful completion and any errors encountered.
 
             Args:
                   None
 
             Returns:
-                  pd.DataFrame: The DataFrame with an added or updated 'orders_done' column, filled based on the extracted order data.
+                  pd.DataFrame: The DataFrame with an added or updated nullable integer ('Int64') 'orders_done' column.
 
             Raises:
                   KeyError: Logs an error and raises the exception if the 'description' column is missing.
                   Exception: Logs a generic error message and raises the exception for any other processing issues.
             """
             try:
-                  self.df['orders_done'] = np.nan
-                  for idx, row in self.df.iterrows():
-                        self.cell = row['description']
-                        matched = False
-                        for key, (pattern, flags) in self.order_patterns.items():
-                              match = re.search(pattern, self.cell, flags=flags)
-                              if match:
-                                    if key == 'zero_orders':
-                                          self.df.at[idx, 'orders_done'] = 0
-                                    else:
-                                          if self.df.at[idx, 'orders_done'] is np.nan or pd.isna(self.df.at[idx, 'orders_done']):
-                                                # Handle "2k" as 200 and remove "+" if present, convert to integer
-                                                value = match.group(1).replace('k', '00').replace('K', '00').replace('+', '')
-                                                try:
-                                                      self.df.at[idx, 'orders_done'] = int(value)
-                                                except ValueError:
-                                                      self.df.at[idx, 'orders_done'] = np.nan  # If conversion fails, set as NaN
-                                    matched = True
-                                    break
-                              if not matched:
-                                    self.df.at[idx, 'orders_done']=np.nan
-                  self.df.loc[self.df['account_condition'] == 'new', 'orders_done'] = self.df.loc[self.df['account_condition'] == 'new', 'orders_done'].fillna(0)
+                  orders_done = self._map_unique('description', lambda descriptions: extract_orders_done(descriptions, self.order_patterns))
+                  self.df['orders_done'] = orders_done.mask(orders_done.isna() & (self.df['account_condition'] == 'new'), 0)
                   self.logger.info("Successfully Extracted and Created Column 'orders done'. ")
                   return self.df
             except KeyError as e:
@@ -289,21 +383,19 @@ class RawDataProcessor:
             except Exception as e:
                   self.logger.error(f"An error occurred while processing your Action. Error {e}")
                   raise e
-     
-
-      
 
       def create_col_account_rating(self):
             """
             Create and populate the 'account_rating' column by extracting rating information from the 'rating' column.
 
-            This method applies predefined rating patterns to parse and convert the 'rating' column data, assigning 
-            corresponding values to a new column 'account_rating'. The method handles different formats such as 
-            percentages, fractions, and standalone ratings.
+            This method strips any "Rating:" label from the 'rating' column, classifies the distinct values with
+            `self.rating_matcher` (built from 'rating_patterns') and extracts the numeric rating for each kind with
+            `extract_ratings`, broadcasting the results back to the rows. It handles formats such as percentages, fractions and standalone ratings. The results
+            are brought to a 0-5 scale with `rescale_ratings`; anything above 5, or not extracted, becomes 4.9.
 
             Args:
                   self (object): The instance of the class containing 'df', a DataFrame with a 'rating' column and an 
-                  attribute 'rating_patterns', which includes patterns for rating extraction. Also requires a logging 
+                  attribute 'rating_matcher' built from the rating patterns. Also requires a logging 
                   attribute 'logger' to capture errors.
 
             Returns:
@@ -314,60 +406,52 @@ class RawDataProcessor:
                   Exception: Raises any exception encountered during the process and logs an error message.
             """
             try:
-                  self.df['rating'] = self.df['rating'].apply(lambda x: x.split(":")[1].strip() if ":" in x and len(x.split(":")) > 1 else x.strip())
-                  self.df['account_rating'] = np.nan
-                  for idx, row in self.df.iterrows():
-                        raw_string = str(row['rating']).strip()
-                        self.extracted_rating = None
-                        for key, (pattern, flags) in self.rating_patterns.items():
-                              match = re.search(pattern, raw_string, flags  = flags)
-                              if match:
-                                    if key=='new_unranked':
-                                          self.extracted_rating = 10.0
-                                    elif key== 'percentage':
-                                          self.extracted_rating = float(match.group(1))
-                                    elif key== 'fraction':
-                                          self.numerator = float(match.group(1))
-                                          self.denominator = float(match.group(3))
-                                          if float(self.denominator)!= 0:
-                                                self.extracted_rating = float(self.numerator)
-                                    elif key == 'stand_alone':
-                                          self.extracted_rating = float(match.group(1))
-                                    break
-                        self.df.at[idx, 'account_rating'] = self.extracted_rating
-                  self.df['account_rating'] = self.df['account_rating'].apply(
-                        lambda value: value if value<=5.0
-                        else (value / 10) * 5 if value <= 10.0
-                        else (value / 100) * 5)
-                  self.df['account_rating'] = self.df['account_rating'].apply(lambda value: value if value <= 5.0 else 4.9)
+                  self.df['rating'], self.df['account_rating'] = self._map_unique('rating', self._parse_ratings)
                   self.logger.info("Successfully Created Column 'account_rating'. ")
                   return self.df
             except Exception as e:
                   self.logger.error(f"Failed to extract and Create Column 'account_rating'. Error: {e} ")
                   raise e
+      def _parse_ratings(self, ratings):
+            """
+            Strip the "Rating:" label from raw rating strings and compute their 0-5 rating.
+
+            Args:
+                  ratings (pd.Series): Raw rating strings.
+
+            Returns:
+                  tuple: (pd.Series, np.ndarray) the stripped rating text and the rescaled ratings.
+            """
+            stripped = ratings.str.split(':', n=2).str[1].fillna(ratings).str.strip()
+            return stripped, rescale_ratings(extract_ratings(stripped, self.rating_matcher))
+
       def classify_accounts(self):
             """
             Classifies accounts in a DataFrame by mapping each account name to a category 
-            ('take' or 'bid') based on predefined groups, and assigns the result to a new column 
+            ('take', 'bid' or 'both') based on predefined groups, and assigns the result to a new column 
             'take_or_bid'.
 
+            The mapping is done on category codes: the codes of the categorical 'account_name' column are
+            remapped through `self.take_or_bid_codes`, an array precomputed from `bid_take_group`, so no
+            Python work is done per row.
+
             Args:
                   df (pd.DataFrame): The DataFrame containing the 'account_name' column, which includes 
                                     account names to be classified.
 
             Returns:
-                  pd.DataFrame: The DataFrame with an additional 'take_or_bid' column, where each entry 
-                              is either 'take' or 'bid' (or None if no match is found) based on the 
+                  pd.DataFrame: The DataFrame with an additional categorical 'take_or_bid' column, where each entry 
+                              is 'take', 'bid' or 'both' (or NaN if no match is found) based on the 
                               `bid_take_group` mapping.
 
             Logs:
                   Logs an error if the 'account_name' column is not found or if other exceptions arise.
             """
             try:
-                  self.df['take_or_bid'] = None 
-                  for idx, row in self.df.iterrows():
-                        if row['account_name'] in self.bid_take_group:
-                              self.df.at[idx, 'take_or_bid'] = self.bid_take_group[row['account_name']]
+                  self.df['account_name'] = self.df['account_name'].astype(self.account_name_dtype)
+                  name_codes = self.df['account_name'].cat.codes.to_numpy()
+                  codes = np.where(name_codes >= 0, self.take_or_bid_codes[name_codes], -1)
+                  self.df['take_or_bid'] = pd.Categorical.from_codes(codes, dtype=self.take_or_bid_dtype)
                   self.logger.info('Successfully Classified Accounts as Bid/Take')
                   return self.df
             except KeyError as e:
@@ -378,22 +462,31 @@ class RawDataProcessor:
                   raise e
       def transform_price_col(self):
             """
-            Extracts numeric price values from a 'price' column in a DataFrame by removing any commas 
-            in the string, converting the price to a numeric format, and assigns the result to a new 
-            column 'account_price'.
+            Extracts numeric price values from a 'price' column in a DataFrame in a single vectorized pass
+            over its distinct values, broadcast back to the rows.
+            Each price string is split into a currency code, stored in a new categorical column
+            'price_currency' with the categories of `self.price_currency_dtype` (currencies without a
+            rate fall in its 'OTHER' bucket), and an amount with any commas removed. The amount is converted to
+            `base_currency` using the `currency_rates` table and assigned to a new column 'account_price'.
 
             Args:
                   df (pd.DataFrame): The DataFrame containing the 'price' column with prices in string 
-                                    format prefixed by a currency symbol.
+                                    format prefixed by a currency code, e.g. "KES 50,000".
 
             Returns:
-                  pd.DataFrame: The DataFrame with an additional 'account_price' column with numeric values.
+                  pd.DataFrame: The DataFrame with additional 'price_currency' and 'account_price' columns.
 
             Logs:
-                  Logs an error if the 'price' column is not found or if other exceptions arise.
+                  Logs an error if the 'price' column is not found or if other exceptions arise, and a warning
+                  for prices that could not be parsed or whose currency has no conversion rate.
             """
             try:
-                  self.df['account_price'] = self.df['price'].apply(lambda x: float(x.split('S')[1].replace(',', '')))
+                  self.df['price_currency'], self.df['account_price'] = self._map_unique(
+                        'price', lambda prices: parse_prices(prices, self.price_pattern, self.currency_rates, self.base_currency,
+                                                             self.price_currency_dtype))
+                  unpriced = self.df['account_price'].isna().sum()
+                  if unpriced:
+                        self.logger.warning(f"{unpriced} prices could not be parsed or converted to {self.base_currency}")
                   self.logger.info('Successfully Transformed Price Column')
                   self.df = self.df.drop(columns='price')
                   return self.df
@@ -409,11 +502,70 @@ class RawDataProcessor:
                                     
 
 
+      def extract_text_columns(self):
+            """
+            Derive every text-based column in a single pass over the rows.
+
+            This stage replaces `get_account_names`, `create_col_account_condition`, `get_orders_done`,
+            `create_col_account_rating`, `classify_accounts` and `transform_price_col` when the processor is
+            `fused`. `self.fused_extractor` reads each row's description, condition, rating and price once,
+            runs all the extractors on them and fills preallocated NumPy arrays. The columns are then
+            finished with array operations (order fill for new accounts, rating rescale, bid/take codes,
+            currency conversion) and assembled in one step, with the same columns, dtypes and rows as the
+            stage-by-stage run.
+
+            Args:
+                  None
+
+            Returns:
+                  pd.DataFrame: The processed DataFrame.
+
+            Raises:
+                  KeyError: If one of the raw columns is missing.
+                  Exception: Logs an error and raises the exception for any other processing issues.
+            """
+            try:
+                  extracted = self.fused_extractor.extract(
+                        self.df['description'].to_numpy(), self.df['condition'].to_numpy(),
+                        self.df['rating'].to_numpy(), self.df['price'].to_numpy())
+                  keep = extracted['name_codes'] >= 0
+                  extracted = {name: values[keep] for name, values in extracted.items()}
+                  name_codes, is_new = extracted['name_codes'], extracted['is_new']
+                  orders_missing = extracted['orders_missing'] & ~is_new
+                  currencies = categorize_currencies(extracted['currencies'], self.price_currency_dtype).array
+                  rates = np.array([self.currency_rates.get(code, np.nan) for code in currencies.categories] + [np.nan], dtype=float)
+                  remaining = self.df.loc[keep, ['description']]
+                  self.df = remaining.assign(
+                        rating=extracted['rating_text'],
+                        account_name=pd.Categorical.from_codes(name_codes, dtype=self.account_name_dtype),
+                        account_condition=np.where(is_new, 'new', 'used').astype(object),
+                        orders_done=pd.arrays.IntegerArray(extracted['orders_done'], orders_missing),
+                        account_rating=rescale_ratings(extracted['raw_rating']),
+                        take_or_bid=pd.Categorical.from_codes(self.take_or_bid_codes[name_codes], dtype=self.take_or_bid_dtype),
+                        price_currency=currencies,
+                        account_price=extracted['amounts'] * rates[currencies.codes],
+                  )
+                  unpriced = self.df['account_price'].isna().sum()
+                  if unpriced:
+                        self.logger.warning(f"{unpriced} prices could not be parsed or converted to {self.base_currency}")
+                  self.logger.info('Successfully Extracted All Text-Derived Columns in One Pass')
+                  return self.df
+            except KeyError as e:
+                  self.logger.error(f"A raw column is missing from the DataFrame: {e}")
+                  raise e
+            except Exception as e:
+                  self.logger.error(f"An error occurred in extract_text_columns: {e}")
+                  raise e
+
       def process(self):
             """
             Execute the main data processing workflow.
 
-            This method sequentially performs data processing steps.
+            This method loads the data and then sequentially performs the data processing steps
+            listed in `self.stages` (`PROCESSING_STAGES`, or `FUSED_STAGES` when `fused`). With `workers` above 1 the work is split across processes
+            by `process_parallel` instead. With a `cache_dir`, the result is looked up in a
+            `ProcessedDataCache` keyed by the CSV contents and the parameters first, and stored there
+            after processing on a miss.
 
             Args:
                   None
@@ -424,15 +576,256 @@ class RawDataProcessor:
             Raises:
                   Exception: Propagates any exceptions raised by individual processing steps.
             """
-            self.get_data()
-            self.rename_columns()
-            self.drop_null_cols()
-            self.get_account_names()
-            self.create_col_account_condition()
-            self.get_orders_done()
-            self.create_col_account_rating()
-            self.classify_accounts()
-            self.transform_price_col()
+            cache = None
+            if self.cache_dir is not None:
+                  cache = ProcessedDataCache(self.cache_dir, logging_level=self.logging_level)
+                  key = cache.key(self.csv_path, self.parameter_dict)
+                  cached = cache.load(key)
+                  if cached is not None:
+                        self.df = cached
+                        return self.df
+            if self.workers > 1:
+                  self._run_stage('process_parallel', self.workers)
+            else:
+                  self._run_stage('get_data')
+                  self.process_frame(self.df)
+            if cache is not None:
+                  cache.store(key, self.df, self.csv_path)
+            return self.df
+
+      def process_frame(self, df):
+            """
+            Run every stage in `self.stages` on an already loaded raw DataFrame.
+
+            Args:
+                  df (pd.DataFrame): Raw data with the original CSV columns.
+
+            Returns:
+                  pd.DataFrame: The processed DataFrame, also stored in `self.df`.
 
+            Raises:
+                  Exception: Propagates any exceptions raised by individual processing steps.
+            """
+            self.df = df
+            self._factorized = {}
+            try:
+                  for stage in self.stages:
+                        self._run_stage(stage)
+            finally:
+                  self._factorized = None
             return self.df
-      
+
+      def _run_stage(self, stage, *args):
+            """
+            Run one stage method by name, measured by `self.profiler` when profiling is enabled.
+
+            Args:
+                  stage (str): Name of the stage method.
+                  *args: Positional arguments passed to the stage.
+
+            Returns:
+                  The stage's return value.
+            """
+            if self.profiler is None:
+                  return getattr(self, stage)(*args)
+            with self.profiler.stage(f'{type(self).__name__}.{stage}', self):
+                  return getattr(self, stage)(*args)
+
+      def profiling_report(self):
+            """
+            Return the measurements of every stage run so far, with the distinct-value statistics
+            recorded in `self.dedup_report`.
+
+            Returns:
+                  ProfilingReport: The per-stage measurements.
+
+            Raises:
+                  ValueError: If the processor was built without `profile=True`.
+            """
+            if self.profiler is None:
+                  raise ValueError('Profiling is disabled; construct the processor with profile=True.')
+            return self.profiler.report(self.dedup_report)
+
+      def iter_processed_chunks(self, chunksize=100_000):
+            """
+            Stream the CSV in fixed-size chunks and yield each chunk after all processing stages.
+
+            Peak memory is bounded by the chunk size instead of the file size. Every stage in
+            `PROCESSING_STAGES` only looks at the row it is processing (the pattern matchers, the
+            category tables and the currency rates are fixed when the processor is built, and the
+            'orders_done' fill for new accounts depends on the row's own condition), so no stage needs
+            statistics over the whole file. The categorical columns use categories fixed by the
+            configuration (`self.price_currency_dtype` for 'price_currency'), not inferred per chunk,
+            so every chunk has the same dtypes. Concatenating the yielded chunks therefore gives the
+            same result as `process`, row for row and with the same index and dtypes. Steps that do need global
+            statistics, such as the median in `DataCleanerAndTransformer.impute_price`, are not part of
+            this pipeline.
+
+            Args:
+                  chunksize (int): Number of raw CSV rows per chunk (default is 100,000).
+
+            Yields:
+                  pd.DataFrame: Processed chunks, in file order. Chunks whose rows are all filtered out
+                  are skipped.
+            """
+            # Read every column as text, as `process_byte_range` does: a chunk whose cells are all empty
+            # would otherwise be inferred as float64 and break the string stages.
+            for chunk in load_csv_chunks(self.csv_path, chunksize, dtype=object):
+                  processed = self.process_frame(chunk)
+                  self.df = None
+                  if not processed.empty:
+                        yield processed
+
+      def process_to_sink(self, sink, chunksize=100_000):
+            """
+            Stream the processed data chunk by chunk into a sink, keeping memory bounded.
+
+            Args:
+                  sink (str or callable): Either a CSV path, written with a header followed by each
+                        chunk appended in order, or a callable that is given each processed chunk.
+                  chunksize (int): Number of raw CSV rows per chunk (default is 100,000).
+
+            Returns:
+                  int: The number of processed rows written to the sink.
+
+            Raises:
+                  Exception: Propagates any exceptions raised while reading, processing or writing.
+            """
+            rows = 0
+            for chunk in self.iter_processed_chunks(chunksize):
+                  if callable(sink):
+                        sink(chunk)
+                  else:
+                        chunk.to_csv(sink, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+                  rows += len(chunk)
+            self.logger.info(f'Successfully Streamed {rows} Processed Rows to the Sink')
+            return rows
+
+      def process_parallel(self, workers):
+            """
+            Run the processing stages on shards of the CSV in a pool of `workers` processes.
+
+            The file is split into byte ranges whose ends are moved forward to the next line break outside
+            a quoted field, so every shard holds whole rows, even when fields contain line breaks. Each worker
+            parses and processes its own shard and reports how many raw rows it read. The shards are
+            then concatenated in file order and their indexes shifted by the rows before them, so the
+            result is identical to the single-process run. Files too small to give two shards are
+            processed in this process instead. `self.dedup_report` sums the shards' counts, so its
+            'unique' values count the distinct values each shard processed.
+
+            Args:
+                  workers (int): Number of worker processes (and shards).
+
+            Returns:
+                  pd.DataFrame: The fully processed DataFrame, also stored in `self.df`.
+
+            Raises:
+                  Exception: Propagates any exceptions raised while reading or processing a shard.
+            """
+            shards = _row_aligned_shards(self.csv_path, workers)
+            if len(shards) < 2:
+                  self.logger.info('Too Few Rows to Shard; Processing in a Single Process')
+                  self._run_stage('get_data')
+                  return self.process_frame(self.df)
+            columns = list(pd.read_csv(self.csv_path, nrows=0).columns)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                  tasks = [(self.csv_path, columns, start, end, self.logging_level, self.fused) for start, end in shards]
+                  results = list(pool.map(_process_shard, tasks))
+            processed, offset = [], 0
+            self.dedup_report = {}
+            for shard_df, raw_rows, dedup_report in results:
+                  shard_df.index = shard_df.index + offset
+                  processed.append(shard_df)
+                  offset += raw_rows
+                  for column, counts in dedup_report.items():
+                        merged = self.dedup_report.setdefault(column, {'rows': 0, 'unique': 0})
+                        merged['rows'] += counts['rows']
+                        merged['unique'] += counts['unique']
+            for counts in self.dedup_report.values():
+                  counts['ratio'] = counts['rows'] / max(counts['unique'], 1)
+            # Shards whose rows were all filtered out only add empty frames.
+            self.df = pd.concat([shard_df for shard_df in processed if not shard_df.empty] or processed[:1])
+            self.logger.info(f'Successfully Processed {offset} Rows in {len(shards)} Shards Across {workers} Workers')
+            return self.df
+
+      def process_byte_range(self, start, end, columns):
+            """
+            Parse the rows stored between two byte offsets of the CSV and run every processing stage on them.
+
+            Args:
+                  start (int): Offset of the first byte of the first row.
+                  end (int): Offset just past the last row.
+                  columns (list): The CSV header, since the range does not contain it.
+
+            Returns:
+                  tuple: (pd.DataFrame, int) the processed rows, indexed from 0 at the first row of the
+                        range, and the number of raw rows read.
+            """
+            with open(self.csv_path, 'rb') as f:
+                  f.seek(start)
+                  data = f.read(end - start)
+            raw = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=object)
+            return self.process_frame(raw), len(raw)
+
+
+def _row_aligned_shards(csv_path, n_shards, block_size=1 << 24):
+      """
+      Split the data rows of a CSV file into byte ranges that start and end on row boundaries.
+
+      A line break only ends a row when it is outside a quoted field, i.e. when an even number of
+      quote characters precede it. The quotes are counted incrementally in blocks of at most
+      `block_size` bytes, so the file is scanned once without being loaded into memory.
+
+      Args:
+            csv_path (str): Path to the CSV file.
+            n_shards (int): Number of shards to aim for.
+            block_size (int): Largest number of bytes counted at once.
+
+      Returns:
+            list: (start, end) byte offsets of the non-empty shards, in file order.
+      """
+      size = os.path.getsize(csv_path)
+      if size == 0:
+            return []
+      with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            quotes, counted_to = 0, 0
+
+            def next_row_start(position):
+                  nonlocal quotes, counted_to
+                  while True:
+                        line_break = mm.find(b'\n', position)
+                        if line_break == -1:
+                              return size
+                        for block_start in range(counted_to, line_break, block_size):
+                              quotes += mm[block_start:min(block_start + block_size, line_break)].count(b'"')
+                        counted_to = max(counted_to, line_break)
+                        if quotes % 2 == 0:
+                              return line_break + 1
+                        position = line_break + 1
+
+            boundaries = [next_row_start(0)]
+            for k in range(1, n_shards):
+                  target = boundaries[0] + (size - boundaries[0]) * k // n_shards
+                  if target > boundaries[-1]:
+                        # Finish the row containing the byte before `target`.
+                        boundaries.append(next_row_start(target - 1))
+            boundaries.append(size)
+      return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _process_shard(task):
+      """
+      Parse and process one byte range of the CSV in a worker process.
+
+      Args:
+            task (tuple): (csv_path, columns, start, end, logging_level, fused).
+
+      Returns:
+            tuple: (pd.DataFrame, int, dict) the processed shard with a shard-local index, the number of
+                  raw rows it contained and its `dedup_report`.
+      """
+      csv_path, columns, start, end, logging_level, fused = task
+      processor = RawDataProcessor(ConfigParameters(), logging_level=logging_level, fused=fused)
+      processor.csv_path = csv_path
+      processed, raw_rows = processor.process_byte_range(start, end, columns)
+      return processed, raw_rows, processor.dedup_report
@@ -0,0 +1,164 @@
+"""
+Synthetic Data Module.
+This module generates scraped-listing rows in the layout of `freelance_accounts.csv`
+(Header, Type, Rating, Price) from the vocabulary in `ConfigParameters`, at any size, for
+benchmarking the pipeline beyond the 23k rows that were actually scraped.
+
+Functions:
+- generate_accounts: Builds a DataFrame of synthetic listings with a controllable duplicate ratio,
+      text noise and missing cells.
+- write_synthetic_csv: Writes a synthetic CSV of any size in chunks, keeping memory bounded.
+
+Notes:
+- Headers are an account name from 'account_name_patterns' followed by an order phrase in the forms
+      the 'order_patterns' recognise ("120 orders done", "2k+ orders", "brand new", ...).
+- Ratings cover every 'rating_patterns' kind (new/unranked, percentage, fraction, stand-alone) plus
+      labels that match none of them. Prices are "KES <amount>" with occasional other currencies.
+- Noise perturbs the text the way scraped listings vary: letter case, doubled spaces and dropped
+      characters, so some rows no longer match any pattern.
+"""
+import logging
+import numpy as np
+import pandas as pd
+from parameter_dictionary import ConfigParameters
+
+logger = logging.getLogger('synthetic_data')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s : %(name)s - %(levelname)s - %(message)s')
+
+_ORDER_PHRASES = ('{n} orders done', '{n}+ orders', 'done {n} orders', '{k}k+ orders', '{n} questions done',
+                  'new account', 'brand new', 'non technical', 'verified account', 'high paying')
+_CONDITIONS = ('Type: New', 'Type: Used', 'Type: Used', 'Type: Old', 'Type: new account')
+_RATINGS = ('Rating: {r:.1f}', 'Rating: {p}%', 'Rating: {r:.1f}/5', 'Rating: {t:.1f}/10', 'Rating: New',
+            'Rating: Unranked', 'Rating: Not yet rated', 'Rating: Top', 'Rating: {r:.2f}')
+# Mostly KES; the rest are currencies without a configured rate, which the pipeline leaves unpriced.
+_CURRENCIES = ('KES ',) * 18 + ('Ksh.', 'USD ')
+
+
+def _format(templates, rng, n_rows, **fields):
+      """
+      Fill randomly chosen templates with per-row field values.
+
+      Args:
+            templates (tuple): Format strings.
+            rng (np.random.Generator): Random source.
+            n_rows (int): Number of strings to build.
+            **fields: Arrays of length `n_rows`, one per template field.
+
+      Returns:
+            np.ndarray: Object array of formatted strings.
+      """
+      choice = rng.integers(0, len(templates), size=n_rows)
+      names = list(fields)
+      columns = [fields[name].tolist() for name in names]
+      return np.array([templates[t].format(**dict(zip(names, values))) for t, *values in zip(choice.tolist(), *columns)],
+                      dtype=object)
+
+
+def _add_noise(values, rng, noise):
+      """
+      Perturb a fraction `noise` of the strings by changing case, doubling a space or dropping a character.
+
+      Args:
+            values (np.ndarray): Object array of strings, modified in place.
+            rng (np.random.Generator): Random source.
+            noise (float): Fraction of strings to perturb.
+
+      Returns:
+            np.ndarray: The perturbed array.
+      """
+      rows = np.flatnonzero(rng.random(len(values)) < noise)
+      kinds = rng.integers(0, 4, size=len(rows))
+      positions = rng.random(len(rows))
+      for row, kind, position in zip(rows.tolist(), kinds.tolist(), positions.tolist()):
+            text = values[row]
+            cut = int(position * len(text))
+            if kind == 0:
+                  values[row] = text.lower()
+            elif kind == 1:
+                  values[row] = text.upper()
+            elif kind == 2:
+                  values[row] = text.replace(' ', '  ', 1)
+            else:
+                  values[row] = text[:cut] + text[cut + 1:]
+      return values
+
+
+def generate_accounts(n_rows, duplicate_ratio=0.5, noise=0.05, missing=0.08, seed=0, parameter_dict=None):
+      """
+      Generate synthetic scraped listings.
+
+      Args:
+            n_rows (int): Number of rows.
+            duplicate_ratio (float): Fraction of rows that repeat an earlier row exactly (default is 0.5,
+                  close to the scraped data, where about half the listings are re-posts).
+            noise (float): Fraction of text cells that are perturbed (default is 0.05).
+            missing (float): Fraction of rows left empty, as the scraper leaves them (default is 0.08).
+            seed (int): Seed for the random generator (default is 0).
+            parameter_dict (ConfigParameters, optional): Supplies the vocabulary; a fresh
+                  `ConfigParameters` by default.
+
+      Returns:
+            pd.DataFrame: Columns 'Header', 'Type', 'Rating' and 'Price'.
+
+      Raises:
+            ValueError: If a ratio is outside [0, 1).
+      """
+      try:
+            for name, ratio in (('duplicate_ratio', duplicate_ratio), ('noise', noise), ('missing', missing)):
+                  if not 0 <= ratio < 1:
+                        raise ValueError(f"{name} must be in [0, 1), got {ratio}.")
+            parameter_dict = parameter_dict or ConfigParameters()
+            rng = np.random.default_rng(seed)
+            n_unique = max(1, int(round(n_rows * (1 - duplicate_ratio))))
+
+            account_names = np.array(list(parameter_dict['account_name_patterns']), dtype=object)
+            # A few account names dominate the listings, as in the scraped data.
+            weights = 1.0 / np.arange(1, len(account_names) + 1)
+            names = rng.choice(account_names, size=n_unique, p=weights / weights.sum())
+            phrases = _format(_ORDER_PHRASES, rng, n_unique,
+                              n=rng.integers(1, 3000, size=n_unique), k=rng.integers(1, 10, size=n_unique))
+            headers = _add_noise(names + ' ' + phrases, rng, noise)
+            conditions = _add_noise(np.array(_CONDITIONS, dtype=object)[rng.integers(0, len(_CONDITIONS), size=n_unique)], rng, noise)
+            ratings = _add_noise(_format(_RATINGS, rng, n_unique,
+                                         r=rng.uniform(3.5, 5.0, size=n_unique),
+                                         p=rng.integers(70, 101, size=n_unique),
+                                         t=rng.uniform(7.0, 10.0, size=n_unique)), rng, noise)
+            amounts = np.round(rng.lognormal(11, 0.6, size=n_unique), -2).astype(np.int64)
+            currencies = np.array(_CURRENCIES, dtype=object)[rng.integers(0, len(_CURRENCIES), size=n_unique)]
+            prices = _add_noise(currencies + np.array([f'{amount:,}' for amount in amounts.tolist()], dtype=object), rng, noise)
+
+            unique = pd.DataFrame({'Header': headers, 'Type': conditions, 'Rating': ratings, 'Price': prices})
+            # Every unique row appears once; the remaining rows repeat randomly chosen unique rows.
+            picks = np.concatenate([np.arange(n_unique), rng.integers(0, n_unique, size=n_rows - n_unique)])
+            df = unique.iloc[rng.permutation(picks)[:n_rows]].reset_index(drop=True)
+            df.loc[rng.random(n_rows) < missing] = np.nan
+            return df
+      except Exception as e:
+            logger.error(f"Error in generate_accounts: {e}")
+            raise e
+
+
+def write_synthetic_csv(path, n_rows, chunksize=1_000_000, seed=0, **kwargs):
+      """
+      Write a synthetic CSV of `n_rows` rows, generated and written `chunksize` rows at a time.
+
+      Duplicates are drawn within each chunk, so the duplicate ratio holds per chunk and, up to rare
+      coincidences between chunks, over the whole file.
+
+      Args:
+            path (str): Destination CSV path.
+            n_rows (int): Number of rows.
+            chunksize (int): Rows generated at a time (default is 1,000,000).
+            seed (int): Seed of the first chunk; chunk i uses `seed + i` (default is 0).
+            **kwargs: Passed to `generate_accounts`.
+
+      Returns:
+            str: The destination path.
+      """
+      written = 0
+      for i, start in enumerate(range(0, n_rows, chunksize)):
+            chunk = generate_accounts(min(chunksize, n_rows - start), seed=seed + i, **kwargs)
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+            written += len(chunk)
+      logger.info(f'Wrote {written:,} Synthetic Rows to {path}')
+      return path
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+      """The first 40 rows of the scraped `freelance_accounts.csv`, which start with two empty rows."""
+      path = tmp_path / 'sample.csv'
+      with open(os.path.join(ROOT, 'freelance_accounts.csv'), encoding='utf-8') as f:
+            path.write_text(''.join(f.readline() for _ in range(41)), encoding='utf-8')
+      return str(path)
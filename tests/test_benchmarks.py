@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import benchmarks
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_benchmark_orders_done_reports_both_timings(monkeypatch):
+      # 'CSV_URL' is relative to the repository root.
+      monkeypatch.chdir(ROOT)
+      result = benchmarks.benchmark_orders_done(500)
+      assert set(result) == {'rows', 'legacy_seconds', 'vectorized_seconds', 'speedup'}
+      assert result['rows'] == 500
+      assert result['legacy_seconds'] > 0 and result['vectorized_seconds'] > 0
+      assert result['speedup'] == result['legacy_seconds'] / result['vectorized_seconds']
+
+
+def test_compare_to_baseline_reports_only_real_regressions():
+      baseline = {'1000': [{'stage': 'get_data', 'seconds': 1.0, 'peak_memory_bytes': 10 << 20},
+                           {'stage': 'drop_na', 'seconds': 0.01, 'peak_memory_bytes': None}]}
+      results = {'1000': [{'stage': 'get_data', 'seconds': 1.5, 'peak_memory_bytes': 11 << 20},
+                          # Relatively much slower, but by less than `min_seconds`.
+                          {'stage': 'drop_na', 'seconds': 0.04, 'peak_memory_bytes': 1 << 30},
+                          {'stage': 'new_stage', 'seconds': 9.0, 'peak_memory_bytes': None}]}
+      assert benchmarks.compare_to_baseline(results, baseline) == [
+            {'size': '1000', 'stage': 'get_data', 'metric': 'seconds', 'baseline': 1.0, 'current': 1.5}]
+      assert benchmarks.compare_to_baseline(results, baseline, tolerance=0.6) == []
+
+
+def test_imputation_strategies_are_ranked_by_accuracy():
+      rng = np.random.default_rng(0)
+      orders, rating = rng.integers(0, 500, size=400), rng.uniform(3.5, 5.0, size=400).round(1)
+      cleaned = pd.DataFrame({'name': 'Studypool', 'orders_done': orders, 'rating': rating,
+                              'price': 100.0 * orders + 1000.0 * rating})
+      table = benchmarks.compare_imputation_strategies(cleaned, 0.1, ['drop_missing_values', 'impute_mean', 'impute_with_regression'],
+                                                       workers=1, trace_memory=False)
+      assert len(table) == 3 * len(benchmarks.IMPUTED_COLUMNS)
+      for column, ranked in table.groupby('column'):
+            # The columns are exact linear functions of each other, which only regression recovers.
+            assert list(ranked.sort_values('rank')['strategy']) == ['impute_with_regression', 'impute_mean', 'drop_missing_values']
+            assert ranked.set_index('strategy').loc['drop_missing_values', 'coverage'] == 0
+      assert benchmarks.choose_imputation_strategy(table, 'price', max_normalized_rmse=0.01, min_coverage=0.5) == 'impute_with_regression'
+      assert benchmarks.choose_imputation_strategy(table, 'price', max_normalized_rmse=1e-9, min_coverage=1.0) is None
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from cleaning_rules import ConditionalRule, any_of, apply_rules, column_at_most, column_equals, group_median_of, median_of
+
+
+def test_group_median_counts_only_valid_values():
+      df = pd.DataFrame({
+            'name': ['a'] * 7 + ['b'] * 3,
+            'price': [100, 200, 300, 400, 1000, 2000, 3000, 5000, 6000, 7000],
+      })
+      median = group_median_of('price', ['name'], min_group_size=3, valid=lambda prices: prices > 500)(df)
+      # Group a has only three real prices; the placeholders neither set its median nor its size.
+      np.testing.assert_array_equal(median, [2000] * 7 + [6000] * 3)
+
+
+def test_small_groups_fall_back_to_the_median_of_valid_values():
+      df = pd.DataFrame({'name': ['a', 'a', 'a', 'b', 'b', 'b'], 'price': [100, 200, 1000, 4000, 5000, 6000]})
+      median = group_median_of('price', ['name'], min_group_size=2, valid=lambda prices: prices > 500)(df)
+      np.testing.assert_array_equal(median, [4500] * 3 + [5000] * 3)
+
+
+def test_placeholder_rule_never_fills_a_placeholder():
+      df = pd.DataFrame({'name': ['a'] * 6, 'price': [100.0, 200.0, 300.0, 400.0, 900.0, 1100.0]})
+      rule = ConditionalRule('price', column_at_most('price', 500),
+                             group_median_of('price', ['name'], min_group_size=2, valid=lambda prices: prices > 500))
+      assert rule.apply(df) == 4
+      assert (df['price'] > 500).all()
+
+
+def test_rating_rule_treats_missing_values_as_no_match():
+      df = pd.DataFrame({'orders_done': pd.array([0, 5, None, 12, 0], dtype='Int64'),
+                         'condition': ['used', 'new', 'new', None, np.nan],
+                         'rating': [4.0, 3.5, np.nan, 4.8, np.nan]})
+      rule = ConditionalRule('rating', any_of(column_equals('orders_done', 0), column_equals('condition', 'new')), 5.0, 'rating')
+      assert apply_rules(df, [rule]) == {'rating': 4}
+      # Missing orders or conditions never match, so the fourth rating is kept.
+      np.testing.assert_array_equal(df['rating'], [5.0, 5.0, 5.0, 4.8, 5.0])
+
+
+def test_rules_run_in_order_and_only_on_the_given_rows():
+      df = pd.DataFrame({'price': [0.0, 100.0, 2000.0, 4000.0, 0.0]})
+      rows = pd.Series([True, True, True, True, False])
+      rules = [ConditionalRule('price', column_at_most('price', 500), median_of('price', exclude=0), 'placeholders'),
+               # Sees the prices the first rule filled in.
+               ConditionalRule('price', column_equals('price', 2000.0), 1.0, 'median')]
+      assert apply_rules(df, rules, rows) == {'placeholders': 2, 'median': 3}
+      # The median is taken over the given rows only: 100, 2000 and 4000.
+      np.testing.assert_array_equal(df['price'], [1.0, 1.0, 1.0, 4000.0, 0.0])
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from data_cleaning_and_transformation import DataCleanerAndTransformer
+from parameter_dictionary import ConfigParameters
+
+
+@pytest.fixture
+def cleaner(sample_csv):
+      cleaner = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False)
+      cleaner.rd_processor.csv_path = sample_csv
+      cleaner.df = cleaner.rd_processor.process()
+      return cleaner
+
+
+def test_combined_filter_matches_dropping_duplicates_first(cleaner, sample_csv):
+      reference = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False)
+      reference.rd_processor.csv_path = sample_csv
+      reference.df = reference.rd_processor.process()
+      for step in ('transform_columns', 'drop_duplicates', 'update_rating_col', 'impute_price', 'drop_incomplete_rows'):
+            getattr(reference, step)()
+
+      pd.testing.assert_frame_equal(cleaner.clean_and_transform(), reference.df)
+      assert cleaner.rule_report == reference.rule_report
+
+
+def test_cleaned_frame_shares_no_memory_with_processed_frame(cleaner):
+      processed = cleaner.rd_processor.df.copy(deep=True)
+      cleaned = cleaner.clean_and_transform()
+      cleaned.loc[cleaned.index[0], 'price'] = -1.0
+      cleaned.loc[cleaned.index[0], 'orders_done'] = -1
+      pd.testing.assert_frame_equal(cleaner.rd_processor.df, processed)
+
+
+def test_legacy_filter_steps_match_the_combined_filter(cleaner, sample_csv):
+      reference = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False)
+      reference.rd_processor.csv_path = sample_csv
+      reference.df = reference.rd_processor.process()
+      for step in ('transform_columns', 'drop_duplicates', 'update_rating_col', 'impute_price'):
+            getattr(reference, step)()
+      # The steps as `clean_and_transform` ran them before `drop_incomplete_rows` replaced them.
+      expected = reference.df.dropna(subset=['name']).dropna(axis=0)
+      reference.clean_name_col()
+      pd.testing.assert_frame_equal(reference._dropna_(), expected)
+      pd.testing.assert_frame_equal(reference.df, cleaner.clean_and_transform())
@@ -0,0 +1,217 @@
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.exceptions import NotFittedError
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer, KNNImputer
+
+import imputation_methods
+from missingness import MissingnessProfile
+from test_missingness import assert_same_profile
+
+
+@pytest.fixture
+def frame():
+      rng = np.random.default_rng(0)
+      df = pd.DataFrame(rng.normal(size=(200, 4)), columns=list('abcd'))
+      return df.mask(rng.random(df.shape) < 0.2)
+
+
+@pytest.mark.parametrize('axis', [0, 1])
+@pytest.mark.parametrize('threshold', [0.05, 0.3, 0.6])
+def test_drop_missing_values_with_profile_matches_dropna(frame, axis, threshold):
+      profile = MissingnessProfile(frame)
+      expected = imputation_methods.drop_missing_values(frame, axis, threshold)
+      pd.testing.assert_frame_equal(imputation_methods.drop_missing_values(frame, axis, threshold, profile=profile), expected)
+
+
+def test_drop_missing_values_counts_only_the_given_columns(frame):
+      # The profile has more columns than the frame passed in.
+      profile = MissingnessProfile(frame)
+      subset = frame[['a', 'b']]
+      expected = imputation_methods.drop_missing_values(subset, 0, 0.3)
+      pd.testing.assert_frame_equal(imputation_methods.drop_missing_values(subset, 0, 0.3, profile=profile), expected)
+
+
+def test_grouped_polynomial_interpolation_falls_back_to_linear_for_small_groups():
+      df = pd.DataFrame({
+            'name': ['x'] * 6 + ['y'] * 3 + ['z'] * 2,
+            'a': [1, np.nan, 9, 16, np.nan, 36, 1, np.nan, 3, 5, np.nan],
+      })
+      result = imputation_methods.impute_interpolation(df.copy(), 'a', method='polynomial', order=2, group_col='name')
+      # Group x has four known points and follows the quadratic; y and z are too small for it.
+      np.testing.assert_allclose(result['a'].iloc[:6], [1, 4, 9, 16, 25, 36])
+      np.testing.assert_allclose(result['a'].iloc[6:9], [1, 2, 3])
+      np.testing.assert_allclose(result['a'].iloc[9:], [5, 5])
+
+
+def test_grouped_polynomial_interpolation_uses_ranks_within_the_group():
+      # Group x is interleaved unevenly with y; its values are the squares of its own row ranks.
+      df = pd.DataFrame({'name': ['x', 'x', 'y', 'x', 'y', 'y', 'x', 'x', 'y', 'x'],
+                         'a': [0, 1, 7, 4, 7, 7, np.nan, 16, 7, 25]})
+      result = imputation_methods.impute_interpolation(df.copy(), 'a', method='polynomial', order=2, group_col='name')
+      assert result.loc[6, 'a'] == pytest.approx(9)
+      linear = imputation_methods.impute_interpolation(df.copy(), 'a', method='linear', group_col='name')
+      assert linear.loc[6, 'a'] == pytest.approx(10)
+
+
+def test_grouped_linear_interpolation_matches_per_group_interpolate():
+      rng = np.random.default_rng(1)
+      df = pd.DataFrame({'name': rng.choice(['x', 'y', 'z', None], 300), 'order': rng.integers(0, 50, 300),
+                         'a': rng.normal(size=300), 'b': rng.normal(size=300)})
+      df[['a', 'b']] = df[['a', 'b']].mask(rng.random((300, 2)) < 0.3)
+      result = imputation_methods.impute_interpolation(df.copy(), ['a', 'b'], group_col='name', order_col='order')
+      expected = df.copy()
+      for _, group in df.sort_values('order', kind='stable').groupby('name'):
+            expected.loc[group.index, ['a', 'b']] = group[['a', 'b']].reset_index(drop=True).interpolate().to_numpy()
+      pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_blocked_knn_matches_knn_imputer_within_memory_ceiling(n_jobs):
+      rng = np.random.default_rng(0)
+      X = rng.normal(size=(4000, 3))
+      X[rng.random(X.shape) < 0.1] = np.nan
+      tracemalloc.start()
+      try:
+            base = tracemalloc.get_traced_memory()[0]
+            result = imputation_methods.impute_knn_blocked(X, 5, max_memory_mb=2, n_jobs=n_jobs)
+            peak = tracemalloc.get_traced_memory()[1] - base
+      finally:
+            tracemalloc.stop()
+      assert peak <= 2 * 2**20
+      np.testing.assert_allclose(result, KNNImputer(n_neighbors=5).fit_transform(X))
+
+
+@pytest.mark.parametrize('with_profile', [False, True])
+def test_mean_imputation_of_nullable_integers_casts_to_float(with_profile):
+      df = pd.DataFrame({'orders_done': pd.array([1, 2, None, 4], dtype='Int64'),
+                         'reviews': pd.array([1, 3, None, 5], dtype='Int64')})
+      profile = MissingnessProfile(df) if with_profile else None
+      result = imputation_methods.StatisticImputer('mean', ['orders_done', 'reviews']).fit_transform(df, profile)
+      # The mean of orders_done is 7/3; the mean of reviews is a whole number and keeps the column's dtype.
+      assert result['orders_done'].dtype == np.float64
+      np.testing.assert_allclose(result['orders_done'], [1, 2, 7 / 3, 4])
+      assert result['reviews'].dtype == 'Int64'
+      assert result['reviews'].tolist() == [1, 3, 3, 5]
+
+
+@pytest.mark.parametrize('strategy', ['mean', 'median', 'mode'])
+def test_streaming_imputer_fits_a_frame_or_chunks(frame, strategy):
+      frame = frame.round(1)
+      expected = imputation_methods.StatisticImputer(strategy, ['a', 'b']).fit_transform(frame.copy())
+      streamed = imputation_methods.StreamingImputer(strategy, ['a', 'b'])
+      pd.testing.assert_frame_equal(streamed.fit_transform(frame.copy()), expected)
+      chunks = streamed.fit_transform([frame.iloc[:70].copy(), frame.iloc[70:].copy()])
+      pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+      with pytest.raises(TypeError):
+            streamed.fit_transform(iter([frame.copy()]))
+
+
+def test_blocked_knn_keeps_all_missing_columns_without_warnings():
+      X = np.array([[1.0, np.nan, 2.0], [np.nan, np.nan, 3.0], [2.0, np.nan, np.nan], [4.0, np.nan, 5.0]])
+      with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            result = imputation_methods.impute_knn_blocked(X, 2)
+      assert np.isnan(result[:, 1]).all()
+      np.testing.assert_allclose(np.delete(result, 1, axis=1), KNNImputer(n_neighbors=2).fit_transform(X))
+
+
+def _correlated(seed, n_rows=500, missing=0.05):
+      rng = np.random.default_rng(seed)
+      z = rng.normal(size=n_rows)
+      X = np.column_stack([z, 2 * z + rng.normal(scale=0.5, size=n_rows), rng.normal(size=n_rows)])
+      X[rng.random(X.shape) < missing] = np.nan
+      return X
+
+
+def test_mice_imputer_matches_iterative_imputer():
+      X = _correlated(0)
+      expected = IterativeImputer(max_iter=30, random_state=0).fit_transform(X)
+      result = imputation_methods.MICEImputer(max_iter=30).fit_transform(X)
+      np.testing.assert_allclose(result[~np.isnan(X)], X[~np.isnan(X)])
+      # Both converge towards the same chained-equations fixed point; rows missing two correlated
+      # values converge slowest and differ most.
+      np.testing.assert_allclose(result, expected, atol=0.1)
+      assert np.abs(result - expected)[np.isnan(X)].mean() < 0.01
+
+
+def test_mice_warm_start_shares_one_round_budget():
+      imputer = imputation_methods.MICEImputer(max_iter=4, tol=0.0, warm_rounds=2)
+      imputer.fit_transform(_correlated(0))
+      assert [round['refit'] for round in imputer.history_] == [True] * 4
+      imputer.fit_transform(_correlated(1))
+      assert [round['refit'] for round in imputer.history_] == [False, False, True, True]
+      imputer.transform(_correlated(2))
+      assert [round['refit'] for round in imputer.history_] == [False] * 4
+      assert imputer.n_iter_ == 4
+
+
+def test_mice_transform_requires_a_fitted_imputer():
+      with pytest.raises(NotFittedError):
+            imputation_methods.MICEImputer().transform(_correlated(0))
+
+
+def test_mice_parallel_options_are_rejected_by_the_sklearn_engine():
+      df = pd.DataFrame(_correlated(0), columns=list('abc'))
+      with pytest.raises(ValueError):
+            imputation_methods.impute_mice(df, list('abc'), max_iter=5)
+
+
+def test_regression_imputes_each_target_from_the_original_features(monkeypatch):
+      monkeypatch.setattr(imputation_methods, '_regression_models', imputation_methods.OrderedDict())
+      df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 4.0, 5.0, np.nan],
+                         'y': [2.0, 4.0, np.nan, 8.0, 10.0, 12.0],
+                         'z': [3.0, 6.0, 9.0, np.nan, 15.0, 18.0]})
+      result = imputation_methods.impute_with_regression(df.copy(), ['y', 'z'], ['x', 'y', 'z'])
+      # y is fitted on x and z where all three are present, and so is z; the row missing x stays missing.
+      np.testing.assert_allclose(result['y'], [2.0, 4.0, 6.0, 8.0, 10.0, 12.0])
+      np.testing.assert_allclose(result['z'], [3.0, 6.0, 9.0, 12.0, 15.0, 18.0])
+      assert np.isnan(result.loc[5, 'x'])
+      reordered = imputation_methods.impute_with_regression(df.copy(), ['z', 'y'], ['x', 'y', 'z'])
+      pd.testing.assert_frame_equal(reordered, result)
+
+
+def test_regression_models_are_reused_for_identical_training_data(monkeypatch):
+      monkeypatch.setattr(imputation_methods, '_regression_models', imputation_methods.OrderedDict())
+      fits = []
+      original_fit = imputation_methods.LinearRegression.fit
+      monkeypatch.setattr(imputation_methods.LinearRegression, 'fit',
+                          lambda self, X, y: fits.append(len(y)) or original_fit(self, X, y))
+      df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 4.0], 'y': [2.0, np.nan, 6.0, 8.0]})
+      first = imputation_methods.impute_with_regression(df.copy(), 'y', 'x')
+      second = imputation_methods.impute_with_regression(df.copy(), 'y', 'x')
+      pd.testing.assert_frame_equal(first, second)
+      assert fits == [3]
+      imputation_methods.impute_with_regression(df.copy(), 'y', 'x', cache=False)
+      changed = df.assign(x=[1.0, 2.0, 3.0, 5.0])
+      imputation_methods.impute_with_regression(changed, 'y', 'x')
+      assert fits == [3, 3, 3]
+
+
+@pytest.mark.parametrize('impute, kwargs', [
+      (imputation_methods.impute_mice, {}),
+      (imputation_methods.impute_mice, {'engine': 'parallel'}),
+      (imputation_methods.impute_interpolation, {}),
+      (imputation_methods.impute_interpolation, {'group_col': 'name'}),
+      (imputation_methods.impute_backward_fill, {'group_col': 'name'}),
+      (imputation_methods.impute_forward_fill, {}),
+])
+def test_imputers_keep_the_profile_up_to_date(frame, impute, kwargs):
+      frame['name'] = np.arange(len(frame)) % 3
+      frame['d'] = frame['d'].fillna(0.0)
+      expected = impute(frame.copy(), list('abcd'), **kwargs)
+      profile = MissingnessProfile(frame)
+      result = impute(frame, list('abcd'), profile=profile, **kwargs)
+      pd.testing.assert_frame_equal(result, expected)
+      assert_same_profile(profile, MissingnessProfile(result))
+
+
+def test_imputers_skip_frames_the_profile_records_as_complete(monkeypatch):
+      df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [2.0, 4.0, 6.0]})
+      monkeypatch.setattr(imputation_methods, 'IterativeImputer', None)
+      result = imputation_methods.impute_mice(df.copy(), ['a', 'b'], profile=MissingnessProfile(df))
+      pd.testing.assert_frame_equal(result, df)
@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+from data_cleaning_and_transformation import DataCleanerAndTransformer
+from incremental_processing import IncrementalProcessor
+from parameter_dictionary import ConfigParameters
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def scraped_lines():
+      """The header and first 1500 rows of the scraped `freelance_accounts.csv`."""
+      with open(os.path.join(ROOT, 'freelance_accounts.csv'), 'rb') as f:
+            return [f.readline() for _ in range(1501)]
+
+
+def _full_run(path):
+      cleaner = DataCleanerAndTransformer(ConfigParameters(), process_on_init=False)
+      cleaner.rd_processor.csv_path = str(path)
+      cleaner.df = cleaner.rd_processor.process()
+      return cleaner.clean_and_transform()
+
+
+def _update(path, state_dir):
+      return IncrementalProcessor(ConfigParameters(), str(state_dir), csv_path=str(path)).update()
+
+
+def test_appended_rows_match_a_full_run(tmp_path, scraped_lines):
+      path = tmp_path / 'accounts.csv'
+      path.write_bytes(b''.join(scraped_lines[:600]))
+      pd.testing.assert_frame_equal(_update(path, tmp_path / 'state'), _full_run(path))
+      with open(path, 'ab') as f:
+            f.write(b''.join(scraped_lines[600:]))
+      processor = IncrementalProcessor(ConfigParameters(), str(tmp_path / 'state'), csv_path=str(path))
+      cleaned = processor.update()
+      pd.testing.assert_frame_equal(cleaned, _full_run(path))
+      pd.testing.assert_frame_equal(processor.load_cleaned(), cleaned)
+      # Only the current version of the state is kept.
+      assert sorted(os.listdir(tmp_path / 'state')) == ['CURRENT', open(tmp_path / 'state' / 'CURRENT').read()]
+
+
+def test_rewriting_an_early_row_reprocesses_the_file(tmp_path, scraped_lines):
+      path = tmp_path / 'accounts.csv'
+      path.write_bytes(b''.join(scraped_lines))
+      before = _update(path, tmp_path / 'state')
+      # A same-length edit far before the processed offset.
+      data = path.read_bytes()
+      assert data.index(b'KES 50,000') < len(data) - 100_000
+      path.write_bytes(data.replace(b'KES 50,000', b'KES 90,000', 1))
+      after = _update(path, tmp_path / 'state')
+      pd.testing.assert_frame_equal(after, _full_run(path))
+      assert not after.equals(before)
+
+
+def test_partly_written_last_row_waits_for_its_line_break(tmp_path, scraped_lines):
+      path = tmp_path / 'accounts.csv'
+      last = scraped_lines[600]
+      path.write_bytes(b''.join(scraped_lines[:600]) + last[:len(last) // 2])
+      partial = _update(path, tmp_path / 'state')
+      complete = tmp_path / 'complete.csv'
+      complete.write_bytes(b''.join(scraped_lines[:600]))
+      pd.testing.assert_frame_equal(partial, _full_run(complete))
+
+      with open(path, 'ab') as f:
+            f.write(last[len(last) // 2:])
+      pd.testing.assert_frame_equal(_update(path, tmp_path / 'state'), _full_run(path))
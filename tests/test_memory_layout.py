@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from memory_layout import compact_frame
+
+
+def test_columns_and_index_are_narrowed():
+      df = pd.DataFrame({'account_name': ['Studypool', 'Edusson', 'Studypool', 'Edusson'] * 25,
+                         'header': [f'listing {i}' for i in range(100)],
+                         'orders_done': pd.array([0, 120, None, 2000] * 25, dtype='Int64'),
+                         'count': np.arange(100, dtype=np.int64),
+                         'price': np.linspace(1000.0, 90000.0, 100)},
+                        index=pd.RangeIndex(100).astype(np.int64))
+      compact, report = compact_frame(df)
+      assert isinstance(compact['account_name'].dtype, pd.CategoricalDtype)
+      # Mostly distinct strings stay strings.
+      assert compact['header'].dtype == object
+      assert str(compact['orders_done'].dtype) == 'Int16'
+      assert str(compact['count'].dtype) == 'Int8'
+      assert compact['price'].dtype == np.float32
+      assert compact.index.dtype == np.int8
+      assert report['columns']['count'] == ('int64', 'Int8')
+      assert report['after_bytes'] < report['before_bytes']
+      assert report['saved_bytes'] == report['before_bytes'] - report['after_bytes']
+
+
+def test_values_round_trip():
+      df = pd.DataFrame({'condition': ['new', 'used', np.nan] * 10,
+                         'orders_done': pd.array([5, None, 70000] * 10, dtype='Int64'),
+                         'rating': [4.5, np.nan, 3.9] * 10})
+      compact, _ = compact_frame(df)
+      restored = compact.astype({'condition': object, 'orders_done': 'Int64', 'rating': np.float64})
+      restored.index = restored.index.astype(np.int64)
+      pd.testing.assert_frame_equal(restored, df, rtol=1e-6)
+      # The input frame is left unchanged.
+      assert df['orders_done'].dtype == 'Int64'
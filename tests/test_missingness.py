@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from missingness import MissingnessProfile
+
+
+def assert_same_profile(profile, expected):
+      np.testing.assert_array_equal(profile.bitmasks, expected.bitmasks)
+      np.testing.assert_array_equal(profile.row_null_counts, expected.row_null_counts)
+      pd.testing.assert_series_equal(profile.column_null_counts, expected.column_null_counts)
+
+
+def _frame():
+      rng = np.random.default_rng(0)
+      df = pd.DataFrame(rng.normal(size=(37, 3)), columns=list('abc'))
+      return df.mask(rng.random(df.shape) < 0.3)
+
+
+def test_masks_match_isna():
+      df = _frame()
+      profile = MissingnessProfile(df)
+      np.testing.assert_array_equal(profile.mask(), df.isna().to_numpy())
+      np.testing.assert_array_equal(profile.mask(['c', 'a']), df[['c', 'a']].isna().to_numpy())
+      np.testing.assert_array_equal(profile.any_missing(['a', 'b']), df[['a', 'b']].isna().any(axis=1).to_numpy())
+      assert not profile.any_missing([]).any()
+
+
+def test_mark_filled_matches_a_fresh_scan():
+      df = _frame()
+      profile = MissingnessProfile(df)
+      rows = np.flatnonzero(df['b'].isna().to_numpy())[::2]
+      df.iloc[rows, 1] = 0.0
+      profile.mark_filled('b', rows)
+      df['a'] = df['a'].fillna(0.0)
+      profile.mark_filled('a')
+      assert_same_profile(profile, MissingnessProfile(df))
+
+
+def test_refresh_matches_a_fresh_scan():
+      df = _frame()
+      profile = MissingnessProfile(df)
+      # Values can be filled and removed.
+      df['c'] = df['c'].fillna(1.0).mask(np.arange(len(df)) % 5 == 0)
+      profile.refresh(df, 'c')
+      assert_same_profile(profile, MissingnessProfile(df))
@@ -0,0 +1,53 @@
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from parameter_dictionary import ConfigParameters
+from pipeline_profiling import PipelineProfiler
+from raw_data_processor import RawDataProcessor
+
+
+def test_stage_records_rows_time_and_memory():
+      profiler = PipelineProfiler()
+      owner = SimpleNamespace(df=pd.DataFrame({'a': range(10)}))
+      with profiler.stage('drop_odd', owner):
+            owner.df = owner.df[owner.df['a'] % 2 == 0].copy()
+      record, = profiler.records
+      assert record['stage'] == 'drop_odd'
+      assert (record['rows_in'], record['rows_out']) == (10, 5)
+      assert record['wall_seconds'] >= 0 and record['cpu_seconds'] >= 0
+      assert record['peak_memory_delta_bytes'] > 0
+      assert record['frame_memory_bytes'] == owner.df.memory_usage(deep=True).sum()
+
+
+def test_stage_is_recorded_when_it_raises():
+      profiler = PipelineProfiler(trace_memory=False)
+      owner = SimpleNamespace(df=None)
+      with pytest.raises(ValueError):
+            with profiler.stage('failing', owner):
+                  raise ValueError('stage failed')
+      record, = profiler.records
+      assert record['rows_in'] is None and record['peak_memory_delta_bytes'] is None
+
+
+def test_processor_report_covers_every_stage(sample_csv):
+      processor = RawDataProcessor(ConfigParameters(), profile=True)
+      processor.csv_path = sample_csv
+      processed = processor.process()
+      report = processor.profiling_report()
+      frame = report.to_frame()
+      assert list(frame.columns) == ['stage', 'wall_seconds', 'cpu_seconds', 'rows_in', 'rows_out',
+                                     'peak_memory_delta_bytes', 'frame_memory_bytes']
+      assert frame['stage'].iloc[0] == 'RawDataProcessor.get_data'
+      assert frame['rows_out'].iloc[-1] == len(processed)
+      document = json.loads(report.to_json())
+      assert document['total_wall_seconds'] == pytest.approx(frame['wall_seconds'].sum())
+      assert document['dedup'] == processor.dedup_report
+
+
+def test_report_requires_profiling():
+      processor = RawDataProcessor(ConfigParameters())
+      with pytest.raises(ValueError):
+            processor.profiling_report()
@@ -0,0 +1,31 @@
+import os
+import shutil
+
+import pandas as pd
+
+import processed_cache
+from parameter_dictionary import ConfigParameters
+from raw_data_processor import RawDataProcessor
+
+
+def test_round_trip_returns_the_processed_frame(tmp_path, sample_csv):
+      processor = RawDataProcessor(ConfigParameters())
+      processor.csv_path = sample_csv
+      processed = processor.process()
+      cache = processed_cache.ProcessedDataCache(str(tmp_path / 'cache'))
+      key = cache.key(sample_csv, ConfigParameters())
+      cache.store(key, processed, sample_csv)
+      pd.testing.assert_frame_equal(cache.load(key), processed)
+
+
+def test_key_changes_with_the_loading_code(tmp_path, sample_csv, monkeypatch):
+      # Run the key against copies of the modules, so one of them can be edited.
+      source = os.path.dirname(os.path.abspath(processed_cache.__file__))
+      for module in processed_cache._PROCESSING_MODULES:
+            shutil.copy(os.path.join(source, module), tmp_path / module)
+      monkeypatch.setattr(processed_cache, '__file__', str(tmp_path / 'processed_cache.py'))
+      cache = processed_cache.ProcessedDataCache(str(tmp_path / 'cache'))
+      before = cache.key(sample_csv, ConfigParameters())
+      with open(tmp_path / 'data_ingestion.py', 'a', encoding='utf-8') as f:
+            f.write('\n# A loader change.\n')
+      assert cache.key(sample_csv, ConfigParameters()) != before
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from parameter_dictionary import ConfigParameters
+from raw_data_processor import RawDataProcessor
+from synthetic_data import generate_accounts
+
+
+def _processor(csv_path):
+      processor = RawDataProcessor(ConfigParameters())
+      processor.csv_path = csv_path
+      return processor
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 7, 1000])
+def test_streamed_chunks_match_process(sample_csv, chunksize):
+      expected = _processor(sample_csv).process()
+      streamed = pd.concat(list(_processor(sample_csv).iter_processed_chunks(chunksize)))
+      pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_all_empty_chunk_is_skipped(sample_csv):
+      # Rows 0 and 1 of the sample are empty, so the first chunk filters to nothing.
+      chunks = list(_processor(sample_csv).iter_processed_chunks(2))
+      assert chunks and all(not chunk.empty for chunk in chunks)
+      assert chunks[0].index[0] >= 2
+
+
+def test_take_or_bid_follows_bid_take_group(tmp_path):
+      csv_path = tmp_path / 'synthetic.csv'
+      generate_accounts(2000, noise=0.3, seed=5).to_csv(csv_path, index=False)
+      processed = _processor(str(csv_path)).process()
+      assert list(processed['account_name'].cat.categories) == list(ConfigParameters()['account_name_patterns'])
+      bid_take_group = ConfigParameters()['bid_take_group']
+      expected = [bid_take_group.get(name) for name in processed['account_name']]
+      assert processed['take_or_bid'].astype(object).where(processed['take_or_bid'].notna(), None).tolist() == expected
+
+
+def test_streamed_chunks_share_currency_categories(tmp_path):
+      # About one price in ten is in a currency without a rate, so small chunks see different currencies.
+      csv_path = tmp_path / 'synthetic.csv'
+      generate_accounts(400, seed=6).to_csv(csv_path, index=False)
+      expected = _processor(str(csv_path)).process()
+      chunks = []
+      _processor(str(csv_path)).process_to_sink(chunks.append, chunksize=10)
+      assert {tuple(chunk['price_currency'].cat.categories) for chunk in chunks} == {('KES', 'OTHER')}
+      pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+      assert set(expected['price_currency'].dropna()) == {'KES', 'OTHER'}
+
+
+@pytest.fixture
+def multiline_csv(tmp_path):
+      # Quoted headers with embedded line breaks, and prices in rated and unrated currencies.
+      df = generate_accounts(600, seed=7)
+      df.loc[::7, 'Header'] = df.loc[::7, 'Header'] + '\n"quoted" line\nthird line'
+      path = tmp_path / 'multiline.csv'
+      df.to_csv(path, index=False)
+      return str(path)
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+def test_sharded_processing_matches_process(multiline_csv, workers):
+      single = _processor(multiline_csv)
+      expected = single.process()
+      sharded = _processor(multiline_csv)
+      sharded.workers = workers
+      pd.testing.assert_frame_equal(sharded.process(), expected)
+      assert set(expected['price_currency'].dropna()) == {'KES', 'OTHER'}
+      assert sharded.dedup_report.keys() == single.dedup_report.keys()
+      assert all(sharded.dedup_report[column]['rows'] == counts['rows'] for column, counts in single.dedup_report.items())
+
+
+def test_sharding_a_header_only_csv_matches_process(tmp_path, sample_csv):
+      path = tmp_path / 'header.csv'
+      with open(sample_csv, encoding='utf-8') as f:
+            path.write_text(f.readline(), encoding='utf-8')
+      expected = _processor(str(path)).process()
+      sharded = _processor(str(path))
+      sharded.workers = 4
+      pd.testing.assert_frame_equal(sharded.process(), expected)
+
+
+def test_each_text_column_is_factorized_once_per_run(sample_csv, monkeypatch):
+      factorized = []
+      factorize = pd.factorize
+
+      def counting_factorize(values, *args, **kwargs):
+            factorized.append(getattr(values, 'name', None))
+            return factorize(values, *args, **kwargs)
+
+      monkeypatch.setattr(pd, 'factorize', counting_factorize)
+      processor = _processor(sample_csv)
+      processor.process()
+      assert sorted(factorized) == ['condition', 'description', 'price', 'rating']
+      # get_orders_done reuses the description codes, narrowed to the rows get_account_names kept.
+      assert processor.dedup_report['description']['rows'] == len(processor.df)
+      assert processor.dedup_report['description']['unique'] == processor.df['description'].nunique()
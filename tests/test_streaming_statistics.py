@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from streaming_statistics import HeavyHitters, QuantileSketch, RunningMoments
+
+
+def _chunks(values, size):
+      return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+def test_running_moments_merge_matches_a_direct_computation():
+      rng = np.random.default_rng(0)
+      values = rng.normal(1e6, 50.0, size=100_000)
+      values[rng.random(len(values)) < 0.1] = np.nan
+      moments = RunningMoments()
+      for chunk in _chunks(values, 7_000):
+            moments.update(chunk)
+      observed = values[~np.isnan(values)]
+      assert moments.count == len(observed)
+      assert moments.result() == pytest.approx(observed.mean(), rel=1e-12)
+      assert moments.variance == pytest.approx(observed.var(ddof=1), rel=1e-9)
+
+
+@pytest.mark.parametrize('k', [64, 512])
+def test_quantile_sketch_rank_error_is_within_its_bound(k):
+      rng = np.random.default_rng(1)
+      values = rng.lognormal(11, 0.6, size=200_000)
+      sketch = QuantileSketch(k)
+      for chunk in _chunks(values, 9_000):
+            sketch.update(chunk)
+      ordered = np.sort(values)
+      for q in np.linspace(0, 1, 21):
+            rank = np.searchsorted(ordered, sketch.quantile(q), side='right') / len(values)
+            assert abs(rank - q) <= sketch.error_bound() + 1 / len(values)
+
+
+def test_quantile_sketch_is_exact_before_compacting():
+      sketch = QuantileSketch(100)
+      sketch.update([5.0, np.nan, 1.0, 4.0, 2.0])
+      assert sketch.error_bound() == 0.0
+      assert sketch.result() == pd.Series([5.0, 1.0, 4.0, 2.0]).median()
+
+
+def test_heavy_hitters_keep_every_frequent_value():
+      rng = np.random.default_rng(2)
+      values = rng.zipf(1.3, size=100_000)
+      summary = HeavyHitters(capacity=50)
+      for chunk in _chunks(values, 4_000):
+            summary.update(chunk)
+      counts = pd.Series(values).value_counts()
+      frequent = counts[counts > summary.error_bound()]
+      assert len(frequent) > 0
+      assert set(frequent.index) <= set(summary.counts.index)
+      undercount = counts[summary.counts.index] - summary.counts
+      assert (undercount >= 0).all() and (undercount <= summary.error_bound()).all()
+      assert summary.result() == counts.index[0]
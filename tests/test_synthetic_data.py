@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from synthetic_data import generate_accounts, write_synthetic_csv
+
+
+def test_same_seed_gives_the_same_rows():
+      first = generate_accounts(400, seed=3)
+      pd.testing.assert_frame_equal(first, generate_accounts(400, seed=3))
+      assert not first.equals(generate_accounts(400, seed=4))
+      assert list(first.columns) == ['Header', 'Type', 'Rating', 'Price']
+
+
+def test_duplicate_ratio_and_missing_rows():
+      df = generate_accounts(2000, duplicate_ratio=0.5, missing=0.0, seed=1)
+      assert len(df) == 2000
+      # Every unique row is kept once, so about half the rows repeat one of them.
+      assert df.duplicated().sum() == 1000
+      assert df.notna().all().all()
+      assert generate_accounts(2000, missing=0.25, seed=1).isna().all(axis=1).mean() == pytest.approx(0.25, abs=0.05)
+
+
+def test_ratios_outside_the_unit_interval_are_rejected():
+      with pytest.raises(ValueError):
+            generate_accounts(10, duplicate_ratio=1.0)
+
+
+def test_chunked_csv_concatenates_the_chunks(tmp_path):
+      path = write_synthetic_csv(str(tmp_path / 'synthetic.csv'), 250, chunksize=100, seed=5, missing=0.0)
+      written = pd.read_csv(path)
+      expected = pd.concat([generate_accounts(100, seed=5, missing=0.0), generate_accounts(100, seed=6, missing=0.0),
+                            generate_accounts(50, seed=7, missing=0.0)], ignore_index=True)
+      pd.testing.assert_frame_equal(written, expected)
@@ -0,0 +1,110 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import legacy_get_orders_done
+from parameter_dictionary import ConfigParameters
+from raw_data_processor import RawDataProcessor
+from synthetic_data import generate_accounts
+from vectorized_extractors import PatternMatcher, extract_orders_done, extract_ratings, map_unique, parse_prices, rescale_ratings
+
+
+def _process(csv_path, fused):
+      processor = RawDataProcessor(ConfigParameters(), fused=fused)
+      processor.csv_path = csv_path
+      return processor.process()
+
+
+def test_fused_extraction_matches_stages_on_scraped_rows(sample_csv):
+      pd.testing.assert_frame_equal(_process(sample_csv, fused=True), _process(sample_csv, fused=False))
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_fused_extraction_matches_stages_on_noisy_synthetic_rows(tmp_path, seed):
+      # Heavy noise produces every pattern kind as well as strings that match none of them.
+      csv_path = tmp_path / 'synthetic.csv'
+      generate_accounts(5000, noise=0.3, seed=seed).to_csv(csv_path, index=False)
+      pd.testing.assert_frame_equal(_process(str(csv_path), fused=True), _process(str(csv_path), fused=False))
+
+
+def _first_match(patterns, value):
+      # The per-row loop `PatternMatcher` replaces.
+      for label, (pattern, flags) in patterns.items():
+            if re.search(pattern, value, flags):
+                  return label
+      return None
+
+
+@pytest.mark.parametrize('key', ['account_name_patterns', 'rating_patterns'])
+def test_pattern_matcher_matches_search_loop(key):
+      patterns = ConfigParameters()[key]
+      frame = generate_accounts(3000, noise=0.3, seed=2)
+      values = frame['Header' if key == 'account_name_patterns' else 'Rating'].dropna()
+      expected = [_first_match(patterns, value) for value in values]
+      matcher = PatternMatcher(patterns)
+      assert matcher.label(values).tolist() == expected
+      labels, n_unique = map_unique(values, matcher.categorize)
+      assert n_unique == values.nunique()
+      assert labels.astype(object).where(labels.notna(), None).tolist() == expected
+
+
+def test_pattern_matcher_keeps_each_patterns_flags():
+      patterns = {'ascii_word': (r'^\w+$', re.ASCII), 'upper': (r'^CAF', 0), 'any_case': (r'caf', re.I)}
+      values = pd.Series(['café', 'CAFÉ', 'cafe', 'Café', 'thé'])
+      labels = PatternMatcher(patterns).label(values).tolist()
+      assert labels == [_first_match(patterns, value) for value in values]
+      # Without its ASCII flag, \w would match 'é' and 'café' would be an 'ascii_word'.
+      assert labels[0] == 'any_case'
+
+
+@pytest.mark.parametrize('pattern, flags', [(r'(a)\1', 0), (r'(?P<x>a)(?P=x)', 0), (r'(a)?(?(1)b|c)', 0), (r'a', re.DEBUG)])
+def test_pattern_matcher_rejects_patterns_it_cannot_combine(pattern, flags):
+      with pytest.raises(ValueError):
+            PatternMatcher({'other': (r'b', 0), 'bad': (pattern, flags)})
+
+
+def test_orders_done_matches_legacy_loop():
+      order_patterns = ConfigParameters()['order_patterns']
+      descriptions = generate_accounts(3000, noise=0.3, seed=3)['Header'].dropna().reset_index(drop=True)
+      expected = legacy_get_orders_done(pd.DataFrame({'description': descriptions}), order_patterns)['orders_done']
+      orders_done = extract_orders_done(descriptions, order_patterns)
+      assert orders_done.dtype == 'Int64'
+      pd.testing.assert_series_equal(orders_done.astype('float64'), expected, check_names=False)
+
+
+def _legacy_raw_rating(rating_patterns, text):
+      # The first-match loop of the original `create_col_account_rating`.
+      for key, (pattern, flags) in rating_patterns.items():
+            match = re.search(pattern, text, flags=flags)
+            if match:
+                  if key == 'new_unranked':
+                        return 10.0
+                  if key == 'fraction':
+                        return float(match.group(1)) if float(match.group(3)) != 0 else np.nan
+                  return float(match.group(1))
+      return np.nan
+
+
+def test_rating_extraction_matches_legacy_loop():
+      rating_patterns = ConfigParameters()['rating_patterns']
+      ratings = generate_accounts(3000, noise=0.3, seed=4)['Rating'].dropna().reset_index(drop=True)
+      stripped = ratings.map(lambda x: x.split(':')[1].strip() if ':' in x and len(x.split(':')) > 1 else x.strip())
+      expected = np.array([_legacy_raw_rating(rating_patterns, text) for text in stripped])
+      raw = extract_ratings(stripped, PatternMatcher(rating_patterns))
+      np.testing.assert_array_equal(raw.to_numpy(), expected)
+
+
+def test_rescale_ratings_maps_onto_zero_to_five():
+      # <= 5 kept, <= 10 halved, otherwise a percentage; anything still above 5, or NaN, is capped.
+      np.testing.assert_allclose(rescale_ratings([4.5, 8.0, 95.0, 150.0, np.nan]), [4.5, 4.0, 4.75, 4.9, 4.9])
+
+
+def test_parse_prices_converts_each_currency():
+      prices = pd.Series(['KES 50,000', 'usd 20.5', '1,200', 'EUR 10', 'ask', np.nan])
+      currencies, amounts = parse_prices(prices, ConfigParameters()['price_pattern'], {'KES': 1.0, 'USD': 130.0}, 'KES')
+      assert currencies.astype(object).where(currencies.notna(), None).tolist() == ['KES', 'USD', 'KES', 'OTHER', None, None]
+      assert list(currencies.cat.categories) == ['KES', 'USD', 'OTHER']
+      # EUR has no rate; 'ask' and the missing price cannot be parsed.
+      np.testing.assert_allclose(amounts, [50_000, 2665, 1200, np.nan, np.nan, np.nan])
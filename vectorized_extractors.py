@@ -0,0 +1,497 @@
+"""
+Vectorized Extractors Module.
+This module holds the column-level building blocks used by `RawDataProcessor` to turn the
+raw scraped text columns into typed columns without walking the DataFrame row by row.
+
+Classes:
+- PatternMatcher: Compiles an ordered dictionary of `(pattern, flags)` entries into a single
+      regular expression that labels a whole column with first-match-wins semantics, either as
+      plain labels or as a Categorical.
+- FusedRowExtractor: Extracts every text-derived column from the raw fields in a single traversal.
+
+Functions:
+- map_unique: Runs an extractor on the distinct values of a column and broadcasts the result back.
+- extract_orders_done: Parses completed-order counts from a description column into a nullable
+      integer column.
+- extract_ratings: Classifies rating strings by kind and pulls out their raw numeric value.
+- rescale_ratings: Maps raw ratings onto the 0-5 scale with NumPy arithmetic.
+- currency_dtype: Builds the fixed categories of the currency column from the configured rates.
+- categorize_currencies: Casts currency codes to those categories, bucketing codes without a rate.
+- parse_prices: Splits price strings into a currency code and an amount converted to one currency.
+"""
+import re
+import numpy as np
+import pandas as pd
+
+try:
+      from re import _parser as _regex_parser
+except ImportError:  # Python < 3.11
+      import sre_parse as _regex_parser
+
+# The flags that can be scoped to one branch of a combined expression, with their inline letters.
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'),
+                 (re.ASCII, 'a'), (re.UNICODE, 'u'))
+_SCOPABLE_FLAGS = sum(flag for flag, _ in _INLINE_FLAGS)
+
+
+def _refers_to_groups(node):
+      """True if a parsed pattern contains a backreference or a group-conditional."""
+      if isinstance(node, _regex_parser.SubPattern):
+            node = node.data
+      if isinstance(node, (list, tuple)):
+            if len(node) == 2 and str(node[0]).startswith('GROUPREF'):
+                  return True
+            return any(_refers_to_groups(child) for child in node)
+      return False
+
+
+def _scope_flags(pattern, flags):
+      """
+      Wrap a pattern in a non-capturing group carrying its own inline flags.
+
+      Args:
+            pattern (str): The regular expression.
+            flags (int): The `re` flags the pattern was written for.
+
+      Returns:
+            str: The pattern scoped so it can be combined with patterns using other flags.
+
+      Raises:
+            ValueError: If the pattern uses a flag that cannot be set inline (e.g. `re.LOCALE`), or
+                  refers to its own groups (`\\1`, `(?P=name)`, `(?(1)...)`), whose numbers change
+                  once the pattern is combined with others.
+      """
+      unsupported = flags & ~_SCOPABLE_FLAGS
+      if unsupported:
+            raise ValueError(f"Pattern {pattern!r} uses flags {re.RegexFlag(unsupported)!r}, which cannot be "
+                             f"scoped to one branch of a combined expression.")
+      if _refers_to_groups(_regex_parser.parse(pattern, flags)):
+            raise ValueError(f"Pattern {pattern!r} refers to its own groups, which are renumbered when "
+                             f"patterns are combined.")
+      letters = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+      return f'(?{letters}:{pattern})' if letters else f'(?:{pattern})'
+
+
+class PatternMatcher:
+      """
+      Label strings with the key of the first pattern (in dictionary order) found anywhere in them.
+
+      Every pattern becomes one branch of a single compiled expression anchored at the start of
+      the string. Each branch is a lookahead that searches the whole string for its pattern and is
+      followed by an empty marker group, so the regex engine tries the patterns in their original
+      order and the marker of the first successful branch identifies the label. One `match` call
+      per string therefore replaces the per-row loop over `re.search` calls. Each pattern keeps its
+      own flags through inline flag groups; patterns with flags that cannot be set inline, or with
+      backreferences, are rejected.
+
+      Attributes:
+            labels (list): The pattern keys, in priority order.
+            patterns (dict): The original mapping of label -> (pattern, flags).
+            regex (re.Pattern): The combined, compiled expression.
+      """
+
+      def __init__(self, patterns):
+            """
+            Args:
+                  patterns (dict): Mapping of label -> (pattern, flags), e.g. `account_name_patterns`.
+
+            Raises:
+                  ValueError: If a pattern cannot be combined with the others (see `_scope_flags`).
+            """
+            self.labels = list(patterns)
+            self.patterns = dict(patterns)
+            branches = [
+                  rf'(?=[\s\S]*?{_scope_flags(pattern, flags)})(?P<_m{i}>)'
+                  for i, (pattern, flags) in enumerate(patterns.values())
+            ]
+            self.regex = re.compile('^(?:' + '|'.join(branches) + ')')
+            # The marker group closes last in its branch, so `lastindex` points straight at it.
+            self._code_lookup = np.full(self.regex.groups + 1, -1, dtype=np.intp)
+            for i in range(len(self.labels)):
+                  self._code_lookup[self.regex.groupindex[f'_m{i}']] = i
+
+      def code(self, value):
+            """
+            Find the index of the first matching pattern for a single value.
+
+            Args:
+                  value: The string to label. Non-string values never match.
+
+            Returns:
+                  int: Index into `self.labels`, -1 where no pattern matched.
+            """
+            m = self.regex.match(value) if isinstance(value, str) else None
+            return int(self._code_lookup[m.lastindex]) if m else -1
+
+      def match_codes(self, values):
+            """
+            Find the index of the first matching pattern for every value.
+
+            Args:
+                  values (pd.Series or array-like): Strings to label. Non-string values never match.
+
+            Returns:
+                  np.ndarray: Integer codes into `self.labels`, -1 where no pattern matched.
+            """
+            values = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values, dtype=object)
+            match, lookup = self.regex.match, self._code_lookup
+            return np.fromiter(
+                  (lookup[m.lastindex] if isinstance(value, str) and (m := match(value)) else -1 for value in values),
+                  dtype=np.intp,
+                  count=len(values),
+            )
+
+      def label(self, series, default=None):
+            """
+            Label a column with the key of its first matching pattern.
+
+            Args:
+                  series (pd.Series): The column to label.
+                  default: Value used where no pattern matched (default is None).
+
+            Returns:
+                  pd.Series: Object column of labels aligned to `series.index`.
+            """
+            labels = np.array(self.labels + [default], dtype=object)
+            return pd.Series(labels[self.match_codes(series)], index=series.index, name=series.name)
+
+      def categorize(self, series):
+            """
+            Label a column as a pandas Categorical whose categories are the pattern keys.
+
+            Args:
+                  series (pd.Series): The column to label.
+
+            Returns:
+                  pd.Series: Categorical column aligned to `series.index`, NaN where no pattern matched.
+            """
+            categories = pd.CategoricalDtype(self.labels)
+            codes = self.match_codes(series)
+            return pd.Series(pd.Categorical.from_codes(codes, dtype=categories), index=series.index, name=series.name)
+
+
+def map_unique(series, func, factorized=None):
+      """
+      Apply a column-level function to the distinct values of a column and broadcast the result back.
+
+      The scraped columns are highly repetitive, so factorizing them first means every regex runs once
+      per distinct string rather than once per row. Results are broadcast through the factorization
+      codes; missing input values give missing results.
+
+      Args:
+            series (pd.Series): The column to process.
+            func (callable): Takes a Series of distinct values and returns a Series, an array or a tuple
+                  of those, aligned to its input.
+            factorized (tuple, optional): (codes, uniques) of `series` from an earlier `pd.factorize`,
+                  to avoid factorizing the column again (default is None).
+
+      Returns:
+            tuple: (result, n_unique) where result mirrors the return value of `func` (each part
+                  broadcast to `series.index`) and n_unique is the number of distinct values processed.
+      """
+      codes, uniques = pd.factorize(series) if factorized is None else factorized
+      result = func(pd.Series(uniques, name=series.name))
+
+      def broadcast(part):
+            name = part.name if isinstance(part, pd.Series) else series.name
+            if isinstance(part, pd.Series):
+                  part = part.array if pd.api.types.is_extension_array_dtype(part) else part.to_numpy()
+            return pd.Series(pd.api.extensions.take(part, codes, allow_fill=True), index=series.index, name=name)
+
+      if isinstance(result, tuple):
+            return tuple(broadcast(part) for part in result), len(uniques)
+      return broadcast(result), len(uniques)
+
+
+_ORDER_COUNT_PATTERN = re.compile(r'(\d+)\s*(k)?', re.I)
+# Interpretation rules shared by the column extractors and their scalar counterparts in
+# `FusedRowExtractor`, so both paths change together.
+_K_SUFFIX_MULTIPLIER = 100  # "2k" -> 200, as in the original row loop
+_UNRANKED_RATING = 10.0  # raw rating of 'new_unranked' accounts, rescaled to 5.0
+_CAPTURED_RATING_KINDS = ('percentage', 'fraction', 'stand_alone')
+
+
+def extract_orders_done(descriptions, order_patterns):
+      """
+      Extract completed-order counts from a whole description column at once.
+
+      The patterns are tried in dictionary order and the first one found in a description wins,
+      as in the original row loop. A match of the 'zero_orders' pattern gives 0. Any other pattern
+      must capture the count in its first group: a trailing '+' is ignored and a 'k'/'K' suffix
+      appends two zeros ("2k" -> 200).
+
+      Args:
+            descriptions (pd.Series): The raw description strings.
+            order_patterns (dict): Mapping of key -> (pattern, flags), e.g. `order_patterns`.
+
+      Returns:
+            pd.Series: 'Int64' column of order counts, <NA> where no pattern matched.
+      """
+      counts = np.zeros(len(descriptions), dtype=np.int64)
+      unresolved = np.ones(len(descriptions), dtype=bool)
+      for key, (pattern, flags) in order_patterns.items():
+            # Only rows no earlier pattern has claimed need to be searched again.
+            positions = np.flatnonzero(unresolved)
+            pending = descriptions.iloc[positions]
+            if key == 'zero_orders':
+                  hit = pending.str.contains(pattern, flags=flags, regex=True, na=False).to_numpy(dtype=bool)
+                  unresolved[positions[hit]] = False
+                  continue
+            captured = pending.str.extract(pattern, flags=flags, expand=True)[0]
+            hit = captured.notna().to_numpy()
+            parts = captured[hit].str.extract(_ORDER_COUNT_PATTERN, expand=True)
+            counts[positions[hit]] = parts[0].astype(np.int64).to_numpy() * np.where(parts[1].notna(), _K_SUFFIX_MULTIPLIER, 1)
+            unresolved[positions[hit]] = False
+      return pd.Series(pd.arrays.IntegerArray(counts, unresolved), index=descriptions.index, name='orders_done')
+
+
+def extract_ratings(ratings, rating_matcher):
+      """
+      Extract the raw numeric rating from a whole rating column at once.
+
+      Each value is classified by the first of the matcher's patterns it contains. 'new_unranked'
+      ratings become 10.0. For 'percentage' and 'stand_alone' ratings the first group is used. For
+      'fraction' ratings the numerator (first group) is used, unless the denominator (third group)
+      is zero. Each kind's groups are extracted only from the rows of that kind, so the column is
+      scanned about once.
+
+      Args:
+            ratings (pd.Series): Rating strings with any "Rating:" label already removed.
+            rating_matcher (PatternMatcher): Matcher built from `rating_patterns`.
+
+      Returns:
+            pd.Series: float64 column of raw ratings, NaN where nothing could be extracted.
+      """
+      codes = rating_matcher.match_codes(ratings)
+      values = np.full(len(ratings), np.nan)
+      for code, kind in enumerate(rating_matcher.labels):
+            rows = np.flatnonzero(codes == code)
+            if kind == 'new_unranked':
+                  values[rows] = _UNRANKED_RATING
+                  continue
+            if kind not in _CAPTURED_RATING_KINDS or not len(rows):
+                  continue
+            pattern, flags = rating_matcher.patterns[kind]
+            groups = ratings.iloc[rows].str.extract(pattern, flags=flags, expand=True)
+            extracted = groups[0].astype(float).to_numpy()
+            if kind == 'fraction':
+                  extracted = np.where(groups[2].astype(float).to_numpy() != 0, extracted, np.nan)
+            values[rows] = extracted
+      return pd.Series(values, index=ratings.index, name='account_rating')
+
+
+def rescale_ratings(values, cap=4.9):
+      """
+      Map raw ratings onto a 0-5 scale.
+
+      Values up to 5 are kept, values up to 10 are halved and larger values are read as
+      percentages. Anything not at or below 5 afterwards is replaced by `cap`; this includes NaN,
+      so ratings that could not be extracted (e.g. "Top") also end up at `cap`.
+
+      Args:
+            values (pd.Series or np.ndarray): Raw ratings.
+            cap (float): Replacement for values that are not at or below 5 (default is 4.9).
+
+      Returns:
+            np.ndarray: The rescaled ratings.
+      """
+      values = np.asarray(values, dtype=float)
+      scaled = np.where(values <= 5.0, values, np.where(values <= 10.0, (values / 10) * 5, (values / 100) * 5))
+      return np.where(scaled <= 5.0, scaled, cap)
+
+
+OTHER_CURRENCY = 'OTHER'
+
+
+def currency_dtype(currency_rates, base_currency):
+      """
+      Build the categories of the currency column: every currency with a rate, the base currency and
+      an `OTHER_CURRENCY` bucket for codes without a rate.
+
+      The categories depend only on the configuration, so every chunk or shard of a file gets the same
+      dtype and their concatenation stays categorical.
+
+      Args:
+            currency_rates (dict): Units of `base_currency` per unit of each currency code.
+            base_currency (str): The currency every amount is converted to.
+
+      Returns:
+            pd.CategoricalDtype: The currency categories.
+      """
+      codes = list(currency_rates)
+      if base_currency not in codes:
+            codes.append(base_currency)
+      return pd.CategoricalDtype(codes + [OTHER_CURRENCY])
+
+
+def categorize_currencies(codes, dtype):
+      """
+      Cast currency codes to `dtype`, putting codes that are not among its categories in `OTHER_CURRENCY`.
+
+      Args:
+            codes (pd.Series or array-like): Currency codes, NaN where there is none.
+            dtype (pd.CategoricalDtype): Categories built by `currency_dtype`.
+
+      Returns:
+            pd.Series: The categorical currency codes.
+      """
+      codes = codes if isinstance(codes, pd.Series) else pd.Series(codes, dtype=object)
+      return codes.where(codes.isin(dtype.categories) | codes.isna(), OTHER_CURRENCY).astype(dtype)
+
+
+def parse_prices(prices, price_pattern, currency_rates, base_currency, dtype=None):
+      """
+      Parse price strings such as "KES 50,000" into a currency code and a numeric amount in one pass.
+
+      The pattern must define the named groups 'currency' and 'amount'. Prices without a currency are
+      taken to be in `base_currency`. Amounts are converted by looking up each currency's rate once per
+      category and broadcasting it through the category codes.
+
+      Args:
+            prices (pd.Series): The raw price strings.
+            price_pattern (tuple): (pattern, flags) with 'currency' and 'amount' groups.
+            currency_rates (dict): Units of `base_currency` per unit of each currency code.
+            base_currency (str): The currency every amount is converted to.
+            dtype (pd.CategoricalDtype, optional): Categories of the currency column (default is None,
+                  built with `currency_dtype`).
+
+      Returns:
+            tuple: (pd.Series, pd.Series) the categorical currency codes (upper-cased, `OTHER_CURRENCY`
+                  for codes without a rate) and the float64 amounts in `base_currency`. Amounts are NaN
+                  where the price could not be parsed or its currency has no rate.
+      """
+      dtype = dtype or currency_dtype(currency_rates, base_currency)
+      pattern, flags = price_pattern
+      parts = prices.str.extract(pattern, flags=flags, expand=True)
+      amounts = pd.to_numeric(parts['amount'].str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype=float)
+      currencies = parts['currency'].str.upper().mask(parts['currency'].isna() & parts['amount'].notna(), base_currency)
+      currencies = categorize_currencies(currencies, dtype)
+      rates = np.array([currency_rates.get(code, np.nan) for code in dtype.categories] + [np.nan], dtype=float)
+      converted = amounts * rates[currencies.cat.codes.to_numpy()]
+      return (currencies.rename('price_currency'),
+              pd.Series(converted, index=prices.index, name='account_price'))
+
+
+class FusedRowExtractor:
+      """
+      Extract every text-derived column from the raw description, condition, rating and price fields
+      in a single traversal of the rows.
+
+      Each row's four fields are read once and every extractor runs on them in the same pass, with the
+      results written into preallocated NumPy arrays. The extractors are the scalar counterparts of
+      `PatternMatcher.match_codes`, `extract_orders_done`, `extract_ratings` and `parse_prices`, and
+      give the same results: they are built from the same matchers and patterns and share the
+      module's interpretation constants, and tests/test_vectorized_extractors.py checks that fused and
+      staged processing agree. Results are memoized per distinct field value, so repeated strings are
+      only parsed once.
+
+      Attributes:
+            account_name_matcher (PatternMatcher): Matcher built from `account_name_patterns`.
+            rating_matcher (PatternMatcher): Matcher built from `rating_patterns`.
+      """
+
+      def __init__(self, account_name_matcher, order_patterns, condition_pattern, rating_matcher, price_pattern, base_currency):
+            """
+            Args:
+                  account_name_matcher (PatternMatcher): Matcher built from `account_name_patterns`.
+                  order_patterns (dict): Mapping of key -> (pattern, flags) for order counts.
+                  condition_pattern (tuple): (pattern, flags) identifying new accounts.
+                  rating_matcher (PatternMatcher): Matcher built from `rating_patterns`.
+                  price_pattern (tuple): (pattern, flags) with 'currency' and 'amount' groups.
+                  base_currency (str): Currency assumed for prices without one.
+            """
+            self.account_name_matcher = account_name_matcher
+            self.rating_matcher = rating_matcher
+            self.base_currency = base_currency
+            self._order_regexes = [(key, re.compile(pattern, flags)) for key, (pattern, flags) in order_patterns.items()]
+            self._condition_regex = re.compile(*condition_pattern)
+            self._rating_regexes = {kind: re.compile(pattern, flags) for kind, (pattern, flags) in rating_matcher.patterns.items()}
+            self._price_regex = re.compile(*price_pattern)
+
+      def _description(self, description):
+            """Return (account name code, order count or None) for one description."""
+            name_code = self.account_name_matcher.code(description)
+            for key, regex in self._order_regexes:
+                  match = regex.search(description)
+                  if not match:
+                        continue
+                  if key == 'zero_orders':
+                        return name_code, 0
+                  if match.group(1) is None:
+                        continue
+                  digits, suffix = _ORDER_COUNT_PATTERN.match(match.group(1)).groups()
+                  return name_code, int(digits) * (_K_SUFFIX_MULTIPLIER if suffix else 1)
+            return name_code, None
+
+      def _rating(self, rating):
+            """Return (stripped rating text, raw rating) for one rating string."""
+            parts = rating.split(':', 2)
+            stripped = (parts[1] if len(parts) > 1 else rating).strip()
+            code = self.rating_matcher.code(stripped)
+            kind = self.rating_matcher.labels[code] if code >= 0 else None
+            if kind == 'new_unranked':
+                  return stripped, _UNRANKED_RATING
+            if kind in _CAPTURED_RATING_KINDS and kind != 'fraction':
+                  return stripped, float(self._rating_regexes[kind].search(stripped).group(1))
+            if kind == 'fraction':
+                  match = self._rating_regexes[kind].search(stripped)
+                  return stripped, float(match.group(1)) if float(match.group(3)) != 0 else np.nan
+            return stripped, np.nan
+
+      def _price(self, price):
+            """Return (currency code or NaN, amount) for one price string."""
+            match = self._price_regex.search(price)
+            if not match or match.group('amount') is None:
+                  return np.nan, np.nan
+            currency = match.group('currency')
+            return (currency.upper() if currency is not None else self.base_currency,
+                    float(match.group('amount').replace(',', '')))
+
+      def extract(self, descriptions, conditions, ratings, prices):
+            """
+            Run every extractor over the rows in one pass.
+
+            Args:
+                  descriptions, conditions, ratings, prices (array-like): The raw string fields, row aligned.
+
+            Returns:
+                  dict: Row-aligned NumPy arrays 'name_codes' (int, -1 where no name matched),
+                        'orders_done' and 'orders_missing' (int64 values and their <NA> mask),
+                        'is_new' (bool), 'rating_text' (object), 'raw_rating' (float),
+                        'currencies' (object, NaN where unparsed) and 'amounts' (float).
+            """
+            n = len(descriptions)
+            columns = {
+                  'name_codes': np.empty(n, dtype=np.intp),
+                  'orders_done': np.zeros(n, dtype=np.int64),
+                  'orders_missing': np.zeros(n, dtype=bool),
+                  'is_new': np.empty(n, dtype=bool),
+                  'rating_text': np.empty(n, dtype=object),
+                  'raw_rating': np.empty(n, dtype=float),
+                  'currencies': np.empty(n, dtype=object),
+                  'amounts': np.empty(n, dtype=float),
+            }
+            seen_descriptions, seen_conditions, seen_ratings, seen_prices = {}, {}, {}, {}
+            condition_search = self._condition_regex.search
+            for i, (description, condition, rating, price) in enumerate(zip(descriptions, conditions, ratings, prices)):
+                  described = seen_descriptions.get(description)
+                  if described is None:
+                        described = seen_descriptions[description] = self._description(description)
+                  is_new = seen_conditions.get(condition)
+                  if is_new is None:
+                        is_new = seen_conditions[condition] = condition_search(condition) is not None
+                  rated = seen_ratings.get(rating)
+                  if rated is None:
+                        rated = seen_ratings[rating] = self._rating(rating)
+                  priced = seen_prices.get(price)
+                  if priced is None:
+                        priced = seen_prices[price] = self._price(price)
+                  columns['name_codes'][i], orders = described
+                  if orders is None:
+                        columns['orders_missing'][i] = True
+                  else:
+                        columns['orders_done'][i] = orders
+                  columns['is_new'][i] = is_new
+                  columns['rating_text'][i], columns['raw_rating'][i] = rated
+                  columns['currencies'][i], columns['amounts'][i] = priced
+            return columns